@@ -0,0 +1,44 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from zksync2.core.types import BlockDetails, BatchDetails
+from zksync2.module.module_builder import AsyncZkSyncBuilder, ZkSyncBuilder
+from .test_config import EnvURL, address_1
+
+
+class AsyncZkSyncWeb3Tests(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.env = EnvURL()
+        self.web3 = AsyncZkSyncBuilder.build(self.env.env.zksync_server)
+        self.sync_web3 = ZkSyncBuilder.build(self.env.env.zksync_server)
+
+    async def asyncTearDown(self) -> None:
+        await self.web3.provider.disconnect()
+
+    async def test_zks_l1_batch_number(self):
+        result = await self.web3.zksync.zks_l1_batch_number()
+        self.assertGreater(result, 0)
+
+    async def test_zks_get_l1_batch_details(self):
+        l1_batch_number = await self.web3.zksync.zks_l1_batch_number()
+        result = await self.web3.zksync.zks_get_l1_batch_details(l1_batch_number)
+        self.assertIsInstance(result, BatchDetails)
+        self.assertEqual(
+            result, self.sync_web3.zksync.zks_get_l1_batch_details(l1_batch_number)
+        )
+
+    async def test_concurrent_block_details(self):
+        block_number = await self.web3.zksync.block_number
+        numbers = range(max(block_number - 10, 1), block_number + 1)
+        results = await asyncio.gather(
+            *[self.web3.zksync.zks_get_block_details(n) for n in numbers]
+        )
+        self.assertTrue(all(isinstance(r, BlockDetails) for r in results))
+
+    async def test_zks_get_balance(self):
+        result = await self.web3.zksync.zks_get_balance(address_1)
+        self.assertGreater(result, 0)
+
+    async def test_zks_get_bridge_contracts(self):
+        result = await self.web3.zksync.zks_get_bridge_contracts()
+        self.assertEqual(result, self.sync_web3.zksync.zks_get_bridge_contracts())
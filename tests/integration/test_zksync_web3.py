@@ -781,3 +781,17 @@ class ZkSyncWeb3Tests(TestCase):
     def test_zks_get_fee_params(self):
         result = self.web3.zksync.zks_get_fee_params()
         self.assertIsNotNone(result)
+
+    def test_batch(self):
+        l1_batch_number = self.web3.zksync.zks_l1_batch_number()
+        with self.web3.zksync.batch() as batch:
+            batch.add(self.web3.zksync.zks_l1_batch_number())
+            batch.add(self.web3.zksync.zks_get_l1_batch_details(l1_batch_number))
+            batch.add(self.web3.zksync.zks_get_block_details(1))
+        batch_number, batch_details, block_details = batch.results
+        self.assertGreaterEqual(batch_number, l1_batch_number)
+        self.assertEqual(
+            batch_details,
+            self.web3.zksync.zks_get_l1_batch_details(l1_batch_number),
+        )
+        self.assertEqual(block_details, self.web3.zksync.zks_get_block_details(1))
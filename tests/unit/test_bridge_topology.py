@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+from web3.providers import BaseProvider
+
+from zksync2.core.cache import SqliteCache
+from zksync2.module.module_builder import ZkWeb3
+
+SHARED_L1 = "0x" + "a1" * 20
+SHARED_L2 = "0x" + "a2" * 20
+LEGACY_L1 = "0x" + "b1" * 20
+LEGACY_L2 = "0x" + "b2" * 20
+
+
+class BridgeProvider(BaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if method == "eth_chainId":
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x10e"}
+        if method == "zks_getProtocolVersion":
+            return {"jsonrpc": "2.0", "id": 1, "result": {"version_id": 24}}
+        if method == "zks_getBridgeContracts":
+            result = {
+                "l1Erc20DefaultBridge": LEGACY_L1,
+                "l2Erc20DefaultBridge": LEGACY_L2,
+                "l1SharedDefaultBridge": SHARED_L1,
+                "l2SharedDefaultBridge": SHARED_L2,
+                "l1WethBridge": "0x" + "00" * 20,
+                "l2WethBridge": "0x" + "00" * 20,
+            }
+            return {"jsonrpc": "2.0", "id": 1, "result": result}
+        # eth_call: the legacy bridge has no l1SharedBridge() and reverts
+        if params[0]["data"] == "0xb852ad36":
+            error = {"code": 3, "message": "execution reverted", "data": "0x"}
+            return {"jsonrpc": "2.0", "id": 1, "error": error}
+        return {"jsonrpc": "2.0", "id": 1, "result": "0x" + "00" * 12 + "b1" * 20}
+
+
+class BridgeTopologyTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = BridgeProvider()
+        self.web3 = ZkWeb3(self.provider)
+        self.web3.zksync.bridge_topology = SqliteCache(":memory:", table="bridges")
+
+    def test_shared_bridge_is_seeded(self):
+        self.assertFalse(self.web3.zksync.is_l2_bridge_legacy(SHARED_L2))
+        info = self.web3.zksync.l2_bridge_info(SHARED_L2)
+        self.assertEqual(info.l1_bridge.lower(), SHARED_L1)
+        self.assertNotIn("eth_call", self.provider.calls)
+
+    def test_legacy_bridge_is_probed_once(self):
+        self.assertTrue(self.web3.zksync.is_l2_bridge_legacy(LEGACY_L2))
+        info = self.web3.zksync.l2_bridge_info(LEGACY_L2)
+        self.assertTrue(info.is_legacy)
+        self.assertEqual(info.l1_bridge.lower(), LEGACY_L1)
+        self.assertEqual(self.provider.calls.count("eth_call"), 2)
@@ -0,0 +1,228 @@
+from unittest import TestCase
+
+from web3.providers import BaseProvider
+
+from zksync2.core.cache import (
+    ChainMetadataCache,
+    FeeEstimateCache,
+    LRUCache,
+    SqliteCache,
+)
+from zksync2.core.types import Fee, PaymasterParams
+from zksync2.module.middleware import ZkSyncCacheMiddleware
+from zksync2.module.request_types import EIP712Meta
+from zksync2.module.module_builder import ZkWeb3
+
+
+class StaticProvider(BaseProvider):
+    def __init__(self, finalized_block: int):
+        super().__init__()
+        self.finalized_block = finalized_block
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if method == "eth_chainId":
+            result = "0x10e"
+        elif method == "eth_getBlockByNumber":
+            result = {"number": hex(self.finalized_block), "l1BatchNumber": "0x1"}
+        else:
+            result = {
+                "number": params[0],
+                "status": "verified" if params[0] < 10 else "sealed",
+            }
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class MetadataProvider(BaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if method == "zks_getProtocolVersion":
+            result = {"version_id": 24}
+        else:
+            result = "0x" + "33" * 20
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class CacheBackendTests(TestCase):
+    def test_lru_cache_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_sqlite_cache(self):
+        cache = SqliteCache(":memory:")
+        cache.set("a", {"status": "verified", "number": 1})
+        self.assertEqual(cache.get("a"), {"status": "verified", "number": 1})
+        self.assertIsNone(cache.get("b"))
+        cache.delete("a")
+        self.assertEqual(len(cache), 0)
+        cache.close()
+
+    def test_chain_metadata_cleared_on_protocol_upgrade(self):
+        cache = ChainMetadataCache(ttl=0)
+        self.assertTrue(cache.needs_validation())
+        cache.validate({"version_id": 24})
+        cache.set("chain_id", 270)
+        cache.validate({"version_id": 24})
+        self.assertEqual(cache.get("chain_id"), 270)
+        cache.validate({"version_id": 25})
+        self.assertIsNone(cache.get("chain_id"))
+
+    def test_chain_metadata_properties(self):
+        provider = MetadataProvider()
+        zksync = ZkWeb3(provider).zksync
+        self.assertEqual(zksync.main_contract_address, "0x" + "33" * 20)
+        self.assertEqual(zksync.main_contract_address, "0x" + "33" * 20)
+        self.assertEqual(provider.calls, ["zks_getMainContract"])
+        zksync.main_contract_address = "0x" + "44" * 20
+        self.assertEqual(zksync.zks_main_contract(), "0x" + "44" * 20)
+        zksync.chain_metadata.clear()
+        self.assertEqual(zksync.main_contract_address, "0x" + "33" * 20)
+
+    def test_chain_metadata_entries_fetched_before_first_check_are_dropped(self):
+        provider = MetadataProvider()
+        zksync = ZkWeb3(provider).zksync
+        zksync.main_contract_address
+        zksync.chain_metadata.ttl = 0
+        zksync.main_contract_address
+        self.assertEqual(
+            provider.calls,
+            ["zks_getMainContract", "zks_getProtocolVersion", "zks_getMainContract"],
+        )
+
+
+def fee_params(l1_gas_price: int) -> dict:
+    config = {
+        "minimal_l2_gas_price": 25000000,
+        "compute_overhead_part": 0,
+        "pubdata_overhead_part": 1,
+        "batch_overhead_l1_gas": 800000,
+        "max_gas_per_batch": 200000000,
+        "max_pubdata_per_batch": 240000,
+    }
+    return {
+        "V2": {
+            "config": config,
+            "l1_gas_price": l1_gas_price,
+            "l1_pubdata_price": 17 * l1_gas_price,
+        }
+    }
+
+
+class FeeProvider(BaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.l1_gas_price = 1000
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if method == "zks_getFeeParams":
+            result = fee_params(self.l1_gas_price)
+        else:
+            result = {
+                "gas_limit": "0x100",
+                "max_fee_per_gas": "0x10",
+                "max_priority_fee_per_gas": "0x0",
+                "gas_per_pubdata_limit": "0xc350",
+            }
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class FeeEstimateCacheTests(TestCase):
+    def transfer(self, to: str, amount: int, paymaster=None) -> dict:
+        token = "0x" + "11" * 20
+        data = "0xa9059cbb" + to[2:].rjust(64, "0") + hex(amount)[2:].rjust(64, "0")
+        meta = EIP712Meta(paymaster_params=paymaster)
+        return {"from": "0x" + "ee" * 20, "to": token, "data": data, "eip712Meta": meta}
+
+    def test_key_ignores_recipient_and_amount(self):
+        key = FeeEstimateCache.key
+        self.assertEqual(
+            key(self.transfer("0x" + "01" * 20, 1)),
+            key(self.transfer("0x" + "02" * 20, 5)),
+        )
+        paymaster = PaymasterParams("0x" + "99" * 20, b"")
+        self.assertNotEqual(
+            key(self.transfer("0x" + "01" * 20, 1)),
+            key(self.transfer("0x" + "01" * 20, 1, paymaster)),
+        )
+        # the recipient of a value transfer may run code
+        self.assertNotEqual(
+            key({"to": "0x" + "01" * 20, "data": "0x"}),
+            key({"to": "0x" + "02" * 20, "data": "0x"}),
+        )
+        self.assertEqual(
+            key({"to": "0x" + "01" * 20, "data": "0x", "value": 1}),
+            key({"to": "0x" + "01" * 20, "data": "0x", "value": 2}),
+        )
+
+    def test_gas_limit_multiplier_and_ttl(self):
+        cache = FeeEstimateCache(ttl=0, gas_limit_multiplier=1.5)
+        fee = cache.set("a", Fee(gas_limit=1000, max_fee_per_gas=10))
+        self.assertEqual(fee.gas_limit, 1500)
+        self.assertIsNone(cache.get("a"))
+
+    def test_l1_gas_price_move_drops_estimations(self):
+        cache = FeeEstimateCache(l1_gas_price_threshold=0.1)
+        cache.validate(1000)
+        cache.set("a", Fee(gas_limit=1000))
+        cache.validate(1050)
+        self.assertIsNotNone(cache.get("a"))
+        cache.validate(1200)
+        self.assertIsNone(cache.get("a"))
+
+    def test_zks_estimate_fee_reuses_estimations(self):
+        provider = FeeProvider()
+        zksync = ZkWeb3(provider).zksync
+        zksync.fee_estimates = FeeEstimateCache(check_interval=0)
+        first = zksync.zks_estimate_fee(self.transfer("0x" + "01" * 20, 1))
+        second = zksync.zks_estimate_fee(self.transfer("0x" + "02" * 20, 2))
+        self.assertEqual(first, second)
+        self.assertEqual(first.gas_limit, 0x100 * 12 // 10 + 1)
+        self.assertEqual(provider.calls.count("zks_estimateFee"), 1)
+        provider.l1_gas_price = 2000
+        zksync.zks_estimate_fee(self.transfer("0x" + "03" * 20, 3))
+        self.assertEqual(provider.calls.count("zks_estimateFee"), 2)
+
+
+class CacheMiddlewareTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = StaticProvider(finalized_block=20)
+        self.web3 = ZkWeb3(self.provider)
+        self.cache = LRUCache()
+        self.web3.middleware_onion.inject(
+            ZkSyncCacheMiddleware.build(self.cache), "zksync_cache", layer=0
+        )
+
+    def block_details_calls(self):
+        return self.provider.calls.count("zks_getBlockDetails")
+
+    def test_verified_block_is_cached(self):
+        self.web3.manager.request_blocking("zks_getBlockDetails", [1])
+        self.web3.manager.request_blocking("zks_getBlockDetails", [1])
+        self.assertEqual(self.block_details_calls(), 1)
+        self.assertNotIn("eth_getBlockByNumber", self.provider.calls)
+
+    def test_finalized_block_is_cached(self):
+        self.web3.manager.request_blocking("zks_getBlockDetails", [15])
+        self.web3.manager.request_blocking("zks_getBlockDetails", [15])
+        self.assertEqual(self.block_details_calls(), 1)
+
+    def test_pending_block_is_not_cached(self):
+        self.web3.manager.request_blocking("zks_getBlockDetails", [30])
+        self.web3.manager.request_blocking("zks_getBlockDetails", [30])
+        self.assertEqual(self.block_details_calls(), 2)
+        self.assertEqual(self.provider.calls.count("eth_getBlockByNumber"), 1)
+        self.assertEqual(len(self.cache), 0)
@@ -1,8 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from eth_typing import HexStr
 from eth_utils import add_0x_prefix
 
+from zksync2.module.request_types import EIP712Meta
 from zksync2.signer.eth_signer import PrivateKeyEthSigner
+from zksync2.transaction.transaction712 import Transaction712
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 from zksync2.eip712 import make_domain, EIP712Struct, String, Address
@@ -65,3 +68,75 @@ class EthSignerTests(TestCase):
             self._TEST_TYPED_EXPECTED_SIGNATURE, self.mail, self.domain
         )
         self.assertTrue(ret)
+
+    def test_sign_typed_data_default_domain(self):
+        domain = PrivateKeyEthSigner.get_default_domain(1)
+        sm = self.signer.sign_typed_data(self.mail)
+        self.assertEqual(sm, self.signer.sign_typed_data(self.mail, domain))
+        self.assertEqual(
+            self.signer.domain_separator,
+            PrivateKeyEthSigner.get_default_domain_separator(1),
+        )
+
+    def test_sign_many(self):
+        transactions = [
+            Transaction712(
+                chain_id=270,
+                nonce=nonce,
+                gas_limit=100000,
+                to="0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC",
+                value=nonce,
+                data=b"",
+                maxPriorityFeePerGas=0,
+                maxFeePerGas=250000000,
+                from_=self.account.address,
+                meta=EIP712Meta(),
+            )
+            for nonce in range(4)
+        ]
+        signer = PrivateKeyEthSigner(self.account, 270)
+        expected = [
+            tx.encode(signer.sign_typed_data(tx.to_eip712_struct()))
+            for tx in transactions
+        ]
+        self.assertEqual(expected, signer.sign_many(transactions))
+        self.assertEqual(
+            expected, signer.sign_many(transactions, max_workers=2, chunk_size=2)
+        )
+        pool = signer._pool
+        self.assertEqual(
+            expected, signer.sign_many(transactions, max_workers=2, chunk_size=3)
+        )
+        self.assertIs(pool, signer._pool)
+        signer.close()
+        self.assertIsNone(signer._pool)
+
+    def test_sign_many_from_threads_with_changing_pool_sizes(self):
+        transactions = [
+            Transaction712(
+                chain_id=270,
+                nonce=nonce,
+                gas_limit=100000,
+                to="0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC",
+                value=nonce,
+                data=b"",
+                maxPriorityFeePerGas=0,
+                maxFeePerGas=250000000,
+                from_=self.account.address,
+                meta=EIP712Meta(),
+            )
+            for nonce in range(6)
+        ]
+        signer = PrivateKeyEthSigner(self.account, 270)
+        expected = signer.sign_many(transactions)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(
+                executor.map(
+                    lambda workers: signer.sign_many(
+                        transactions, max_workers=workers, chunk_size=1
+                    ),
+                    [1, 2, 1, 2, 3, 1],
+                )
+            )
+        signer.close()
+        self.assertTrue(all(result == expected for result in results))
@@ -0,0 +1,100 @@
+from unittest import TestCase
+
+from web3.providers import BaseProvider
+
+from zksync2.core.types import Config, FeeParams, V2
+from zksync2.module.fee_model import LocalFeeModel, derive_fee
+from zksync2.module.module_builder import ZkWeb3
+from zksync2.module.zksync_module import to_fee_params
+
+CONFIG = Config(
+    minimal_l2_gas_price=25_000_000,
+    compute_overhead_part=0,
+    pubdata_overhead_part=1,
+    batch_overhead_l1_gas=800_000,
+    max_gas_per_batch=200_000_000,
+    max_pubdata_per_batch=240_000,
+)
+
+
+class FeeParamsProvider(BaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def make_request(self, method, params):
+        self.calls += 1
+        result = {
+            "V2": {
+                "config": CONFIG.__dict__,
+                "l1_gas_price": 10**10,
+                "l1_pubdata_price": 17 * 10**10,
+                "conversion_ratio": {"numerator": 1, "denominator": 1},
+            }
+        }
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class DeriveFeeTests(TestCase):
+    def test_base_fee_from_l2_gas_price(self):
+        # pubdata price: 17e10 + ceil(1e10 * 800_000 / 240_000) = 203_333_333_334
+        fee_params = FeeParams(V2(CONFIG, 10**10, 17 * 10**10))
+        self.assertEqual(derive_fee(fee_params), (25_000_000, 8134))
+
+    def test_base_fee_from_pubdata_price(self):
+        # ceil(10_033_333_333_334 / 50_000) exceeds the L2 gas price
+        fee_params = FeeParams(V2(CONFIG, 10**10, 10**13))
+        self.assertEqual(derive_fee(fee_params), (200_666_667, 50000))
+
+    def test_prices_converted_to_base_token(self):
+        # every price doubles: L2 gas price 50_000_000, pubdata price 406_666_666_667
+        fee_params = FeeParams(V2(CONFIG, 10**10, 17 * 10**10, 2, 1))
+        self.assertEqual(derive_fee(fee_params), (50_000_000, 8134))
+
+    def test_l2_gas_price_converted_to_base_token(self):
+        # a base token worth 4 ETH: L2 gas price 6_250_000, pubdata price 50_833_333_334
+        fee_params = FeeParams(V2(CONFIG, 10**10, 17 * 10**10, 1, 4))
+        self.assertEqual(derive_fee(fee_params), (6_250_000, 8134))
+
+
+class FeeParamsTests(TestCase):
+    def test_rpc_method_returns_node_dict(self):
+        zksync = ZkWeb3(FeeParamsProvider()).zksync
+        self.assertEqual(zksync.zks_get_fee_params()["V2"]["l1_gas_price"], 10**10)
+        fee_params = zksync.get_fee_params()
+        self.assertEqual(fee_params.V2.config, CONFIG)
+        self.assertEqual(fee_params.V2.l1_pubdata_price, 17 * 10**10)
+
+    def test_v1_params_are_expressed_as_v2(self):
+        fee_params = to_fee_params(
+            {
+                "V1": {
+                    "config": {"minimal_l2_gas_price": 25_000_000},
+                    "l1_gas_price": 10**10,
+                }
+            }
+        )
+        self.assertEqual(fee_params.V2.l1_pubdata_price, 17 * 10**10)
+        self.assertEqual(fee_params.V2.config.batch_overhead_l1_gas, 0)
+        # no overhead, the pubdata price alone sets the gas per pubdata
+        self.assertEqual(derive_fee(fee_params), (25_000_000, 6800))
+
+    def test_unknown_version_is_rejected(self):
+        with self.assertRaises(ValueError):
+            to_fee_params({"V3": {}})
+
+
+class LocalFeeModelTests(TestCase):
+    def test_fee_params_are_refreshed_periodically(self):
+        provider = FeeParamsProvider()
+        zksync = ZkWeb3(provider).zksync
+        model = LocalFeeModel(zksync, refresh_interval=60, scale_factor=1.5)
+        fee = model.fee(gas_limit=300_000)
+        self.assertEqual(fee.gas_limit, 300_000)
+        self.assertEqual(fee.max_fee_per_gas, 25_000_000)
+        self.assertEqual(fee.gas_per_pubdata_limit, 12200)
+        self.assertEqual(model.max_fee_per_gas, 25_000_000)
+        self.assertEqual(provider.calls, 1)
+        model.refresh_interval = 0
+        model.fee()
+        self.assertEqual(provider.calls, 2)
@@ -0,0 +1,319 @@
+from unittest import TestCase
+
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_account.typed_transactions import TypedTransaction
+from eth_utils import event_signature_to_log_topic, function_signature_to_4byte_selector
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.providers import JSONBaseProvider
+
+from zksync2.account.wallet_l1 import WalletL1
+from zksync2.core.utils import MULTICALL3_ADDRESS
+from zksync2.module.module_builder import ZkWeb3
+
+PRIVATE_KEY = "0x" + "7a" * 32
+SHARED_L1 = "0x" + "a1" * 20
+SHARED_L2 = "0x" + "a2" * 20
+LEGACY_L1 = "0x" + "b1" * 20
+LEGACY_L2 = "0x" + "b2" * 20
+BASE_TOKEN_L2 = "0x000000000000000000000000000000000000800a"
+L1_MESSENGER = "0x0000000000000000000000000000000000008008"
+
+IS_FINALIZED = function_signature_to_4byte_selector(
+    "isWithdrawalFinalized(uint256,uint256,uint256)"
+)
+FINALIZE = function_signature_to_4byte_selector(
+    "finalizeWithdrawal(uint256,uint256,uint256,uint16,bytes,bytes32[])"
+)
+AGGREGATE3 = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+
+
+def _response(request_id, method, result=None, message=None):
+    if message is not None:
+        error = {"code": -32000, "message": message}
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+class L2Provider(JSONBaseProvider):
+    """Withdrawal ``i`` is the transaction hash ``i`` sent by the L2 bridge ``senders[i]``."""
+
+    def __init__(self, senders):
+        super().__init__()
+        self.senders = senders
+        self.requests = []
+        self.batches = []
+        self.unknown = set()
+        self.without_log = set()
+        self.unproven = set()
+
+    def result(self, method, params):
+        if method == "eth_chainId":
+            return "0x10e"
+        if method == "zks_L1ChainId":
+            return "0x9"
+        if method == "zks_getProtocolVersion":
+            return {"version_id": 24}
+        if method == "zks_getMainContract":
+            return "0x" + "33" * 20
+        if method == "zks_getBridgeContracts":
+            return {
+                "l1Erc20DefaultBridge": LEGACY_L1,
+                "l2Erc20DefaultBridge": LEGACY_L2,
+                "l1SharedDefaultBridge": SHARED_L1,
+                "l2SharedDefaultBridge": SHARED_L2,
+                "l1WethBridge": "0x" + "00" * 20,
+                "l2WethBridge": "0x" + "00" * 20,
+            }
+        if method == "eth_getTransactionReceipt":
+            i = int(params[0], 16)
+            return None if i in self.unknown else self.receipt(i)
+        if method == "zks_getL2ToL1LogProof":
+            i = int(params[0], 16)
+            if i in self.unproven:
+                raise ValueError("proof not available yet")
+            return {
+                "id": 100 + i,
+                "proof": ["0x" + "ee" * 32],
+                "root": "0x" + "00" * 32,
+            }
+        if method == "eth_call":
+            # the legacy bridge has no l1SharedBridge() and reverts
+            to = params[0]["to"].lower()
+            if to == LEGACY_L2 and params[0]["data"] == "0xb852ad36":
+                raise ValueError("execution reverted")
+            return "0x" + "00" * 12 + (LEGACY_L1 if to == LEGACY_L2 else SHARED_L1)[2:]
+        raise ValueError(f"Unexpected request {method}")
+
+    def receipt(self, i):
+        topic = (
+            "0x"
+            + event_signature_to_log_topic("L1MessageSent(address,bytes32,bytes)").hex()
+        )
+        sender = "0x" + "00" * 12 + self.senders[i][2:]
+        return {
+            "transactionHash": "0x" + f"{i:064x}",
+            "blockHash": "0x" + "01" * 32,
+            "blockNumber": "0x1",
+            "l1BatchNumber": "0x7",
+            "l1BatchTxIndex": hex(i),
+            "status": "0x1",
+            "logs": [
+                {
+                    "address": L1_MESSENGER,
+                    "topics": [topic, sender, "0x" + "00" * 32],
+                    "data": "0x" + encode(["bytes"], [bytes([i]) * 4]).hex(),
+                    "l1BatchNumber": "0x7",
+                }
+            ],
+            "l2ToL1Logs": [] if i in self.without_log else [{"sender": L1_MESSENGER}],
+        }
+
+    def response(self, request_id, method, params):
+        try:
+            return _response(request_id, method, self.result(method, params))
+        except ValueError as e:
+            return _response(request_id, method, message=str(e))
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        return self.response(0, method, params)
+
+    def make_batch_request(self, requests):
+        self.batches.append([method for method, _ in requests])
+        return [
+            self.response(i, method, params)
+            for i, (method, params) in enumerate(requests)
+        ]
+
+
+class L1Provider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.finalized = set()
+        self.checked = []
+        self.reverting = set()
+        self.raw_transactions = []
+        self.rejected_sends = set()
+        self.chain_id = "0x9"
+
+    def result(self, method, params):
+        if method == "eth_chainId":
+            return self.chain_id
+        if method == "eth_blockNumber":
+            return "0x20"
+        if method == "eth_getTransactionCount":
+            return "0x3"
+        if method == "eth_estimateGas":
+            return "0x30000"
+        if method == "eth_maxPriorityFeePerGas":
+            return "0x1"
+        if method == "eth_getBlockByNumber":
+            return {"number": "0x20", "baseFeePerGas": "0x10", "extraData": "0x"}
+        if method == "eth_call":
+            data = bytes.fromhex(params[0]["data"][2:])
+            if data[:4] == AGGREGATE3:
+                return self.aggregate3(data)
+            success, result = self.is_finalized(params[0]["to"], data)
+            if not success:
+                raise ValueError("execution reverted")
+            return "0x" + result.hex()
+        if method == "eth_sendRawTransaction":
+            if len(self.raw_transactions) in self.rejected_sends:
+                self.rejected_sends.remove(len(self.raw_transactions))
+                raise ValueError("insufficient funds")
+            self.raw_transactions.append(params[0])
+            return "0x" + f"{len(self.raw_transactions):064x}"
+        raise ValueError(f"Unexpected request {method}")
+
+    def is_finalized(self, target, calldata):
+        assert calldata[:4] == IS_FINALIZED
+        _, _, message_index = decode(["uint256"] * 3, calldata[4:])
+        self.checked.append((target.lower(), message_index))
+        if message_index in self.reverting:
+            return False, b""
+        return True, encode(["bool"], [message_index in self.finalized])
+
+    def aggregate3(self, data):
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        results = []
+        for target, allow_failure, calldata in calls:
+            assert allow_failure
+            results.append(self.is_finalized(target, calldata))
+        return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        try:
+            return _response(0, method, self.result(method, params))
+        except ValueError as e:
+            return _response(0, method, message=str(e))
+
+    def sent_transactions(self):
+        return [
+            TypedTransaction.from_bytes(HexBytes(raw)).as_dict()
+            for raw in self.raw_transactions
+        ]
+
+
+class FinalizeWithdrawalsTests(TestCase):
+    def wallet(self, senders):
+        self.l2 = L2Provider(senders)
+        self.l1 = L1Provider()
+        self.hashes = ["0x" + f"{i:064x}" for i in range(len(senders))]
+        return WalletL1(ZkWeb3(self.l2), Web3(self.l1), Account.from_key(PRIVATE_KEY))
+
+    def test_receipts_and_proofs_are_batched(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 5)
+        self.l1.finalized = {101, 103}
+        self.assertEqual(
+            wallet.are_withdrawals_finalized(
+                self.hashes, batch_size=2, multicall_address=MULTICALL3_ADDRESS
+            ),
+            [False, True, False, True, False],
+        )
+        self.assertEqual(
+            self.l2.batches,
+            [["eth_getTransactionReceipt"] * 2, ["zks_getL2ToL1LogProof"] * 2] * 2
+            + [["eth_getTransactionReceipt"], ["zks_getL2ToL1LogProof"]],
+        )
+        # checks are read from the same block, two per multicall
+        self.assertEqual(self.l1.requests.count("eth_blockNumber"), 1)
+        self.assertEqual(self.l1.requests.count("eth_call"), 3)
+        self.assertEqual(self.l1.checked, [(SHARED_L1, 100 + i) for i in range(5)])
+
+    def test_bridges_are_resolved_once(self):
+        wallet = self.wallet([SHARED_L2, LEGACY_L2, SHARED_L2, LEGACY_L2])
+        self.assertEqual(wallet.are_withdrawals_finalized(self.hashes), [False] * 4)
+        # legacy bridge withdrawals are checked on the shared bridge
+        self.assertEqual([target for target, _ in self.l1.checked], [SHARED_L1] * 4)
+        # only the legacy bridge is probed, the shared one is known
+        self.assertEqual(self.l2.requests.count("eth_call"), 2)
+
+        wallet.finalize_withdrawals(self.hashes, skip_finalized=False)
+        txs = self.l1.sent_transactions()
+        self.assertEqual(
+            ["0x" + bytes(tx["to"]).hex() for tx in txs], [SHARED_L1, LEGACY_L1] * 2
+        )
+        self.assertTrue(all(tx["data"][:4] == FINALIZE for tx in txs))
+
+    def test_finalize_skips_finalized_with_sequential_nonces(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 4)
+        self.l1.finalized = {102}
+        tx_hashes = wallet.finalize_withdrawals(self.hashes)
+        self.assertIsNone(tx_hashes[2])
+        self.assertEqual([tx["nonce"] for tx in self.l1.sent_transactions()], [3, 4, 5])
+        self.assertEqual(self.l1.requests.count("eth_getTransactionCount"), 1)
+        # fees of the first transaction are reused
+        self.assertEqual(self.l1.requests.count("eth_maxPriorityFeePerGas"), 1)
+
+    def test_fees_are_read_per_batch(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 5)
+        wallet.finalize_withdrawals(self.hashes, skip_finalized=False, batch_size=2)
+        self.assertEqual(self.l1.requests.count("eth_maxPriorityFeePerGas"), 3)
+
+    def test_failed_send_does_not_stop_the_others(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 4)
+        self.l1.rejected_sends = {1}
+        tx_hashes = wallet.finalize_withdrawals(self.hashes, skip_finalized=False)
+        self.assertIn("insufficient funds", str(tx_hashes[1]))
+        self.assertEqual(
+            [isinstance(h, Exception) for h in tx_hashes], [False, True, False, False]
+        )
+        # the nonce of the failed withdrawal is used by the next one
+        self.assertEqual([tx["nonce"] for tx in self.l1.sent_transactions()], [3, 4, 5])
+
+    def test_unreadable_withdrawals_do_not_stop_the_others(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 5)
+        self.l2.unknown = {1}
+        self.l2.without_log = {2}
+        self.l2.unproven = {3}
+        self.l1.finalized = {104}
+        finalized = wallet.are_withdrawals_finalized(self.hashes)
+        self.assertEqual(finalized[0], False)
+        self.assertEqual(finalized[4], True)
+        self.assertTrue(all(isinstance(r, Exception) for r in finalized[1:4]))
+
+        tx_hashes = wallet.finalize_withdrawals(self.hashes, batch_size=3)
+        self.assertIsInstance(tx_hashes[0], HexBytes)
+        self.assertIn("not found", str(tx_hashes[1]))
+        self.assertIsInstance(tx_hashes[2], IndexError)
+        self.assertIn("proof not available yet", str(tx_hashes[3]))
+        self.assertIsNone(tx_hashes[4])
+        self.assertEqual([tx["nonce"] for tx in self.l1.sent_transactions()], [3])
+
+    def test_checks_without_multicall(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 3)
+        self.l1.finalized = {101}
+        self.l1.reverting = {102}
+        self.assertEqual(
+            wallet.are_withdrawals_finalized(self.hashes), [False, True, False]
+        )
+        self.assertEqual(self.l1.requests.count("eth_call"), 3)
+        self.assertEqual(self.l1.requests.count("eth_blockNumber"), 1)
+
+    def test_reverting_check_counts_as_not_finalized(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 3)
+        self.l1.finalized = {101, 102}
+        self.l1.reverting = {102}
+        self.assertEqual(
+            wallet.are_withdrawals_finalized(
+                self.hashes, multicall_address=MULTICALL3_ADDRESS
+            ),
+            [False, True, False],
+        )
+        self.assertEqual(self.l1.requests.count("eth_call"), 1)
+
+    def test_transactions_use_the_l1_provider_chain(self):
+        wallet = self.wallet([BASE_TOKEN_L2] * 2)
+        wallet.finalize_withdrawals(self.hashes, skip_finalized=False)
+        self.assertEqual({tx["chainId"] for tx in self.l1.sent_transactions()}, {9})
+
+    def test_l1_provider_on_another_chain_fails_early(self):
+        wallet = self.wallet([BASE_TOKEN_L2])
+        self.l1.chain_id = "0x1"
+        with self.assertRaises(ValueError):
+            wallet.finalize_withdrawals(self.hashes, skip_finalized=False)
+        self.assertEqual(self.l1.raw_transactions, [])
@@ -0,0 +1,104 @@
+from unittest import TestCase
+
+from eth_abi import decode, encode
+from eth_utils import to_checksum_address
+from web3.exceptions import ContractLogicError
+from web3.providers import JSONBaseProvider
+
+from zksync2.module.module_builder import ZkWeb3
+
+MULTICALL = to_checksum_address("0x" + "ca" * 20)
+TOKEN = to_checksum_address("0x" + "11" * 20)
+NOT_DEPLOYED = to_checksum_address("0x" + "22" * 20)
+REVERTING = to_checksum_address("0x" + "33" * 20)
+ACCOUNTS = [to_checksum_address("0x%040x" % (0x100 + i)) for i in range(3)]
+
+
+def balance_of(token: str, account: str) -> bytes:
+    if token == NOT_DEPLOYED:
+        return b""
+    return encode(["uint256"], [int(account, 16) + int(token[2:4], 16)])
+
+
+class BalanceProvider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+        self.requests = []
+        self.block_tags = set()
+
+    def response(self, i, method, params):
+        if method == "eth_getBlockByNumber":
+            return {"id": i, "result": {"number": "0x64", "hash": "0x" + "00" * 32}}
+        self.block_tags.add(params[1])
+        if method == "eth_getBalance":
+            return {"id": i, "result": hex(int(params[0], 16))}
+        to = to_checksum_address(params[0]["to"])
+        data = bytes.fromhex(params[0]["data"][2:])
+        if to == REVERTING:
+            error = {"code": 3, "message": "execution reverted", "data": "0x"}
+            return {"id": i, "error": error}
+        if to != MULTICALL:
+            return {
+                "id": i,
+                "result": "0x" + balance_of(to, "0x" + data[-20:].hex()).hex(),
+            }
+        calls = decode(["(address,bool,bytes)[]"], data[4:])[0]
+        results = [
+            (
+                (False, b"")
+                if target == REVERTING
+                else (
+                    True,
+                    balance_of(
+                        to_checksum_address(target), "0x" + calldata[-20:].hex()
+                    ),
+                )
+            )
+            for target, _, calldata in calls
+        ]
+        return {"id": i, "result": "0x" + encode(["(bool,bytes)[]"], [results]).hex()}
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        return dict(jsonrpc="2.0", **self.response(0, method, params))
+
+    def make_batch_request(self, requests):
+        self.batches.append([method for method, _ in requests])
+        return [
+            dict(jsonrpc="2.0", **self.response(i, method, params))
+            for i, (method, params) in enumerate(requests)
+        ]
+
+
+class GetBalancesTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = BalanceProvider()
+        self.zksync = ZkWeb3(self.provider).zksync
+        self.tokens = [None, TOKEN, NOT_DEPLOYED, REVERTING]
+
+    def assert_balances(self, balances):
+        self.assertEqual(len(balances), len(ACCOUNTS))
+        for account, row in zip(ACCOUNTS, balances):
+            self.assertEqual(row[0], int(account, 16))
+            self.assertEqual(row[1], int(account, 16) + 0x11)
+            self.assertEqual(row[2], 0)
+            self.assertIsInstance(row[3], ContractLogicError)
+        # every balance is read at the block the tag resolved to
+        self.assertEqual(self.provider.block_tags, {"0x64"})
+
+    def test_batched_calls(self):
+        balances = self.zksync.get_balances(ACCOUNTS, self.tokens, batch_size=5)
+        self.assert_balances(balances)
+        self.assertEqual([len(b) for b in self.provider.batches], [5, 5, 2])
+        # only the block tag is resolved outside of the batches
+        self.assertEqual(self.provider.requests, ["eth_getBlockByNumber"])
+
+    def test_multicall_chunks(self):
+        balances = self.zksync.get_balances(
+            ACCOUNTS, self.tokens, multicall_address=MULTICALL, chunk_size=4
+        )
+        self.assert_balances(balances)
+        self.assertEqual(
+            self.provider.batches, [["eth_getBalance"] * 3 + ["eth_call"] * 3]
+        )
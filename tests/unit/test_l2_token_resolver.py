@@ -0,0 +1,64 @@
+from unittest import TestCase
+
+from eth_utils import keccak, to_checksum_address
+from web3.providers import JSONBaseProvider
+
+from zksync2.manage_contracts.l2_token_resolver import L2TokenAddressResolver
+from zksync2.module.module_builder import ZkWeb3
+
+BRIDGE = "0x" + "a2" * 20
+BEACON = "0x" + "be" * 20
+PROXY_HASH = "0x0100" + "ab" * 30
+L1_TOKEN = "0x" + "11" * 20
+MISMATCH = "0x" + "22" * 20
+
+
+def expected_l2_address(l1_token: str) -> str:
+    # L2SharedBridge.l2TokenAddress
+    constructor = bytes.fromhex(BEACON[2:]).rjust(32, b"\0")
+    constructor += (64).to_bytes(32, "big") + bytes(32)
+    data = (
+        keccak(text="zksyncCreate2")
+        + bytes.fromhex(BRIDGE[2:]).rjust(32, b"\0")
+        + bytes.fromhex(l1_token[2:]).rjust(32, b"\0")
+        + bytes.fromhex(PROXY_HASH[2:])
+        + keccak(constructor)
+    )
+    return to_checksum_address(keccak(data)[12:])
+
+
+class BridgeProvider(JSONBaseProvider):
+    def result(self, method, params):
+        data = params[0]["data"]
+        if data == "0x6dde7209":
+            return "0x" + "00" * 12 + BEACON[2:]
+        if data == "0x823f1d96":
+            return PROXY_HASH
+        l1_token = "0x" + data[-40:]
+        if l1_token == MISMATCH:
+            return "0x" + "00" * 32
+        return "0x" + "00" * 12 + expected_l2_address(l1_token)[2:].lower()
+
+    def make_request(self, method, params):
+        return {"jsonrpc": "2.0", "id": 0, "result": self.result(method, params)}
+
+    def make_batch_request(self, requests):
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": self.result(method, params)}
+            for i, (method, params) in enumerate(requests)
+        ]
+
+
+class L2TokenAddressResolverTests(TestCase):
+    def test_offline_address(self):
+        resolver = L2TokenAddressResolver(BRIDGE, BEACON, PROXY_HASH)
+        self.assertEqual(
+            resolver.l2_token_address(L1_TOKEN), expected_l2_address(L1_TOKEN)
+        )
+
+    def test_from_bridge_and_verify(self):
+        zksync = ZkWeb3(BridgeProvider()).zksync
+        resolver = L2TokenAddressResolver.from_bridge(zksync, BRIDGE)
+        self.assertEqual(resolver.beacon_address, to_checksum_address(BEACON))
+        self.assertEqual(resolver.proxy_bytecode_hash.hex(), PROXY_HASH[2:])
+        self.assertEqual(resolver.verify(zksync, [L1_TOKEN, MISMATCH]), [MISMATCH])
@@ -0,0 +1,126 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from web3.providers import BaseProvider
+
+from web3.exceptions import Web3RPCError
+
+from zksync2.account.nonce_manager import NonceManager, is_nonce_error
+from zksync2.module.module_builder import ZkWeb3
+
+ACCOUNT = "0x" + "11" * 20
+
+
+class NonceProvider(BaseProvider):
+    def __init__(self, nonce: int):
+        super().__init__()
+        self.nonce = nonce
+        self.calls = 0
+
+    def make_request(self, method, params):
+        self.calls += 1
+        return {"jsonrpc": "2.0", "id": 1, "result": hex(self.nonce)}
+
+
+class AsyncNonceSource:
+    def __init__(self, nonce: int):
+        self.nonce = nonce
+        self.calls = 0
+        self.error = None
+
+    async def get_transaction_count(self, address, block_tag):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        return self.nonce
+
+
+class NonceManagerTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = NonceProvider(7)
+        self.manager = NonceManager(ZkWeb3(self.provider).zksync, ACCOUNT)
+
+    def test_concurrent_reservations_are_unique(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            nonces = list(executor.map(lambda _: self.manager.reserve(), range(200)))
+        self.assertEqual(sorted(nonces), list(range(7, 207)))
+        self.assertEqual(self.provider.calls, 1)
+
+    def test_failed_submission_releases_nonce(self):
+        with self.assertRaises(ConnectionError):
+            with self.manager.reservation():
+                raise ConnectionError("connection reset")
+        self.assertEqual(self.manager.reserve(), 7)
+        first = self.manager.reserve()
+        self.manager.reserve()
+        self.manager.release(first)
+        self.assertEqual(self.manager.reserve(), first)
+        with self.assertRaises(ValueError):
+            self.manager.release(100)
+
+    def test_rejected_nonce_resyncs(self):
+        self.manager.reserve()
+        self.provider.nonce = 20
+        with self.assertRaises(ValueError):
+            with self.manager.reservation():
+                raise ValueError("nonce too low")
+        self.assertEqual(self.manager.reserve(), 20)
+        self.assertEqual(self.provider.calls, 2)
+
+    def test_failures_before_a_resync_are_ignored(self):
+        first, second, third = [self.manager.acquire() for _ in range(3)]
+        self.manager.failed(second, ConnectionError("connection reset"))
+        self.assertEqual(self.manager.reserve(), second.nonce)
+        self.provider.nonce = 9
+        self.manager.failed(first, ValueError("nonce too low"))
+        self.assertEqual(self.manager.reserve(), 9)
+        # the node counted these already
+        self.manager.failed(third, ValueError("nonce too low"))
+        self.manager.failed(third, ConnectionError("connection reset"))
+        self.assertEqual(self.manager.reserve(), 10)
+        self.assertEqual(self.provider.calls, 2)
+
+    def test_nonce_errors(self):
+        rejected = {"code": -32000, "message": "Nonce is too high"}
+        self.assertTrue(is_nonce_error(ValueError("nonce too low: next nonce 5")))
+        self.assertTrue(is_nonce_error(ValueError(rejected)))
+        self.assertTrue(
+            is_nonce_error(
+                Web3RPCError(str(rejected), rpc_response={"error": rejected})
+            )
+        )
+        self.assertFalse(is_nonce_error(ValueError("invalid nonce signature")))
+        self.assertFalse(
+            is_nonce_error(ValueError("execution reverted: Nonce already used"))
+        )
+
+
+class AsyncNonceManagerTests(IsolatedAsyncioTestCase):
+    async def test_concurrent_reservations_are_unique(self):
+        source = AsyncNonceSource(3)
+        manager = NonceManager(source, ACCOUNT)
+
+        async def send():
+            async with manager.async_reservation() as nonce:
+                await asyncio.sleep(0)
+                return nonce
+
+        nonces = await asyncio.gather(*[send() for _ in range(50)])
+        self.assertEqual(sorted(nonces), list(range(3, 53)))
+        self.assertEqual(source.calls, 1)
+
+    async def test_failed_count_request_reaches_every_waiter(self):
+        source = AsyncNonceSource(3)
+        source.error = ConnectionError("connection reset")
+        manager = NonceManager(source, ACCOUNT)
+        results = await asyncio.gather(
+            *[manager.async_reserve() for _ in range(5)], return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, ConnectionError) for r in results))
+        self.assertEqual(source.calls, 1)
+
+        source.error = None
+        self.assertEqual(await manager.async_reserve(), 3)
+        self.assertEqual(source.calls, 2)
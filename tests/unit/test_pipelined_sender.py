@@ -0,0 +1,186 @@
+import math
+from unittest import TestCase
+
+from eth_account import Account
+from eth_utils import keccak
+from hexbytes import HexBytes
+from web3.providers import JSONBaseProvider
+
+from zksync2.account.nonce_manager import NonceManager
+from zksync2.account.pipelined_sender import PipelinedSender
+from zksync2.account.wallet_l2 import WalletL2
+from zksync2.core.types import TransactionOptions, TransferTransaction
+from zksync2.module.fee_model import LocalFeeModel
+from zksync2.module.module_builder import ZkWeb3
+from zksync2.transaction.transaction712 import Transaction712
+
+PRIVATE_KEY = "0x" + "7a" * 32
+RECEIVER = "0x" + "22" * 20
+
+
+class SendProvider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+        self.batches = []
+        self.raw_transactions = []
+        self.rejected_nonces = set()
+        self.rejection = "insufficient balance"
+
+    def result(self, method, params):
+        if method == "eth_chainId":
+            return "0x10e"
+        if method == "zks_getProtocolVersion":
+            return {"version_id": 24}
+        if method == "zks_getMainContract":
+            return "0x" + "33" * 20
+        if method == "eth_getTransactionCount":
+            # two transactions of the account are pending
+            return "0x5" if params[1] == "pending" else "0x3"
+        if method == "zks_estimateFee":
+            return {
+                "gas_limit": "0x30000",
+                "max_fee_per_gas": "0x2b275d0",
+                "max_priority_fee_per_gas": "0x0",
+                "gas_per_pubdata_limit": "0xc350",
+            }
+        if method == "zks_getFeeParams":
+            config = {
+                "minimal_l2_gas_price": 25000000,
+                "compute_overhead_part": 0,
+                "pubdata_overhead_part": 1,
+                "batch_overhead_l1_gas": 800000,
+                "max_gas_per_batch": 200000000,
+                "max_pubdata_per_batch": 240000,
+            }
+            return {"V2": {"config": config, "l1_gas_price": 1, "l1_pubdata_price": 1}}
+        if method == "eth_sendRawTransaction":
+            self.raw_transactions.append(params[0])
+            return "0x" + keccak(hexstr=params[0]).hex()
+        raise ValueError(f"Unexpected request {method}")
+
+    def make_request(self, method, params):
+        self.requests.append(method)
+        if method == "eth_sendRawTransaction":
+            tx = Transaction712.decode(bytes.fromhex(params[0][2:]))
+            if tx.nonce in self.rejected_nonces:
+                error = {"code": -32000, "message": self.rejection}
+                return {"jsonrpc": "2.0", "id": 0, "error": error}
+        return {"jsonrpc": "2.0", "id": 0, "result": self.result(method, params)}
+
+    def make_batch_request(self, requests):
+        self.batches.append([method for method, _ in requests])
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": self.result(method, params)}
+            for i, (method, params) in enumerate(requests)
+        ]
+
+
+class PipelinedSenderTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = SendProvider()
+        self.web3 = ZkWeb3(self.provider)
+        self.account = Account.from_key(PRIVATE_KEY)
+        self.wallet = WalletL2(self.web3, self.web3, self.account)
+        self.provider.requests.clear()
+
+    def sent_transactions(self):
+        return [
+            Transaction712.decode(bytes.fromhex(raw[2:]))
+            for raw in self.provider.raw_transactions
+        ]
+
+    def test_nonce_and_fee_in_one_batch(self):
+        with PipelinedSender(self.wallet) as sender:
+            tx_hash = sender.submit(TransferTransaction(to=RECEIVER, amount=7)).result()
+        self.assertEqual(
+            self.provider.batches, [["eth_getTransactionCount", "zks_estimateFee"]]
+        )
+        self.assertNotIn("eth_gasPrice", self.provider.requests)
+        (tx,) = self.sent_transactions()
+        self.assertEqual(tx_hash, keccak(hexstr=self.provider.raw_transactions[0]))
+        self.assertEqual(tx.nonce, 5)
+        self.assertEqual(tx.gas_limit, 0x30000)
+        self.assertEqual(tx.maxFeePerGas, 0x2B275D0)
+        self.assertEqual(tx.value, 7)
+        self.assertEqual(tx.from_, self.account.address)
+
+    def test_nonce_manager_and_given_fees_skip_requests(self):
+        self.wallet.nonce_manager = NonceManager(self.web3.zksync, self.account.address)
+        options = TransactionOptions(
+            gas_limit=100000, max_fee_per_gas=10, max_priority_fee_per_gas=1
+        )
+        with PipelinedSender(self.wallet, max_workers=4) as sender:
+            futures = [
+                sender.submit(
+                    TransferTransaction(to=RECEIVER, amount=1, options=options)
+                )
+                for _ in range(10)
+            ]
+            for future in futures:
+                future.result()
+        self.assertEqual(self.provider.batches, [])
+        self.assertEqual(self.provider.requests.count("eth_getTransactionCount"), 1)
+        nonces = sorted(tx.nonce for tx in self.sent_transactions())
+        self.assertEqual(nonces, list(range(5, 15)))
+        self.assertIsNone(options.nonce)
+
+    def test_fee_model_leaves_gas_limit_only(self):
+        self.web3.zksync.fee_model = LocalFeeModel(self.web3.zksync)
+        options = TransactionOptions(nonce=9, gas_limit=100000)
+        with PipelinedSender(self.wallet) as sender:
+            sender.submit(TransferTransaction(to=RECEIVER, amount=1, options=options))
+        self.assertEqual(self.provider.batches, [])
+        self.assertNotIn("zks_estimateFee", self.provider.requests)
+        (tx,) = self.sent_transactions()
+        self.assertEqual(tx.maxFeePerGas, 25000000)
+        self.assertEqual(tx.gas_limit, 100000)
+
+    def test_transfer_many_estimates_once_per_shape(self):
+        transfers = [TransferTransaction(to=RECEIVER, amount=i) for i in range(6)]
+        results = self.wallet.transfer_many(transfers, max_workers=3)
+        self.assertEqual(self.provider.batches, [["zks_estimateFee"]])
+        self.assertEqual(self.provider.requests.count("eth_getTransactionCount"), 1)
+        self.assertTrue(all(isinstance(r, HexBytes) for r in results))
+        txs = sorted(self.sent_transactions(), key=lambda tx: tx.nonce)
+        self.assertEqual([tx.nonce for tx in txs], list(range(5, 11)))
+        self.assertEqual([tx.value for tx in txs], list(range(6)))
+        gas_limit = math.ceil(0x30000 * 1.2)
+        self.assertTrue(all(tx.gas_limit == gas_limit for tx in txs))
+
+    def test_transfer_many_stops_after_failed_nonce(self):
+        self.wallet.nonce_manager = NonceManager(self.web3.zksync, self.account.address)
+        self.provider.rejected_nonces = {7}
+        transfers = [TransferTransaction(to=RECEIVER, amount=1) for _ in range(5)]
+        transfers.append(
+            TransferTransaction(
+                to=RECEIVER, amount=1, options=TransactionOptions(nonce=20)
+            )
+        )
+        results = self.wallet.transfer_many(transfers, max_workers=4)
+        self.assertIn("insufficient balance", str(results[2]))
+        self.assertIsInstance(results[3], RuntimeError)
+        self.assertIsInstance(results[4], RuntimeError)
+        self.assertEqual(
+            [isinstance(r, HexBytes) for r in results],
+            [True, True, False, False, False, True],
+        )
+        # sent in nonce order, the given nonce does not depend on the others
+        self.assertEqual([tx.nonce for tx in self.sent_transactions()], [5, 6, 20])
+        # the nonces of the failed and unsent transfers are handed out again
+        self.assertEqual(self.wallet.nonce_manager.reserve(), 7)
+        self.assertEqual(self.wallet.nonce_manager.reserve(), 8)
+
+    def test_transfer_many_resyncs_once_after_rejected_nonce(self):
+        self.wallet.nonce_manager = NonceManager(self.web3.zksync, self.account.address)
+        self.provider.rejected_nonces = {6}
+        self.provider.rejection = "nonce too high"
+        transfers = [TransferTransaction(to=RECEIVER, amount=1) for _ in range(5)]
+        results = self.wallet.transfer_many(transfers)
+        self.assertEqual(
+            [isinstance(r, HexBytes) for r in results],
+            [True, False, False, False, False],
+        )
+        self.assertEqual(self.provider.requests.count("eth_getTransactionCount"), 1)
+        self.assertEqual(self.wallet.nonce_manager.reserve(), 5)
+        self.assertEqual(self.provider.requests.count("eth_getTransactionCount"), 2)
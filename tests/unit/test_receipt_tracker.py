@@ -0,0 +1,123 @@
+from unittest import TestCase
+
+from web3.exceptions import TimeExhausted
+from web3.providers import JSONBaseProvider
+
+from zksync2.module.module_builder import ZkWeb3
+from zksync2.module.receipt_tracker import ReceiptStage, ReceiptTracker
+
+INCLUDED = "0x" + "01" * 32
+EXECUTED = "0x" + "02" * 32
+EXECUTED_SAME_BATCH = "0x" + "04" * 32
+UNKNOWN = "0x" + "03" * 32
+
+
+class ChainProvider(JSONBaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def result(self, method, params):
+        if method == "eth_getBlockByNumber":
+            return {"number": "0x5", "hash": "0x" + "22" * 32, "transactions": []}
+        if method == "zks_getL1BatchDetails":
+            return {
+                "number": params[0],
+                "status": "verified" if params[0] == 1 else "sealed",
+                "baseSystemContractsHashes": {"bootloader": "0x", "default_aa": "0x"},
+                "commitTxHash": None,
+                "committedAt": None,
+                "executeTxHash": None,
+                "executedAt": None,
+                "l1GasPrice": 1,
+                "l1TxCount": 0,
+                "l2FairGasPrice": 1,
+                "l2TxCount": 2,
+                "proveTxHash": None,
+                "provenAt": None,
+                "rootHash": None,
+                "timestamp": 1,
+            }
+        if params[0] == UNKNOWN:
+            return None
+        included = params[0] == INCLUDED
+        return {
+            "transactionHash": params[0],
+            "blockHash": "0x" + "33" * 32,
+            "blockNumber": "0x5" if included else "0x3",
+            "l1BatchNumber": "0x2" if included else "0x1",
+            "logs": [],
+        }
+
+    def make_request(self, method, params):
+        return {"jsonrpc": "2.0", "id": 0, "result": self.result(method, params)}
+
+    def make_batch_request(self, requests):
+        self.batches.append([method for method, _ in requests])
+        return [
+            {"jsonrpc": "2.0", "id": i, "result": self.result(method, params)}
+            for i, (method, params) in enumerate(requests)
+        ]
+
+
+class ReceiptTrackerTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = ChainProvider()
+        self.web3 = ZkWeb3(self.provider)
+        self.tracker = ReceiptTracker(self.web3.zksync, max_interval=0.2)
+
+    def tearDown(self) -> None:
+        self.tracker.close()
+
+    def test_futures_resolve_at_their_stage(self):
+        committed = self.tracker.track(INCLUDED)
+        finalized = self.tracker.track(INCLUDED, ReceiptStage.FINALIZED)
+        executed = self.tracker.track(EXECUTED, ReceiptStage.EXECUTED)
+        not_executed = self.tracker.track(INCLUDED, ReceiptStage.EXECUTED)
+        unknown = self.tracker.track(UNKNOWN)
+
+        self.assertEqual(committed.result(timeout=5)["blockNumber"], 5)
+        self.assertEqual(finalized.result(timeout=5)["blockNumber"], 5)
+        self.assertEqual(executed.result(timeout=5)["blockNumber"], 3)
+        self.assertFalse(not_executed.done())
+        self.assertFalse(unknown.done())
+        for batch in self.provider.batches:
+            self.assertLessEqual(batch.count("eth_getTransactionReceipt"), 3)
+            self.assertLessEqual(batch.count("eth_getBlockByNumber"), 1)
+
+        self.tracker.close()
+        self.assertTrue(unknown.cancelled())
+
+    def test_batch_details_are_polled_once_per_batch(self):
+        self.tracker.close()
+        self.web3.zksync._receipt_tracker = ReceiptTracker(self.web3.zksync)
+        tracker = self.web3.zksync.receipt_tracker
+        futures = [
+            tracker.track(tx_hash, ReceiptStage.EXECUTED)
+            for tx_hash in (EXECUTED, EXECUTED_SAME_BATCH)
+        ]
+        for future in futures:
+            self.assertEqual(future.result(timeout=5)["l1BatchNumber"], "0x1")
+        details = [
+            batch.count("zks_getL1BatchDetails") for batch in self.provider.batches
+        ]
+        self.assertEqual(sum(details), 1)
+
+        self.assertEqual(
+            self.web3.zksync.wait_for_l1_execution(EXECUTED, 5)["blockNumber"], 3
+        )
+        with self.assertRaises(TimeExhausted):
+            self.web3.zksync.wait_for_l1_execution(INCLUDED, 0.3)
+        tracker.close()
+
+    def test_done_callbacks_may_call_the_tracker(self):
+        executed = []
+
+        def track_execution(future):
+            executed.append(self.tracker.track(EXECUTED, ReceiptStage.EXECUTED))
+            self.assertEqual(len(self.tracker), 2)
+
+        committed = self.tracker.track(INCLUDED)
+        committed.add_done_callback(track_execution)
+        self.assertEqual(committed.result(timeout=5)["blockNumber"], 5)
+        self.assertEqual(executed[0].result(timeout=5)["blockNumber"], 3)
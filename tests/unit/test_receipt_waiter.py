@@ -0,0 +1,120 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase
+
+import websockets
+from web3 import WebSocketProvider
+from web3.exceptions import TimeExhausted
+
+from zksync2.module.module_builder import AsyncZkWeb3
+from zksync2.module.receipt_waiter import NewHeadsReceiptWaiter
+
+SUBSCRIPTION_ID = "0xabc"
+
+
+def block(number: int) -> dict:
+    return {"number": hex(number), "hash": "0x" + "22" * 32, "transactions": []}
+
+
+class NewHeadsNode:
+    def __init__(self):
+        self.head = 1
+        self.finalized = 0
+        self.mined = {}
+        self.requests = []
+        self.clients = set()
+
+    def receipt(self, tx_hash: str):
+        number = self.mined.get(tx_hash)
+        if number is None or number > self.head:
+            return None
+        return {
+            "transactionHash": tx_hash,
+            "blockHash": "0x" + "33" * 32,
+            "blockNumber": hex(number),
+            "logs": [],
+        }
+
+    def result(self, method: str, params: list):
+        if method == "eth_subscribe":
+            return SUBSCRIPTION_ID
+        if method == "eth_unsubscribe":
+            return True
+        if method == "eth_getTransactionReceipt":
+            return self.receipt(params[0])
+        number = self.finalized if params[0] == "finalized" else self.head
+        return block(number)
+
+    async def handler(self, socket):
+        self.clients.add(socket)
+        try:
+            async for message in socket:
+                body = json.loads(message)
+                self.requests.append(body)
+                requests = body if isinstance(body, list) else [body]
+                responses = [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": r["id"],
+                        "result": self.result(r["method"], r["params"]),
+                    }
+                    for r in requests
+                ]
+                await socket.send(
+                    json.dumps(responses if isinstance(body, list) else responses[0])
+                )
+        finally:
+            self.clients.discard(socket)
+
+    async def new_head(self):
+        self.head += 1
+        notification = {
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {"subscription": SUBSCRIPTION_ID, "result": block(self.head)},
+        }
+        for socket in self.clients:
+            await socket.send(json.dumps(notification))
+
+
+class NewHeadsReceiptWaiterTests(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.node = NewHeadsNode()
+        self.server = await websockets.serve(self.node.handler, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        self.web3 = AsyncZkWeb3(WebSocketProvider(f"ws://127.0.0.1:{port}"))
+        await self.web3.provider.connect()
+
+    async def asyncTearDown(self):
+        await self.web3.provider.disconnect()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_pending_transactions_are_fetched_in_one_batch_per_block(self):
+        tx_hashes = ["0x%064x" % i for i in range(20)]
+        for i, tx_hash in enumerate(tx_hashes):
+            self.node.mined[tx_hash] = 2 + i % 2
+        async with NewHeadsReceiptWaiter(self.web3) as waiter:
+            waits = asyncio.gather(
+                *[waiter.wait_for_transaction_receipt(h, timeout=5) for h in tx_hashes]
+            )
+            finalized = asyncio.ensure_future(waiter.wait_finalized(tx_hashes[0], 5))
+            await asyncio.sleep(0.1)
+            for _ in range(2):
+                await self.node.new_head()
+                await asyncio.sleep(0.1)
+            receipts = await waits
+            self.assertEqual(
+                [r["transactionHash"].to_0x_hex() for r in receipts], tx_hashes
+            )
+            self.assertFalse(finalized.done())
+
+            self.node.finalized = 3
+            await self.node.new_head()
+            self.assertEqual((await finalized)["blockNumber"], 2)
+
+            with self.assertRaises(TimeExhausted):
+                await waiter.wait_for_transaction_receipt("0x" + "ff" * 32, 0.2)
+
+        receipt_requests = [r for r in self.node.requests if isinstance(r, list)]
+        self.assertLessEqual(len(receipt_requests), 6)
@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from eth_utils import to_checksum_address
+from web3.providers import BaseProvider
+
+from zksync2.core.types import TokenRegistry
+from zksync2.module.module_builder import ZkWeb3
+
+SHARED_L2 = "0x" + "a2" * 20
+TOKENS = [
+    {
+        "l1Address": "0x%040x" % (0x1000 + i),
+        "l2Address": "0x%040x" % (0x2000 + i),
+        "name": f"Token {i}",
+        "symbol": f"T{i}",
+        "decimals": 18,
+    }
+    for i in range(5)
+]
+
+
+class TokenProvider(BaseProvider):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if method == "eth_chainId":
+            result = "0x10e"
+        elif method == "zks_getProtocolVersion":
+            result = {"version_id": 24}
+        elif method == "zks_getBaseTokenL1Address":
+            result = "0x" + "00" * 19 + "01"
+        elif method == "zks_getBridgeContracts":
+            result = {
+                "l1Erc20DefaultBridge": "0x" + "b1" * 20,
+                "l2Erc20DefaultBridge": "0x" + "b2" * 20,
+                "l1SharedDefaultBridge": "0x" + "a1" * 20,
+                "l2SharedDefaultBridge": SHARED_L2,
+                "l1WethBridge": "0x" + "00" * 20,
+                "l2WethBridge": "0x" + "00" * 20,
+            }
+        elif method == "zks_getConfirmedTokens":
+            start, limit = params
+            result = TOKENS[start : start + limit]
+        else:
+            # l2TokenAddress(address) of the shared bridge
+            result = "0x" + "00" * 12 + "cc" * 20
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class TokenAddressCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = TokenProvider()
+        self.zksync = ZkWeb3(self.provider).zksync
+
+    def test_prefill_pages_confirmed_tokens(self):
+        self.assertEqual(self.zksync.prefill_token_addresses(limit=2), 5)
+        self.assertEqual(self.provider.calls.count("zks_getConfirmedTokens"), 3)
+        for token in TOKENS:
+            self.assertEqual(
+                self.zksync.l2_token_address(token["l1Address"]),
+                to_checksum_address(token["l2Address"]),
+            )
+            self.assertEqual(
+                self.zksync.l1_token_address(token["l2Address"]),
+                to_checksum_address(token["l1Address"]),
+            )
+        self.assertNotIn("eth_call", self.provider.calls)
+
+    def test_resolved_pair_is_cached_both_ways(self):
+        l1_token = to_checksum_address("0x" + "dd" * 20)
+        l2_token = self.zksync.l2_token_address(l1_token)
+        self.assertEqual(l2_token.lower(), "0x" + "cc" * 20)
+        self.assertEqual(self.zksync.l2_token_address(l1_token), l2_token)
+        self.assertEqual(self.zksync.l1_token_address(l2_token), l1_token)
+        self.assertEqual(self.provider.calls.count("eth_call"), 1)
+
+
+class ConfirmedTokensTests(TestCase):
+    def setUp(self) -> None:
+        self.provider = TokenProvider()
+        self.zksync = ZkWeb3(self.provider).zksync
+
+    def test_iter_walks_every_page(self):
+        tokens = list(self.zksync.iter_confirmed_tokens(limit=2))
+        self.assertEqual([t.name for t in tokens], [t["name"] for t in TOKENS])
+        self.assertEqual(self.provider.calls.count("zks_getConfirmedTokens"), 3)
+
+    def test_rpc_method_returns_node_dicts(self):
+        self.assertEqual(self.zksync.zks_get_confirmed_tokens(0, 2), TOKENS[:2])
+
+    def test_registry_indexes_tokens(self):
+        registry = TokenRegistry()
+        for _ in self.zksync.iter_confirmed_tokens(limit=10, registry=registry):
+            pass
+        self.assertEqual(len(registry), len(TOKENS))
+        token = registry.by_l1_address(TOKENS[3]["l1Address"])
+        self.assertEqual(token.symbol, "T3")
+        self.assertIs(registry.by_l2_address(TOKENS[3]["l2Address"].upper()), token)
+        self.assertEqual(registry.by_symbol("T3"), [token])
+        self.assertEqual(registry.by_symbol("T9"), [])
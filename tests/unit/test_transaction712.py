@@ -1,6 +1,8 @@
 from pathlib import Path
 from unittest import TestCase
 
+import rlp
+
 from zksync2.eip712 import make_domain
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
@@ -15,8 +17,10 @@ from zksync2.manage_contracts.contract_encoder_base import (
     ContractEncoder,
     JsonConfiguration,
 )
+from zksync2.core.types import PaymasterParams
 from zksync2.module.request_types import EIP712Meta
-from zksync2.transaction.transaction712 import Transaction712
+from zksync2.signer.eth_signer import PrivateKeyEthSigner
+from zksync2.transaction.transaction712 import Transaction712, TransactionStruct
 from zksync2.transaction.transaction_builders import TxCreateContract
 
 PRIVATE_KEY2 = bytes.fromhex(
@@ -91,6 +95,11 @@ class Transaction712Tests(TestCase):
         eip712_struct = self.tx712.to_eip712_struct()
         ret = eip712_struct.encode_type()
         self.assertEqual(self.TRANSACTION_SIGNATURE, ret)
+        self.assertIsInstance(eip712_struct, TransactionStruct)
+        self.assertEqual("Transaction", eip712_struct.type_name)
+        self.assertEqual(
+            keccak(text=self.TRANSACTION_SIGNATURE), eip712_struct.type_hash()
+        )
 
     def test_serialize_to_eip712_encoded_value(self):
         eip712_struct = self.tx712.to_eip712_struct()
@@ -106,3 +115,132 @@ class Transaction712Tests(TestCase):
         msg = keccak(result_bytes)
         result = "0x" + msg.hex()
         self.assertEqual(self.EXPECTED_ENCODED_BYTES, result)
+
+    def test_encode(self):
+        domain = make_domain(name="zkSync", version="2", chainId=self.CHAIN_ID)
+        factory_dep = bytes(range(256)) * 4
+        paymaster_input = b"\x8c\x5a\x34\x45"
+        self.tx712.meta = EIP712Meta(
+            factory_deps=[factory_dep],
+            paymaster_params=PaymasterParams(
+                paymaster=self.RECEIVER, paymaster_input=paymaster_input
+            ),
+        )
+        signature = self.account.unsafe_sign_hash(
+            keccak(self.tx712.to_eip712_struct().signable_bytes(domain))
+        )
+        expected = rlp.encode(
+            [
+                self.NONCE,
+                0,
+                0,
+                self.GAS_LIMIT,
+                bytes.fromhex(self.RECEIVER[2:]),
+                0,
+                bytes.fromhex(self.tx712.data[2:]),
+                self.CHAIN_ID,
+                b"",
+                b"",
+                self.CHAIN_ID,
+                bytes.fromhex(self.SENDER[2:]),
+                EIP712Meta.GAS_PER_PUB_DATA_DEFAULT,
+                [factory_dep],
+                signature.signature,
+                [bytes.fromhex(self.RECEIVER[2:]), paymaster_input],
+            ]
+        )
+        self.assertEqual(b"\x71" + expected, self.tx712.encode(signature))
+
+    def test_decode(self):
+        factory_dep = bytes(range(256)) * 4
+        self.tx712.meta = EIP712Meta(
+            custom_signature=b"\x01" * 65,
+            factory_deps=[factory_dep],
+            paymaster_params=PaymasterParams(
+                paymaster=self.RECEIVER, paymaster_input=b"\x8c\x5a\x34\x45"
+            ),
+        )
+        raw = self.tx712.encode()
+
+        decoded = Transaction712.decode(raw)
+        self.assertEqual(decoded.nonce, self.NONCE)
+        self.assertEqual(decoded.chain_id, self.CHAIN_ID)
+        self.assertEqual(decoded.gas_limit, self.GAS_LIMIT)
+        self.assertEqual(decoded.to, self.RECEIVER)
+        self.assertEqual(decoded.from_.lower(), self.SENDER)
+        self.assertEqual(decoded.data, bytes.fromhex(self.tx712.data[2:]))
+        self.assertEqual(decoded.meta.factory_deps, [factory_dep])
+        self.assertEqual(
+            decoded.meta.paymaster_params, self.tx712.meta.paymaster_params
+        )
+        self.assertEqual(raw, decoded.encode())
+        self.assertEqual(
+            self.tx712.to_eip712_struct().hash_struct(),
+            decoded.to_eip712_struct().hash_struct(),
+        )
+
+        decoded = list(Transaction712.iter_decode(raw + raw, zero_copy=True))
+        self.assertEqual(len(decoded), 2)
+        self.assertIsInstance(decoded[1].meta.factory_deps[0], memoryview)
+        self.assertEqual(raw, decoded[1].encode())
+        with self.assertRaises(ValueError):
+            Transaction712.decode(raw[:-1])
+
+    def test_decode_rejects_malformed_input(self):
+        self.tx712.meta = EIP712Meta(custom_signature=b"\x01" * 65)
+        items = [rlp.encode(field) for field in rlp.decode(self.tx712.encode()[1:])]
+
+        def raw(items, length_bytes=None):
+            payload = b"".join(items)
+            if length_bytes is None:
+                return b"\x71" + rlp.codec.length_prefix(len(payload), 0xC0) + payload
+            length = len(payload).to_bytes(length_bytes, byteorder="big")
+            return b"\x71" + bytes((0xF7 + length_bytes,)) + length + payload
+
+        Transaction712.decode(raw(items))
+        for malformed in (b"", "0x", b"\x71", raw(items)[:2]):
+            with self.assertRaises(ValueError):
+                Transaction712.decode(malformed)
+
+        # integer with a leading zero byte
+        with self.assertRaises(ValueError):
+            Transaction712.decode(raw([b"\x82\x00\x05"] + items[1:]))
+        # single byte below 0x80 with a string prefix
+        with self.assertRaises(ValueError):
+            Transaction712.decode(raw(items[:5] + [b"\x81\x05"] + items[6:]))
+        # long form length below 56
+        with self.assertRaises(ValueError):
+            Transaction712.decode(raw(items[:6] + [b"\xb8\x03abc"] + items[7:]))
+        # long form length with a leading zero byte
+        with self.assertRaises(ValueError):
+            Transaction712.decode(raw(items, length_bytes=3))
+
+    def test_decode_keeps_signature_apart_from_meta(self):
+        account = Account.from_key(PRIVATE_KEY2)
+        signer = PrivateKeyEthSigner(account, self.CHAIN_ID)
+        signed = signer.sign_typed_data(self.tx712.to_eip712_struct())
+        raw = self.tx712.encode(signed)
+
+        decoded = Transaction712.decode(raw)
+        self.assertIsNone(decoded.meta.custom_signature)
+        self.assertEqual(decoded.signature, signed.signature)
+        self.assertEqual(raw, decoded.encode())
+        # signing the decoded transaction again replaces the signature
+        decoded.nonce += 1
+        resigned = signer.sign_typed_data(decoded.to_eip712_struct())
+        self.assertEqual(
+            Transaction712.decode(decoded.encode(resigned)).signature,
+            resigned.signature,
+        )
+
+    def test_decode_empty_to(self):
+        self.tx712.to = ""
+        self.tx712.meta = EIP712Meta(custom_signature=b"\x01" * 65)
+        raw = self.tx712.encode()
+        decoded = Transaction712.decode(raw)
+        self.assertIsNone(decoded.to)
+        self.assertEqual(raw, decoded.encode())
+        self.assertEqual(
+            self.tx712.to_eip712_struct().hash_struct(),
+            decoded.to_eip712_struct().hash_struct(),
+        )
@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from web3.exceptions import TransactionNotFound
+from web3.providers import BaseProvider
+
+from zksync2.core.types import TransactionResponse
+from zksync2.module.module_builder import ZkWeb3
+
+TRANSACTION = {
+    "hash": "0x" + "ab" * 32,
+    "nonce": "0x2a",
+    "blockHash": None,
+    "blockNumber": None,
+    "transactionIndex": None,
+    "l1BatchNumber": None,
+    "from": "0x1234512345123451234512345123451234512345",
+    "to": "0xcccccccccccccccccccccccccccccccccccccccc",
+    "value": "0xde0b6b3a7640000",
+    "gas": "0x5208",
+    "input": "0xcfe7af7c",
+    "type": "0x71",
+    "chainId": "0x10e",
+}
+
+
+class TransactionProvider(BaseProvider):
+    def make_request(self, method, params):
+        result = TRANSACTION if params[0] == TRANSACTION["hash"] else None
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+
+class TransactionResponseTests(TestCase):
+    def test_fields_are_parsed_on_access(self):
+        tx = TransactionResponse(TRANSACTION)
+        self.assertFalse(hasattr(tx, "__dict__"))
+        self.assertEqual(tx.nonce, 42)
+        self.assertEqual(tx.value, 10**18)
+        self.assertEqual(tx.type, 113)
+        self.assertIsNone(tx.block_number)
+        self.assertEqual(tx.to, "0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC")
+        self.assertEqual(tx.data, bytes.fromhex("cfe7af7c"))
+        self.assertEqual(tx["data"], "0xcfe7af7c")
+        self.assertEqual(dict(tx), TRANSACTION)
+
+    def test_eth_get_transaction_by_hash(self):
+        web3 = ZkWeb3(TransactionProvider())
+        tx = web3.zksync.eth_get_transaction_by_hash(TRANSACTION["hash"])
+        self.assertIsInstance(tx, TransactionResponse)
+        self.assertEqual(tx.hash.hex(), "ab" * 32)
+        self.assertEqual(tx.chain_id, 270)
+        with self.assertRaises(TransactionNotFound):
+            web3.zksync.eth_get_transaction_by_hash("0x" + "00" * 32)
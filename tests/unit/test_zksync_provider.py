@@ -0,0 +1,222 @@
+import asyncio
+import json
+import threading
+from unittest import TestCase
+
+from requests import Response, Session
+
+from zksync2.module.async_zksync_provider import AsyncZkSyncProvider
+from zksync2.module.zksync_provider import (
+    ConnectionPoolOptions,
+    ZkSyncProvider,
+    get_method_timeout,
+)
+
+URL = "http://node.test"
+TIMEOUTS = {"zks_getProof": 120.0}
+
+
+def _answer(data: bytes) -> bytes:
+    request = json.loads(data)
+    if isinstance(request, list):
+        # answered in reverse order, as a node may do
+        return json.dumps(
+            [{"jsonrpc": "2.0", "id": r["id"], "result": r["method"]} for r in request][
+                ::-1
+            ]
+        ).encode()
+    return json.dumps(
+        {"jsonrpc": "2.0", "id": request["id"], "result": request["method"]}
+    ).encode()
+
+
+class RecordingSession(Session):
+    def __init__(self, concurrent_requests: int = 1):
+        super().__init__()
+        self.timeouts = []
+        self.threads = set()
+        self.barrier = threading.Barrier(concurrent_requests)
+
+    def post(self, url, data=None, **kwargs):
+        self.timeouts.append(kwargs["timeout"])
+        self.threads.add(threading.get_ident())
+        self.barrier.wait(timeout=5)
+        response = Response()
+        response.status_code = 200
+        response._content = _answer(data)
+        return response
+
+
+class AsyncRecordingResponse:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self) -> bytes:
+        return self.content
+
+
+class AsyncRecordingSession:
+    closed = False
+    connector = None
+
+    def __init__(self):
+        self.timeouts = []
+
+    def post(self, url, data=None, **kwargs):
+        self.timeouts.append(kwargs["timeout"].total)
+        return AsyncRecordingResponse(_answer(data))
+
+    async def close(self):
+        self.closed = True
+
+    def detach(self):
+        self.closed = True
+
+
+class AsyncRecordingProvider(AsyncZkSyncProvider):
+    def _build_session(self):
+        return AsyncRecordingSession()
+
+
+class MethodTimeoutTests(TestCase):
+    def test_method_timeout(self):
+        self.assertEqual(get_method_timeout(("eth_call",), 30.0, TIMEOUTS), 30.0)
+        self.assertEqual(get_method_timeout(("zks_getProof",), 30.0, TIMEOUTS), 120.0)
+        self.assertEqual(get_method_timeout((), 30.0, TIMEOUTS), 30.0)
+
+    def test_batch_waits_for_its_slowest_method(self):
+        methods = ("eth_call", "zks_getProof")
+        self.assertEqual(get_method_timeout(methods, 30.0, TIMEOUTS), 120.0)
+        self.assertIsNone(get_method_timeout(methods, None, TIMEOUTS))
+
+
+class ZkSyncProviderTests(TestCase):
+    def test_pool_options_configure_the_adapter(self):
+        options = ConnectionPoolOptions(
+            pool_connections=3, pool_maxsize=7, pool_block=True, keep_alive=False
+        )
+        provider = ZkSyncProvider(URL, pool_options=options)
+        for scheme in ("http://", "https://"):
+            adapter = provider.session.get_adapter(scheme + "node.test")
+            self.assertEqual(adapter._pool_connections, 3)
+            self.assertEqual(adapter._pool_maxsize, 7)
+            self.assertTrue(adapter._pool_block)
+        self.assertEqual(provider.session.headers["Connection"], "close")
+
+    def test_requests_get_their_method_timeout(self):
+        session = RecordingSession()
+        provider = ZkSyncProvider(
+            URL, timeout=10.0, method_timeouts=TIMEOUTS, session=session
+        )
+        self.assertEqual(
+            provider.make_request("eth_chainId", [])["result"], "eth_chainId"
+        )
+        provider.make_request("zks_getProof", [])
+        responses = provider.make_batch_request(
+            [("eth_chainId", []), ("zks_getProof", [])]
+        )
+        self.assertEqual(
+            [r["result"] for r in responses], ["eth_chainId", "zks_getProof"]
+        )
+        self.assertEqual(session.timeouts, [10.0, 120.0, 120.0])
+
+    def test_every_thread_uses_the_session(self):
+        session = RecordingSession(concurrent_requests=4)
+        provider = ZkSyncProvider(URL, session=session)
+        threads = [
+            threading.Thread(target=provider.make_request, args=("eth_chainId", []))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(session.timeouts), 4)
+        self.assertEqual(len(session.threads), 4)
+
+
+class AsyncZkSyncProviderTests(TestCase):
+    def test_pool_options_configure_the_connector(self):
+        async def build(options):
+            provider = AsyncZkSyncProvider(URL, pool_options=options)
+            session = provider._pooled_session()
+            self.assertIs(provider._pooled_session(), session)
+            connector = session.connector
+            await session.close()
+            return connector
+
+        connector = asyncio.run(
+            build(ConnectionPoolOptions(pool_connections=3, pool_maxsize=7))
+        )
+        self.assertEqual(connector.limit, 21)
+        self.assertEqual(connector.limit_per_host, 7)
+        self.assertFalse(connector.force_close)
+        connector = asyncio.run(build(ConnectionPoolOptions(keep_alive=False)))
+        self.assertTrue(connector.force_close)
+
+    def test_requests_get_their_method_timeout(self):
+        provider = AsyncRecordingProvider(URL, timeout=10.0, method_timeouts=TIMEOUTS)
+
+        async def send():
+            await provider.make_request("eth_chainId", [])
+            await provider.make_request("zks_getProof", [])
+            responses = await provider.make_batch_request(
+                [("eth_chainId", []), ("zks_getProof", [])]
+            )
+            return provider._pooled_session(), responses
+
+        session, responses = asyncio.run(send())
+        self.assertEqual(
+            [r["result"] for r in responses], ["eth_chainId", "zks_getProof"]
+        )
+        self.assertEqual(session.timeouts, [10.0, 120.0, 120.0])
+
+    def test_one_session_per_event_loop(self):
+        provider = AsyncRecordingProvider(URL)
+
+        async def session():
+            await provider.make_request("eth_chainId", [])
+            return provider._pooled_session()
+
+        first = asyncio.run(session())
+        second = asyncio.run(session())
+        self.assertIsNot(first, second)
+        self.assertEqual(len(provider._pooled_sessions), 1)
+
+    def test_disconnect_closes_the_sessions_of_every_loop(self):
+        provider = AsyncZkSyncProvider(URL)
+
+        async def session():
+            return provider._pooled_session()
+
+        # a loop running in another thread
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+            on_other_loop = asyncio.run_coroutine_threadsafe(
+                session(), other_loop
+            ).result()
+            # a loop closed by asyncio.run
+            on_closed_loop = asyncio.run(session())
+
+            async def disconnect():
+                current = await session()
+                await provider.disconnect()
+                return current
+
+            current = asyncio.run(disconnect())
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+
+        for closed in (on_other_loop, on_closed_loop, current):
+            self.assertTrue(closed.closed)
+        self.assertEqual(provider._pooled_sessions, {})
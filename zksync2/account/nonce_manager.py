@@ -0,0 +1,239 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterator, Optional, Set, Tuple
+
+from eth_typing import HexStr
+from web3 import Web3
+
+from zksync2.core.types import ZkBlockParams
+
+
+_NONCE_ERROR_MESSAGES = ("nonce too low", "nonce too high", "nonce is too")
+
+
+def is_nonce_error(error: BaseException) -> bool:
+    """
+    Returns True if the node rejected a transaction because of its nonce.
+
+    Nodes report nonce errors with the generic ``-32000`` code shared by many other errors,
+    so the message of the JSON-RPC error is matched instead.
+    """
+    message = str(error)
+    rpc_response = getattr(error, "rpc_response", None)
+    if isinstance(rpc_response, dict) and isinstance(rpc_response.get("error"), dict):
+        message = rpc_response["error"].get("message", message)
+    elif len(error.args) > 0 and isinstance(error.args[0], dict):
+        message = error.args[0].get("message", message)
+    message = message.lower()
+    return any(part in message for part in _NONCE_ERROR_MESSAGES)
+
+
+@dataclass(frozen=True)
+class NonceReservation:
+    """
+    Nonce handed out by ``NonceManager.acquire``, reported back with ``NonceManager.failed``
+    if its transaction is not accepted.
+    """
+
+    nonce: int
+    # resync count of the manager when the nonce was handed out
+    generation: int
+
+
+class NonceManager:
+    """
+    Hands out the nonces of one account locally, so concurrent senders never share a nonce
+    and a transaction does not cost a ``get_transaction_count`` request.
+
+    The first reservation reads the pending nonce of the account from the node, next ones
+    count from there. Nonces of transactions that failed to be submitted are released and
+    handed out again first, so no gap is left. The count is read again from the node after
+    ``resync``, which ``reservation`` calls when the node rejects a nonce, for example when
+    the account also sent transactions without this manager.
+
+    Reservations are guarded by a lock, ``reserve`` can be called from any thread and
+    ``async_reserve`` from coroutines.
+
+    Example:
+        wallet.nonce_manager = NonceManager(zksync_web3.zksync, account.address)
+
+        with wallet.nonce_manager.reservation() as nonce:
+            tx_hash = zksync_web3.zksync.send_raw_transaction(sign(build(nonce)))
+
+    :param zksync: ``ZkSync`` or ``AsyncZkSync`` module used to read the account nonce.
+    :param address: Address of the account.
+    :param block_tag: Block tag the account nonce is read at.
+    """
+
+    def __init__(
+        self, zksync, address: HexStr, block_tag: str = ZkBlockParams.PENDING.value
+    ):
+        self._zksync = zksync
+        self.address = Web3.to_checksum_address(address)
+        self.block_tag = block_tag
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._next: Optional[int] = None
+        self._released: Set[int] = set()
+        self._generation = 0
+        # count request shared by the coroutines waiting for it
+        self._async_sync: Optional[asyncio.Future] = None
+
+    def _take(self) -> Optional[int]:
+        if self._next is None:
+            return None
+        if len(self._released) > 0:
+            nonce = min(self._released)
+            self._released.remove(nonce)
+            return nonce
+        nonce = self._next
+        self._next += 1
+        return nonce
+
+    def _synced(self, generation: int, count: int):
+        if self._next is None and self._generation == generation:
+            self._next = count
+
+    def reserve(self) -> int:
+        """
+        Returns the next nonce of the account, reading it from the node if not known.
+        """
+        return self._reserve()[0]
+
+    async def async_reserve(self) -> int:
+        """
+        asyncio counterpart of ``reserve``, the manager must be built on ``AsyncZkSync``.
+        """
+        return (await self._async_reserve())[0]
+
+    def acquire(self) -> NonceReservation:
+        """
+        Reserves the next nonce like ``reserve``, for transactions submitted outside of
+        ``reservation``. Report the reservation to ``failed`` if its transaction is not
+        accepted.
+        """
+        return NonceReservation(*self._reserve())
+
+    def failed(self, reservation: NonceReservation, error: BaseException):
+        """
+        Reports that the transaction of a reservation was not accepted. Its nonce is
+        released, or the manager resynchronized if the node rejected the nonce. Reservations
+        made before a resync are ignored, so failures of many transactions sent at once
+        resync only once.
+
+        :param reservation: Reservation returned by ``acquire``.
+        :param error: Error raised by the submission.
+        """
+        self._failed(reservation.nonce, reservation.generation, error)
+
+    def _reserve(self) -> Tuple[int, int]:
+        while True:
+            with self._lock:
+                nonce = self._take()
+                if nonce is not None:
+                    return nonce, self._generation
+            # threads missing the count wait for a single request
+            with self._sync_lock:
+                with self._lock:
+                    if self._next is not None:
+                        continue
+                    generation = self._generation
+                count = self._zksync.get_transaction_count(self.address, self.block_tag)
+                with self._lock:
+                    self._synced(generation, count)
+
+    async def _async_reserve(self) -> Tuple[int, int]:
+        # _lock is shared with threads calling reserve, it is never held across an await
+        while True:
+            with self._lock:
+                nonce = self._take()
+                if nonce is not None:
+                    return nonce, self._generation
+                sync = self._async_sync
+                if sync is None:
+                    sync = asyncio.ensure_future(
+                        self._async_sync_count(self._generation)
+                    )
+                    self._async_sync = sync
+            # shielded, so a cancelled waiter does not cancel the others' request
+            await asyncio.shield(sync)
+
+    async def _async_sync_count(self, generation: int):
+        try:
+            count = await self._zksync.get_transaction_count(
+                self.address, self.block_tag
+            )
+            with self._lock:
+                self._synced(generation, count)
+        finally:
+            with self._lock:
+                self._async_sync = None
+
+    def release(self, nonce: int):
+        """
+        Gives back a nonce reserved since the last ``resync`` whose transaction was not
+        submitted, it is handed out again before any new one.
+
+        :param nonce: The reserved nonce.
+        """
+        with self._lock:
+            self._release(nonce, self._generation)
+
+    def _release(self, nonce: int, generation: int):
+        # nonces reserved before a resync are counted by the node already
+        if generation != self._generation or self._next is None:
+            return
+        if nonce >= self._next or nonce in self._released:
+            raise ValueError(f"Nonce {nonce} is not reserved")
+        self._released.add(nonce)
+        while self._next - 1 in self._released:
+            self._released.remove(self._next - 1)
+            self._next -= 1
+
+    def resync(self):
+        """
+        Forgets the local count, the next reservation reads the nonce from the node.
+        """
+        with self._lock:
+            self._resync()
+
+    def _resync(self):
+        self._next = None
+        self._released.clear()
+        self._generation += 1
+
+    @contextmanager
+    def reservation(self) -> Iterator[int]:
+        """
+        Reserves a nonce for the enclosed submission. If the block raises, the nonce is
+        released, or the manager resynchronized when the node rejected the nonce.
+        """
+        nonce, generation = self._reserve()
+        try:
+            yield nonce
+        except BaseException as e:
+            self._failed(nonce, generation, e)
+            raise
+
+    @asynccontextmanager
+    async def async_reservation(self) -> AsyncIterator[int]:
+        """
+        asyncio counterpart of ``reservation``.
+        """
+        nonce, generation = await self._async_reserve()
+        try:
+            yield nonce
+        except BaseException as e:
+            self._failed(nonce, generation, e)
+            raise
+
+    def _failed(self, nonce: int, generation: int, error: BaseException):
+        with self._lock:
+            if generation != self._generation:
+                return
+            if is_nonce_error(error):
+                self._resync()
+            else:
+                self._release(nonce, generation)
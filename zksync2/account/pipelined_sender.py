@@ -0,0 +1,364 @@
+import math
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import replace
+from typing import Dict, List, Optional, Tuple, Union
+
+from hexbytes import HexBytes
+
+from zksync2.account.nonce_manager import NonceReservation
+from zksync2.core.cache import FeeEstimateCache
+from zksync2.core.types import (
+    Fee,
+    TransactionOptions,
+    TransferTransaction,
+    ZkBlockParams,
+)
+from zksync2.signer.eth_signer import PrivateKeyEthSigner
+from zksync2.transaction.transaction712 import Transaction712
+
+
+class PipelinedSender:
+    """
+    Sends the L2 transfers of a wallet with two round trips each, and many of them at once.
+
+    ``WalletL2.transfer`` waits for the nonce, the gas price, the fee estimation and the
+    submission one after the other. Here the nonce, unless the wallet has a ``NonceManager``,
+    and the fee estimation are requested in a single JSON-RPC batch, the gas price is not
+    requested as the fee estimation provides it. Fees are derived by the ``fee_model`` of the
+    ZkSync module and estimations reused from its ``fee_estimates`` cache when those are set,
+    leaving nothing to request for same shape transfers. Transfers are built, signed and
+    submitted in a pool of worker threads, so the requests and the signing of concurrent
+    transfers overlap. Requests go through the provider of the wallet, configure it with
+    ``ConnectionPoolOptions`` so workers do not wait for a connection.
+
+    Concurrent transfers without nonce should use a wallet with a ``NonceManager``, otherwise
+    they may read the same nonce from the node.
+
+    Example:
+        wallet.nonce_manager = NonceManager(zksync_web3.zksync, account.address)
+        with PipelinedSender(wallet) as sender:
+            futures = [sender.submit(tx) for tx in transfers]
+            tx_hashes = [future.result() for future in futures]
+
+    :param wallet: ``WalletL2`` (or ``Wallet``) sending the transfers.
+    :param max_workers: Number of transfers processed at once.
+    """
+
+    def __init__(self, wallet, max_workers: int = 8):
+        self._wallet = wallet
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="PipelinedSender"
+        )
+        # signer of transfer_many, keeping its signing processes between calls
+        self._signer: Optional[PrivateKeyEthSigner] = None
+
+    def __enter__(self) -> "PipelinedSender":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """
+        Waits for the submitted transfers and stops the workers and signing processes.
+        """
+        self._executor.shutdown(wait=True)
+        if self._signer is not None:
+            self._signer.close()
+
+    def submit(self, tx: TransferTransaction) -> "Future[HexBytes]":
+        """
+        Queues a transfer, the returned future holds its transaction hash.
+
+        :param tx: TransferTransaction class. Required parameters are to and amount.
+        """
+        return self._executor.submit(self.transfer, tx)
+
+    def transfer(self, tx: TransferTransaction) -> HexBytes:
+        """
+        Sends a transfer from the calling thread and returns its transaction hash.
+
+        :param tx: TransferTransaction class. Required parameters are to and amount.
+        """
+        options = tx.options or TransactionOptions()
+        manager = self._wallet.nonce_manager
+        if manager is not None and options.nonce is None:
+            reservation = manager.reservation()
+        else:
+            reservation = nullcontext(options.nonce)
+        with reservation as nonce:
+            tx_712 = self.build(tx, nonce)
+            return self.send(tx_712)
+
+    def transfer_many(
+        self,
+        transfers: List[TransferTransaction],
+        signing_workers: Optional[int] = None,
+        gas_limit_multiplier: float = 1.2,
+    ) -> List[Union[HexBytes, Exception]]:
+        """
+        Sends many transfers and returns, in their order, the transaction hash of each one or
+        the error that stopped it. A transfer that could not be populated or estimated does not
+        stop the others.
+
+        Transfers are populated without any request and their fee estimated once per shape,
+        that is per transferred token and paymaster, and per recipient for base token
+        transfers, all estimations in one JSON-RPC batch.
+        Nonces are then assigned in order to the transfers without one, from the
+        ``NonceManager`` of the wallet if set, otherwise counting from the nonce read once.
+        All transfers are signed at once and submitted one after the other, so the node never
+        receives a nonce before the previous one.
+
+        Once a transfer with an assigned nonce fails to be submitted, the following transfers
+        with assigned nonces are not sent, they would wait behind the missing nonce, and get a
+        ``RuntimeError``. Their nonces are then reported to the ``NonceManager``: they are
+        released for the next transactions, or the manager is resynchronized once if the node
+        rejected the nonce.
+
+        :param transfers: The transfers.
+        :param signing_workers: Number of processes the signing is spread over, see
+            ``PrivateKeyEthSigner.sign_many``.
+        :param gas_limit_multiplier: Factor applied to the estimated gas limit, reused for
+            other recipients. Unused for estimations kept in ``fee_estimates``.
+        """
+        zksync = self._wallet._zksync_web3.zksync
+        results: List[Union[HexBytes, Exception, None]] = [None] * len(transfers)
+        prepared: List[Tuple[int, Transaction712]] = []
+        for i, tx in enumerate(transfers):
+            try:
+                nonce = (tx.options or TransactionOptions()).nonce
+                prepared.append((i, self.prepare(tx, nonce)))
+            except Exception as e:
+                results[i] = e
+
+        groups: Dict[str, List[Tuple[int, Transaction712]]] = {}
+        for i, tx_712 in prepared:
+            if self.needs_fee(tx_712):
+                key = FeeEstimateCache.key(tx_712.to_zk_transaction())
+                groups.setdefault(key, []).append((i, tx_712))
+        for group, fee in zip(
+            groups.values(), self._estimate_groups(groups, gas_limit_multiplier)
+        ):
+            for i, tx_712 in group:
+                if isinstance(fee, Exception):
+                    results[i] = fee
+                else:
+                    self.apply_fee(tx_712, fee)
+
+        ready = [(i, tx_712) for i, tx_712 in prepared if results[i] is None]
+        unassigned = [(i, tx_712) for i, tx_712 in ready if tx_712.nonce is None]
+        assigned = self._assign_nonces([tx_712 for _, tx_712 in unassigned])
+        if isinstance(assigned, Exception):
+            for i, _ in unassigned:
+                results[i] = assigned
+            ready = [(i, tx_712) for i, tx_712 in ready if results[i] is None]
+            assigned = []
+        # reservations from the nonce manager, by transfer index
+        reserved = {i: r for (i, _), r in zip(unassigned, assigned)}
+        assigned_indexes = {i for i, _ in unassigned}
+        if len(ready) == 0:
+            return results
+
+        if self._signer is None or self._signer.chain_id != zksync.chain_id:
+            if self._signer is not None:
+                self._signer.close()
+            self._signer = PrivateKeyEthSigner(
+                self._wallet._l1_account, zksync.chain_id
+            )
+        try:
+            signed = self._signer.sign_many(
+                [tx_712 for _, tx_712 in ready], max_workers=signing_workers
+            )
+        except Exception as e:
+            for i, _ in ready:
+                results[i] = e
+        else:
+            # the node would hold transactions after a missing nonce
+            failed_nonce = None
+            for (i, tx_712), msg in zip(ready, signed):
+                if failed_nonce is not None and i in assigned_indexes:
+                    results[i] = RuntimeError(
+                        f"Not sent, the transfer with nonce {failed_nonce} failed"
+                    )
+                    continue
+                try:
+                    results[i] = zksync.send_raw_transaction(msg)
+                except Exception as e:
+                    results[i] = e
+                    if failed_nonce is None and i in assigned_indexes:
+                        failed_nonce = tx_712.nonce
+
+        # reported once every submission is done, so a rejected nonce resyncs only once
+        manager = self._wallet.nonce_manager
+        for i, reservation in reserved.items():
+            if isinstance(results[i], Exception):
+                manager.failed(reservation, results[i])
+        return results
+
+    def _estimate_groups(
+        self,
+        groups: Dict[str, List[Tuple[int, Transaction712]]],
+        gas_limit_multiplier: float,
+    ) -> List[Union[Fee, Exception]]:
+        # the first transfer of each group is estimated for all of them
+        zksync = self._wallet._zksync_web3.zksync
+        zk_txs = [group[0][1].to_zk_transaction() for group in groups.values()]
+        fees: List[Union[Fee, Exception, None]] = []
+        for zk_tx in zk_txs:
+            try:
+                fees.append(zksync.cached_fee_estimate(zk_tx))
+            except Exception as e:
+                fees.append(e)
+        missing = [j for j, fee in enumerate(fees) if fee is None]
+        if len(missing) == 0:
+            return fees
+
+        with zksync.batch() as batch:
+            for j in missing:
+                batch.add(zksync.zks_estimate_fee(zk_txs[j]))
+            estimates = batch.execute(raise_on_error=False)
+        for j, estimate in zip(missing, estimates):
+            if isinstance(estimate, Exception):
+                fees[j] = estimate
+            elif zksync.fee_estimates is not None:
+                fees[j] = zksync.store_fee_estimate(zk_txs[j], estimate)
+            else:
+                fees[j] = replace(
+                    estimate,
+                    gas_limit=math.ceil(estimate.gas_limit * gas_limit_multiplier),
+                )
+        return fees
+
+    def _assign_nonces(
+        self, txs: List[Transaction712]
+    ) -> Union[List[NonceReservation], Exception]:
+        # returns the reservations of the nonces taken from the manager, in order
+        manager = self._wallet.nonce_manager
+        if len(txs) == 0:
+            return []
+        if manager is None:
+            zksync = self._wallet._zksync_web3.zksync
+            try:
+                # pending transactions of the account already hold the latest nonces
+                nonce = zksync.get_transaction_count(
+                    self._wallet._l1_account.address, ZkBlockParams.PENDING.value
+                )
+            except Exception as e:
+                return e
+            for tx_712 in txs:
+                tx_712.nonce = nonce
+                nonce += 1
+            return []
+
+        reservations = []
+        try:
+            for tx_712 in txs:
+                reservation = manager.acquire()
+                reservations.append(reservation)
+                tx_712.nonce = reservation.nonce
+        except Exception as e:
+            for reservation in reservations:
+                manager.failed(reservation, e)
+            for tx_712 in txs:
+                tx_712.nonce = None
+            return e
+        return reservations
+
+    def build(self, tx: TransferTransaction, nonce: Optional[int]) -> Transaction712:
+        """
+        Returns the populated transfer, requesting the missing nonce and fees in one batch.
+
+        :param tx: The transfer.
+        :param nonce: Nonce of the transaction, read from the node if None.
+        """
+        zksync = self._wallet._zksync_web3.zksync
+        from_ = self._wallet._l1_account.address
+        tx_712 = self.prepare(tx, nonce)
+        needs_fee = self.needs_fee(tx_712)
+        zk_tx = tx_712.to_zk_transaction()
+        if needs_fee:
+            fee = zksync.cached_fee_estimate(zk_tx)
+            if fee is not None:
+                self.apply_fee(tx_712, fee)
+                needs_fee = False
+        if nonce is not None and not needs_fee:
+            return tx_712
+
+        with zksync.batch() as batch:
+            if nonce is None:
+                # the pending count skips the nonces of queued transactions
+                batch.add(
+                    zksync.get_transaction_count(from_, ZkBlockParams.PENDING.value)
+                )
+            if needs_fee:
+                batch.add(zksync.zks_estimate_fee(zk_tx))
+        results = list(batch.results)
+        if nonce is None:
+            tx_712.nonce = results.pop(0)
+        if needs_fee:
+            self.apply_fee(tx_712, zksync.store_fee_estimate(zk_tx, results.pop(0)))
+        return tx_712
+
+    def prepare(self, tx: TransferTransaction, nonce: Optional[int]) -> Transaction712:
+        """
+        Returns the transfer populated without any request, fees from the ``fee_model`` of
+        the ZkSync module if set, zero otherwise.
+
+        :param tx: The transfer.
+        :param nonce: Nonce of the transaction.
+        """
+        zksync = self._wallet._zksync_web3.zksync
+        options = replace(
+            tx.options or TransactionOptions(),
+            # placeholders keeping get_transfer_transaction from requesting them
+            nonce=0 if nonce is None else nonce,
+            gas_price=0,
+        )
+        transaction = zksync.get_transfer_transaction(
+            replace(tx, options=options), self._wallet._l1_account.address
+        )
+        tx_712: Transaction712 = transaction.tx712(transaction.tx["gas"])
+        tx_712.nonce = nonce
+        if zksync.fee_model is not None and tx_712.maxFeePerGas == 0:
+            self.apply_fee(tx_712, zksync.fee_model.fee())
+        return tx_712
+
+    def needs_fee(self, tx_712: Transaction712) -> bool:
+        """
+        Returns True if the gas limit or fees of the prepared transaction must be estimated.
+
+        :param tx_712: The transaction.
+        """
+        if self._wallet._zksync_web3.zksync.fee_model is not None:
+            return tx_712.gas_limit == 0
+        return (
+            tx_712.gas_limit == 0
+            or tx_712.maxFeePerGas == 0
+            or tx_712.maxPriorityFeePerGas == 0
+        )
+
+    @staticmethod
+    def apply_fee(tx_712: Transaction712, fee: Fee):
+        """
+        Fills the gas limit and fees of the transaction that are not set.
+
+        :param tx_712: The transaction.
+        :param fee: Estimated fee.
+        """
+        tx_712.gas_limit = tx_712.gas_limit or fee.gas_limit
+        tx_712.maxFeePerGas = tx_712.maxFeePerGas or fee.max_fee_per_gas
+        tx_712.maxPriorityFeePerGas = (
+            tx_712.maxPriorityFeePerGas or fee.max_priority_fee_per_gas
+        )
+
+    def send(self, tx_712: Transaction712) -> HexBytes:
+        """
+        Signs the populated transaction and submits it.
+
+        :param tx_712: The transaction.
+        """
+        signer = PrivateKeyEthSigner(self._wallet._l1_account, tx_712.chain_id)
+        signed_message = signer.sign_typed_data(tx_712.to_eip712_struct())
+        msg = tx_712.encode(signed_message)
+        return self._wallet._zksync_web3.zksync.send_raw_transaction(msg)
@@ -81,8 +81,8 @@ class SmartAccount:
     def sign_transaction(self, tx: TxBase) -> bytes:
         populated = self.populate_transaction(tx)
         populated.meta.custom_signature = self.payload_signer(
-            populated.to_eip712_struct().signable_bytes(
-                PrivateKeyEthSigner.get_default_domain(self.provider.eth.chain_id)
+            PrivateKeyEthSigner.get_signable_bytes(
+                populated.to_eip712_struct(), populated.chain_id
             ),
             self._secret,
             self.provider,
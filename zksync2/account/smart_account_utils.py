@@ -15,7 +15,7 @@ from zksync2.transaction.transaction_builders import TxBase
 
 def sign_payload_with_ecdsa(payload: bytes, secret, provider: Web3) -> string:
     account: LocalAccount = Account.from_key(secret)
-    signer = PrivateKeyEthSigner(account, provider.eth.chain_id)
+    signer = PrivateKeyEthSigner(account, provider.zksync.chain_id)
 
     return signer.sign_message(payload).signature
 
@@ -24,7 +24,7 @@ def sign_payload_with_multiple_ecdsa(payload: bytes, secrets: [str], provider):
     signatures = []
     for secret in secrets:
         account: LocalAccount = Account.from_key(secret)
-        signer = PrivateKeyEthSigner(account, provider.eth.chain_id)
+        signer = PrivateKeyEthSigner(account, provider.zksync.chain_id)
         signatures.append(signer.sign_message(payload).signature)
     return b"".join(signatures)
 
@@ -35,7 +35,7 @@ def populate_transaction_ecdsa(
     if provider is None:
         raise ValueError(f"Must be True or False. Got: {provider}")
 
-    tx.tx["chainId"] = provider.eth.chain_id
+    tx.tx["chainId"] = provider.zksync.chain_id
     tx.tx["gas"] = tx.tx["gas"] or 0
     tx.tx["value"] = tx.tx["value"] or 0
     tx.tx["data"] = tx.tx["data"] or 0
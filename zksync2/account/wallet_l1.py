@@ -1,11 +1,13 @@
-from typing import Union, Type
+from typing import Dict, List, Optional, Tuple, Type, Union
 
 from eth_abi import encode
 from eth_account.signers.base import BaseAccount
 from eth_typing import HexStr, Address
 from eth_utils import event_signature_to_log_topic, add_0x_prefix
+from hexbytes import HexBytes
 from web3 import Web3
 from web3.contract import Contract
+from web3.exceptions import ContractLogicError
 from web3.middleware import ExtraDataToPOAMiddleware
 from web3.types import TxReceipt
 
@@ -47,7 +49,7 @@ from zksync2.manage_contracts.utils import (
     l1_shared_bridge_abi_default,
     bridgehub_abi_default,
     get_zksync_hyperchain,
-    l2_shared_bridge_abi_default,
+    multicall3_abi_default,
 )
 from zksync2.module.module_builder import ZkWeb3
 from zksync2.module.request_types import EIP712Meta
@@ -83,6 +85,25 @@ class WalletL1:
         self.bridge_addresses: BridgeAddresses = (
             self._zksync_web3.zksync.zks_get_bridge_contracts()
         )
+        self._bridgehub_contract = None
+
+    def _l1_chain_id(self) -> int:
+        # chain of the L1 provider the transactions are sent to, several of them may share
+        # the metadata of the L2 chain
+        provider = self._eth_web3.provider
+        endpoint = getattr(provider, "endpoint_uri", None) or id(provider)
+        return self._zksync_web3.zksync.cached_chain_metadata(
+            f"eth_chain_id:{endpoint}", self._fetch_l1_chain_id
+        )
+
+    def _fetch_l1_chain_id(self) -> int:
+        chain_id = self._eth_web3.eth.chain_id
+        expected = self._zksync_web3.zksync.zks_l1_chain_id()
+        if chain_id != expected:
+            raise ValueError(
+                f"L1 provider is on chain {chain_id}, the L2 chain settles on {expected}"
+            )
+        return chain_id
 
     @property
     def main_contract(self) -> Union[Type[Contract], Contract]:
@@ -116,12 +137,82 @@ class WalletL1:
 
     def _finalize_withdrawal_params(self, withdraw_hash, index: int) -> dict:
         tx_receipt = self._zksync_web3.zksync.get_transaction_receipt(withdraw_hash)
-        log, l1_batch_tx_id = self._get_withdraw_log(tx_receipt, index)
         l2_to_l1_log_index, _ = self._get_withdraw_l2_to_l1_log(tx_receipt, index)
-        sender = add_0x_prefix(HexStr(log["topics"][1][12:].hex()))
         proof: ZksMessageProof = self._zksync_web3.zksync.zks_get_log_proof(
             withdraw_hash, l2_to_l1_log_index
         )
+        return self._withdrawal_params(tx_receipt, proof, index)
+
+    def _finalize_withdrawals_params(
+        self, withdraw_hashes: List[HexStr], index: int, batch_size: int
+    ) -> List[Union[dict, Exception]]:
+        # a withdrawal whose receipt, log or proof could not be read gets the error
+        zksync = self._zksync_web3.zksync
+        params: List[Union[dict, Exception]] = []
+        for start in range(0, len(withdraw_hashes), batch_size):
+            hashes = withdraw_hashes[start : start + batch_size]
+            with zksync.batch() as batch:
+                for withdraw_hash in hashes:
+                    batch.add(zksync.get_transaction_receipt(withdraw_hash))
+                receipts = batch.execute(raise_on_error=False)
+            chunk: List[Union[Tuple[TxReceipt, int], Exception]] = []
+            for tx_receipt in receipts:
+                if isinstance(tx_receipt, Exception):
+                    chunk.append(tx_receipt)
+                    continue
+                try:
+                    l2_to_l1_log_index, _ = self._get_withdraw_l2_to_l1_log(
+                        tx_receipt, index
+                    )
+                    chunk.append((tx_receipt, l2_to_l1_log_index))
+                except Exception as e:
+                    chunk.append(e)
+
+            proving = [
+                (k, withdraw_hash, item[1])
+                for k, (withdraw_hash, item) in enumerate(zip(hashes, chunk))
+                if not isinstance(item, Exception)
+            ]
+            if len(proving) > 0:
+                with zksync.batch() as batch:
+                    for _, withdraw_hash, l2_to_l1_log_index in proving:
+                        batch.add(
+                            zksync.zks_get_log_proof(withdraw_hash, l2_to_l1_log_index)
+                        )
+                    proofs = batch.execute(raise_on_error=False)
+                for (k, _, _), proof in zip(proving, proofs):
+                    try:
+                        if isinstance(proof, Exception):
+                            raise proof
+                        if proof is None:
+                            raise ValueError(
+                                f"Log proof of withdrawal {hashes[k]} is not available"
+                            )
+                        chunk[k] = self._withdrawal_params(chunk[k][0], proof, index)
+                    except Exception as e:
+                        chunk[k] = e
+            params.extend(chunk)
+        return params
+
+    def _resolve_l1_bridges(
+        self, params: List[Union[dict, Exception]]
+    ) -> Dict[HexStr, Union[Tuple[Contract, bool], Exception]]:
+        # L1 bridge of every distinct L2 bridge, or the error resolving it
+        bridges = {}
+        for p in params:
+            if isinstance(p, Exception) or p["sender"] in bridges:
+                continue
+            try:
+                bridges[p["sender"]] = self._resolve_l1_bridge(p["sender"])
+            except Exception as e:
+                bridges[p["sender"]] = e
+        return bridges
+
+    def _withdrawal_params(
+        self, tx_receipt: TxReceipt, proof: ZksMessageProof, index: int
+    ) -> dict:
+        log, l1_batch_tx_id = self._get_withdraw_log(tx_receipt, index)
+        sender = add_0x_prefix(HexStr(log["topics"][1][12:].hex()))
         bytes_data = to_bytes(log["data"])
         msg = self._zksync_web3.codec.decode(["bytes"], bytes_data)[0]
         l1_batch_number = int(log["l1BatchNumber"], 16)
@@ -135,13 +226,36 @@ class WalletL1:
             "proof": proof.proof,
         }
 
+    def _resolve_l1_bridge(self, sender: HexStr) -> Tuple[Contract, bool]:
+        """
+        Returns the L1 bridge finalizing withdrawals sent by the L2 bridge ``sender``, and
+        whether it is a legacy bridge.
+        """
+        if sender == L2_BASE_TOKEN_ADDRESS:
+            return self.get_l1_bridge_contracts().shared, False
+        info = self._zksync_web3.zksync.l2_bridge_info(sender)
+        if info.is_legacy:
+            abi = l1_bridge_abi_default()
+        else:
+            abi = l1_shared_bridge_abi_default()
+        l1_bridge = self._eth_web3.eth.contract(
+            address=Web3.to_checksum_address(info.l1_bridge), abi=abi
+        )
+        return l1_bridge, info.is_legacy
+
     def get_bridgehub_contract(self) -> Union[Type[Contract], Contract]:
         """Returns Contract wrapper of the bridgehub smart contract."""
-        address = self._zksync_web3.zksync.zks_get_bridgehub_contract_address()
-
-        return self._eth_web3.eth.contract(
-            address=Web3.to_checksum_address(address), abi=bridgehub_abi_default()
+        address = Web3.to_checksum_address(
+            self._zksync_web3.zksync.zks_get_bridgehub_contract_address()
         )
+        if (
+            self._bridgehub_contract is None
+            or self._bridgehub_contract.address != address
+        ):
+            self._bridgehub_contract = self._eth_web3.eth.contract(
+                address=address, abi=bridgehub_abi_default()
+            )
+        return self._bridgehub_contract
 
     def get_l1_bridge_contracts(self) -> L1BridgeContracts:
         """Returns L1 bridge contract wrappers."""
@@ -166,11 +280,14 @@ class WalletL1:
 
     def get_base_token(self) -> HexStr:
         """Returns the address of the base token on L1."""
+        zksync = self._zksync_web3.zksync
 
-        bridgehub = self.get_bridgehub_contract()
-        chain_id = self._zksync_web3.eth.chain_id
-
-        return bridgehub.functions.baseToken(chain_id).call()
+        return zksync.cached_chain_metadata(
+            "bridgehub_base_token",
+            lambda: self.get_bridgehub_contract()
+            .functions.baseToken(zksync.chain_id)
+            .call(),
+        )
 
     def is_eth_based_chain(self) -> bool:
         """Returns whether the chain is ETH-based."""
@@ -194,7 +311,7 @@ class WalletL1:
                 address=Web3.to_checksum_address(token), abi=get_erc20_abi()
             )
             return token_contract.functions.balanceOf(self.address).call(
-                {"chainId": self._eth_web3.eth.chain_id, "from": self.address}
+                {"chainId": self._l1_chain_id(), "from": self.address}
             )
 
     def get_allowance_l1(self, token: HexStr, bridge_address: Address = None):
@@ -213,7 +330,7 @@ class WalletL1:
             bridge_address = bridge_contracts.shared.address
         return token_contract.functions.allowance(self.address, bridge_address).call(
             {
-                "chainId": self._eth_web3.eth.chain_id,
+                "chainId": self._l1_chain_id(),
                 "from": self.address,
             }
         )
@@ -275,7 +392,7 @@ class WalletL1:
             # TODO: get the approve(bridgeAddress, amount) estimateGas transaction to put correct gas_limit
             gas_limit = RecommendedGasLimit.ERC20_APPROVE
         options = TransactionOptions(
-            chain_id=self._eth_web3.eth.chain_id,
+            chain_id=self._l1_chain_id(),
             gas_price=self._eth_web3.eth.gas_price,
             gas_limit=gas_limit,
             nonce=self._eth_web3.eth.get_transaction_count(self.address),
@@ -306,11 +423,11 @@ class WalletL1:
         if gas_price is None:
             gas_price = self._eth_web3.eth.gas_price
         options = TransactionOptions(
-            chain_id=self._eth_web3.eth.chain_id,
+            chain_id=self._l1_chain_id(),
             nonce=self._eth_web3.eth.get_transaction_count(self.address),
         )
         return bridge_hub.functions.l2TransactionBaseCost(
-            self._zksync_web3.eth.chain_id,
+            self._zksync_web3.zksync.chain_id,
             gas_price,
             l2_gas_limit,
             gas_per_pubdata_byte,
@@ -367,9 +484,7 @@ class WalletL1:
         self, transaction: DepositTransaction
     ):
         nonce = transaction.options.nonce if transaction.options is not None else None
-        bridge_hub = self.get_bridgehub_contract()
-        chain_id = self._zksync_web3.zksync.chain_id
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
         bridge_contracts = self.get_l1_bridge_contracts()
 
         tx, mint_value = self._get_deposit_base_token_on_non_eth_based_chain_tx(
@@ -448,9 +563,7 @@ class WalletL1:
         if transaction.token.lower() == LEGACY_ETH_ADDRESS:
             transaction.token = ETH_ADDRESS_IN_CONTRACTS
 
-        bridge_hub = self.get_bridgehub_contract()
-        chain_id = self._zksync_web3.zksync.chain_id
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
         is_eth_base_chain = base_token_address == ETH_ADDRESS_IN_CONTRACTS
 
         if is_eth_base_chain and is_address_eq(
@@ -499,7 +612,7 @@ class WalletL1:
         bridge_hub = self.get_bridgehub_contract()
         chain_id = self._zksync_web3.zksync.chain_id
         bridge_contracts = self.get_l1_bridge_contracts()
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
 
         tx = self._get_deposit_tx_with_defaults(transaction)
 
@@ -643,7 +756,7 @@ class WalletL1:
         bridge_hub = self.get_bridgehub_contract()
         chain_id = self._zksync_web3.zksync.chain_id
         shared_bridge = self.get_l1_bridge_contracts().shared
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
 
         tx = self._get_deposit_tx_with_defaults(transaction)
         mint_value = self._get_deposit_mint_value_eth_on_non_eth_based_chain_tx(tx)
@@ -813,7 +926,7 @@ class WalletL1:
         if transaction.to is None:
             transaction.to = self.address
         if transaction.options.chain_id is None:
-            transaction.options.chain_id = self._eth_web3.eth.chain_id
+            transaction.options.chain_id = self._l1_chain_id()
         if transaction.l2_gas_limit is None:
             transaction.l2_gas_limit = self._get_l2_gas_limit(transaction)
         if transaction.refund_recipient is None:
@@ -851,7 +964,7 @@ class WalletL1:
         )
 
         if transaction.options.chain_id is None:
-            transaction.options.chain_id = self._eth_web3.eth.chain_id
+            transaction.options.chain_id = self._l1_chain_id()
 
         l2_bridge_address = bridge.functions.l2BridgeAddress(
             transaction.options.chain_id
@@ -881,9 +994,7 @@ class WalletL1:
             transaction.token = ETH_ADDRESS_IN_CONTRACTS
         dummy_amount = 1
         transaction.amount = dummy_amount
-        bridge_hub = self.get_bridgehub_contract()
-        chain_id = self._zksync_web3.zksync.chain_id
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
         is_eth_based_chain = is_address_eq(base_token_address, ETH_ADDRESS_IN_CONTRACTS)
 
         tx = self._get_deposit_tx_with_defaults(transaction)
@@ -980,9 +1091,7 @@ class WalletL1:
         if transaction.token.lower() == LEGACY_ETH_ADDRESS:
             transaction.token = ETH_ADDRESS_IN_CONTRACTS
 
-        bridge_hub = self.get_bridgehub_contract()
-        chain_id = self._zksync_web3.zksync.chain_id
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
         is_eth_base_chain = base_token_address == ETH_ADDRESS_IN_CONTRACTS
 
         if is_eth_base_chain and is_address_eq(
@@ -1059,7 +1168,7 @@ class WalletL1:
             raise RuntimeError("Log proof not found!")
 
         options = TransactionOptions(
-            chain_id=self._eth_web3.eth.chain_id,
+            chain_id=self._l1_chain_id(),
             nonce=self._eth_web3.eth.get_transaction_count(self.address),
         )
         return l1_bridge.functions.claimFailedDeposit(
@@ -1167,34 +1276,13 @@ class WalletL1:
             merkle_proof.append(to_bytes(proof))
 
         options = TransactionOptions(
-            chain_id=self._eth_web3.eth.chain_id,
+            chain_id=self._l1_chain_id(),
             nonce=self._eth_web3.eth.get_transaction_count(self.address),
         )
 
-        l1_bridge: Contract
-        if params["sender"] == L2_BASE_TOKEN_ADDRESS:
-            l1_bridge = self.get_l1_bridge_contracts().shared
-        elif not self._zksync_web3.zksync.is_l2_bridge_legacy(params["sender"]):
-            l2_bridge = self._zksync_web3.eth.contract(
-                address=Web3.to_checksum_address(params["sender"]),
-                abi=l2_shared_bridge_abi_default(),
-            )
-            l1_bridge = self._eth_web3.eth.contract(
-                address=l2_bridge.functions.l1SharedBridge().call(),
-                abi=l1_shared_bridge_abi_default(),
-            )
-        else:
-            l2_bridge = self._zksync_web3.eth.contract(
-                address=Web3.to_checksum_address(params["sender"]),
-                abi=l2_bridge_abi_default(),
-            )
-            l1_bridge = self._eth_web3.eth.contract(
-                address=l2_bridge.functions.l1Bridge().call(),
-                abi=l1_bridge_abi_default(),
-            )
-
+        l1_bridge, _ = self._resolve_l1_bridge(params["sender"])
         tx = l1_bridge.functions.finalizeWithdrawal(
-            self._zksync_web3.eth.chain_id,
+            self._zksync_web3.zksync.chain_id,
             params["l1_batch_number"],
             params["l2_message_index"],
             params["l2_tx_number_in_block"],
@@ -1206,6 +1294,92 @@ class WalletL1:
         tx_hash = self._eth_web3.eth.send_raw_transaction(signed.raw_transaction)
         return tx_hash
 
+    def finalize_withdrawals(
+        self,
+        withdraw_hashes: List[HexStr],
+        index: int = 0,
+        skip_finalized: bool = True,
+        batch_size: int = 100,
+        multicall_address: Optional[HexStr] = None,
+    ) -> List[Union[HexBytes, Exception, None]]:
+        """
+        Finalizes many withdrawals, sending the finalization transactions with sequential nonces.
+
+        Receipts and log proofs are fetched in JSON-RPC batches, the L1 bridge of every distinct
+        L2 bridge is resolved once and, with ``skip_finalized``, already finalized withdrawals
+        are found with ``are_withdrawals_finalized``. Fees are read for the first of every
+        ``batch_size`` transactions and reused by the following ones.
+
+        A withdrawal whose receipt, proof or L1 bridge could not be read, or whose transaction
+        could not be built or sent, does not stop the others. Its error takes the place of the
+        hash and its nonce is used by the next withdrawal.
+
+        :param withdraw_hashes: Hashes of the L2 transactions where the withdrawals were initiated.
+        :param index: In case there were multiple withdrawals in one transaction, the index of the
+            withdrawal to finalize in each of them (defaults to 0).
+        :param skip_finalized: Skip withdrawals that are already finalized.
+        :param batch_size: Maximal number of requests sent in one JSON-RPC batch.
+        :param multicall_address: Address of the Multicall3 contract on L1, see
+            ``are_withdrawals_finalized``.
+        :return: Finalization transaction hashes, or the errors that stopped them, in the order
+            of ``withdraw_hashes``, None for skipped withdrawals.
+        """
+        params = self._finalize_withdrawals_params(withdraw_hashes, index, batch_size)
+        bridges = self._resolve_l1_bridges(params)
+        if skip_finalized:
+            finalized = self._withdrawals_finalized(
+                params, bridges, batch_size, multicall_address
+            )
+        else:
+            finalized = [self._withdrawal_error(p, bridges) or False for p in params]
+
+        chain_id = self._zksync_web3.zksync.chain_id
+        options = TransactionOptions(
+            chain_id=self._l1_chain_id(),
+            nonce=self._eth_web3.eth.get_transaction_count(self.address, "pending"),
+        )
+        tx_hashes = []
+        sent = 0
+        for p, is_finalized in zip(params, finalized):
+            if isinstance(is_finalized, Exception):
+                tx_hashes.append(is_finalized)
+                continue
+            if is_finalized:
+                tx_hashes.append(None)
+                continue
+            if sent % batch_size == 0:
+                # fees are read again for every batch_size transactions
+                options.gas_price = None
+                options.max_fee_per_gas = None
+                options.max_priority_fee_per_gas = None
+            l1_bridge, _ = bridges[p["sender"]]
+            try:
+                tx = l1_bridge.functions.finalizeWithdrawal(
+                    chain_id,
+                    p["l1_batch_number"],
+                    p["l2_message_index"],
+                    p["l2_tx_number_in_block"],
+                    p["message"],
+                    [to_bytes(proof) for proof in p["proof"]],
+                ).build_transaction(prepare_transaction_options(options, self.address))
+                signed = self._l1_account.sign_transaction(tx)
+                tx_hash = self._eth_web3.eth.send_raw_transaction(
+                    signed.raw_transaction
+                )
+            except Exception as e:
+                # the nonce was not used, the next withdrawal takes it
+                tx_hashes.append(e)
+                continue
+            if "maxFeePerGas" in tx:
+                options.max_fee_per_gas = tx["maxFeePerGas"]
+                options.max_priority_fee_per_gas = tx["maxPriorityFeePerGas"]
+            else:
+                options.gas_price = tx["gasPrice"]
+            tx_hashes.append(tx_hash)
+            options.nonce += 1
+            sent += 1
+        return tx_hashes
+
     def is_withdrawal_finalized(self, withdraw_hash, index: int = 0):
         """
         Checks if withdraw is finalized from L2 -> L1
@@ -1226,18 +1400,118 @@ class WalletL1:
         if self._zksync_web3.zksync.is_base_token(sender):
             l1_bridge = self.get_l1_bridge_contracts().shared
         else:
-            l2_bridge = self._zksync_web3.eth.contract(
-                Web3.to_checksum_address(sender), abi=l2_shared_bridge_abi_default()
-            )
-            l1_bridge = self._eth_web3.eth.contract(
-                Web3.to_checksum_address(l2_bridge.functions.l1SharedBridge().call()),
-                abi=l1_shared_bridge_abi_default(),
-            )
+            l1_bridge, is_legacy = self._resolve_l1_bridge(sender)
+            # finalization of legacy bridge withdrawals is tracked by the shared bridge
+            if is_legacy:
+                l1_bridge = self.get_l1_bridge_contracts().shared
 
         return l1_bridge.functions.isWithdrawalFinalized(
-            self._zksync_web3.eth.chain_id, int(log["l1BatchNumber"], 16), proof.id
+            self._zksync_web3.zksync.chain_id, int(log["l1BatchNumber"], 16), proof.id
         ).call()
 
+    def are_withdrawals_finalized(
+        self,
+        withdraw_hashes: List[HexStr],
+        index: int = 0,
+        batch_size: int = 100,
+        multicall_address: Optional[HexStr] = None,
+    ) -> List[Union[bool, Exception]]:
+        """
+        Checks if many withdrawals are finalized from L2 -> L1. A withdrawal whose receipt,
+        proof or L1 bridge could not be read gets the error in place of its result.
+
+        All checks are read from the same L1 block, ``batch_size`` of them per Multicall3
+        ``aggregate3`` call if ``multicall_address`` is set, one ``eth_call`` each otherwise.
+        A check that reverts counts as not finalized.
+
+        :param withdraw_hashes: Hashes of the L2 transactions where the withdrawals were initiated.
+        :param index: In case there were multiple withdrawals in one transaction, the index of the
+            withdrawal to check in each of them (defaults to 0).
+        :param batch_size: Maximal number of requests sent in one JSON-RPC batch or multicall.
+        :param multicall_address: Address of the Multicall3 contract on L1, which local
+            nodes usually do not have.
+        """
+        params = self._finalize_withdrawals_params(withdraw_hashes, index, batch_size)
+        bridges = self._resolve_l1_bridges(params)
+        return self._withdrawals_finalized(
+            params, bridges, batch_size, multicall_address
+        )
+
+    @staticmethod
+    def _withdrawal_error(
+        p: Union[dict, Exception],
+        bridges: Dict[HexStr, Union[Tuple[Contract, bool], Exception]],
+    ) -> Optional[Exception]:
+        if isinstance(p, Exception):
+            return p
+        bridge = bridges[p["sender"]]
+        return bridge if isinstance(bridge, Exception) else None
+
+    def _withdrawals_finalized(
+        self,
+        params: List[Union[dict, Exception]],
+        bridges: Dict[HexStr, Union[Tuple[Contract, bool], Exception]],
+        batch_size: int,
+        multicall_address: HexStr,
+    ) -> List[Union[bool, Exception]]:
+        finalized: List[Union[bool, Exception]] = [
+            self._withdrawal_error(p, bridges) for p in params
+        ]
+        checked = [k for k, error in enumerate(finalized) if error is None]
+        if len(checked) == 0:
+            return finalized
+        chain_id = self._zksync_web3.zksync.chain_id
+        shared_bridge = self.get_l1_bridge_contracts().shared
+        block_number = self._eth_web3.eth.block_number
+        calls = []
+        for k in checked:
+            p = params[k]
+            l1_bridge, is_legacy = bridges[p["sender"]]
+            # finalization of legacy bridge withdrawals is tracked by the shared bridge
+            if is_legacy:
+                l1_bridge = shared_bridge
+            calls.append(
+                (l1_bridge, (chain_id, p["l1_batch_number"], p["l2_message_index"]))
+            )
+
+        if multicall_address is None:
+            for k, (l1_bridge, args) in zip(checked, calls):
+                try:
+                    finalized[k] = l1_bridge.functions.isWithdrawalFinalized(
+                        *args
+                    ).call(block_identifier=block_number)
+                except ContractLogicError:
+                    finalized[k] = False
+                except Exception as e:
+                    finalized[k] = e
+            return finalized
+
+        multicall = self._eth_web3.eth.contract(
+            address=Web3.to_checksum_address(multicall_address),
+            abi=multicall3_abi_default(),
+        )
+        # a reverting check does not fail the others of its chunk
+        aggregated = [
+            (
+                l1_bridge.address,
+                True,
+                l1_bridge.encode_abi("isWithdrawalFinalized", args),
+            )
+            for l1_bridge, args in calls
+        ]
+        results = []
+        for start in range(0, len(aggregated), batch_size):
+            results.extend(
+                multicall.functions.aggregate3(
+                    aggregated[start : start + batch_size]
+                ).call(block_identifier=block_number)
+            )
+        for k, (success, return_data) in zip(checked, results):
+            finalized[k] = (
+                success and self._eth_web3.codec.decode(["bool"], return_data)[0]
+            )
+        return finalized
+
     def request_execute(self, transaction: RequestExecuteCallMsg):
         """
         Request execution of L2 transaction from L1.
@@ -1375,9 +1649,7 @@ class WalletL1:
         return self._eth_web3.eth.estimate_gas(transaction)
 
     def get_request_execute_allowance_params(self, transaction: RequestExecuteCallMsg):
-        bridge_hub = self.get_bridgehub_contract()
-        chain_id = self._zksync_web3.zksync.chain_id
-        base_token_address = bridge_hub.functions.baseToken(chain_id).call()
+        base_token_address = self.get_base_token()
         is_eth_base_chain = base_token_address == ETH_ADDRESS_IN_CONTRACTS
 
         if is_eth_base_chain:
@@ -1,5 +1,9 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Union
+
 from eth_account.signers.base import BaseAccount
 from eth_typing import HexStr
+from hexbytes import HexBytes
 from web3 import Web3
 
 from zksync2.core.types import (
@@ -7,7 +11,10 @@ from zksync2.core.types import (
     L2BridgeContracts,
     TransferTransaction,
     WithdrawTransaction,
+    TransactionOptions,
 )
+from zksync2.account.nonce_manager import NonceManager
+from zksync2.account.pipelined_sender import PipelinedSender
 from zksync2.manage_contracts.deploy_addresses import ZkSyncAddresses
 from zksync2.manage_contracts.utils import (
     get_zksync_hyperchain,
@@ -31,6 +38,24 @@ class WalletL2:
             Web3.to_checksum_address(self._main_contract_address),
             abi=get_zksync_hyperchain(),
         )
+        # hands out the nonces of transactions sent without one, if set
+        self.nonce_manager: Optional[NonceManager] = None
+
+    @contextmanager
+    def _reserved_nonce(
+        self, tx: Union[TransferTransaction, WithdrawTransaction]
+    ) -> Iterator[None]:
+        if tx.options is None:
+            tx.options = TransactionOptions()
+        if self.nonce_manager is None or tx.options.nonce is not None:
+            yield
+            return
+        with self.nonce_manager.reservation() as nonce:
+            tx.options.nonce = nonce
+            try:
+                yield
+            finally:
+                tx.options.nonce = None
 
     def get_balance(
         self, block_tag=ZkBlockParams.COMMITTED.value, token_address: HexStr = None
@@ -95,6 +120,40 @@ class WalletL2:
         Returns:
         - Transaction hash.
         """
+        with self._reserved_nonce(tx):
+            return self._transfer(tx)
+
+    def transfer_many(
+        self,
+        transfers: List[TransferTransaction],
+        max_workers: int = 8,
+        signing_workers: Optional[int] = None,
+        gas_limit_multiplier: float = 1.2,
+    ) -> List[Union[HexBytes, Exception]]:
+        """
+        Transfers ETH or any ERC20 token to many recipients, see ``PipelinedSender.transfer_many``.
+        Fees are estimated once per token and paymaster (per recipient for the base token),
+        nonces assigned up front and the transfers signed at once, then submitted one after
+        the other in nonce order.
+
+        :param transfers: TransferTransaction classes. Required parameters are to and amount.
+        :param max_workers: Number of worker threads of the ``PipelinedSender``.
+        :param signing_workers: Number of processes the signing is spread over, in the current
+            process if not set.
+        :param gas_limit_multiplier: Factor applied to the estimated gas limit, reused for
+            other recipients.
+
+        Returns:
+        - Transaction hash of each transfer, or the error that stopped it, in their order.
+        """
+        with PipelinedSender(self, max_workers=max_workers) as sender:
+            return sender.transfer_many(
+                transfers,
+                signing_workers=signing_workers,
+                gas_limit_multiplier=gas_limit_multiplier,
+            )
+
+    def _transfer(self, tx: TransferTransaction) -> HexStr:
         transaction = self._zksync_web3.zksync.get_transfer_transaction(
             tx, self._l1_account.address
         )
@@ -125,6 +184,10 @@ class WalletL2:
         Returns:
         - Withdrawal hash.
         """
+        with self._reserved_nonce(tx):
+            return self._withdraw(tx)
+
+    def _withdraw(self, tx: WithdrawTransaction) -> HexStr:
         transaction = self._zksync_web3.zksync.get_withdraw_transaction(
             tx, from_=self._l1_account.address
         )
@@ -137,7 +200,9 @@ class WalletL2:
             tx_712.maxPriorityFeePerGas or fee.max_priority_fee_per_gas
         )
 
-        signer = PrivateKeyEthSigner(self._l1_account, self._zksync_web3.eth.chain_id)
+        signer = PrivateKeyEthSigner(
+            self._l1_account, self._zksync_web3.zksync.chain_id
+        )
         signed_message = signer.sign_typed_data(tx_712.to_eip712_struct())
 
         msg = tx_712.encode(signed_message)
@@ -0,0 +1,303 @@
+import json
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+from eth_utils import keccak
+
+from zksync2.core.types import Fee
+
+
+class CacheBackend(ABC):
+    """
+    Key-value store used by the SDK caches. Keys are strings, values are JSON compatible.
+    """
+
+    @abstractmethod
+    def get(self, key: str, default: Any = None) -> Any:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def __contains__(self, key: str) -> bool:
+        missing = object()
+        return self.get(key, missing) is not missing
+
+
+class LRUCache(CacheBackend):
+    """
+    Thread-safe in-memory cache that evicts the least recently used entry once full.
+
+    :param maxsize: Maximum number of entries.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class SqliteCache(CacheBackend):
+    """
+    Cache persisted in a sqlite database, values are stored as JSON.
+
+    :param path: Database file, ``":memory:"`` keeps the data in memory.
+    :param table: Table holding the entries, several caches can share one file.
+    """
+
+    def __init__(self, path: str, table: str = "zksync_cache"):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table} WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return default
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any):
+        data = json.dumps(value, separators=(",", ":"))
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)",
+                (key, data),
+            )
+
+    def delete(self, key: str):
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                f"SELECT COUNT(*) FROM {self.table}"
+            ).fetchone()[0]
+
+
+class ChainMetadataCache:
+    """
+    Chain constants (chain ids, base token, system contract addresses) shared by a ZkSync
+    module and every wallet built on it.
+
+    Entries are kept until the protocol version of the chain changes, which is checked at most
+    once per ``ttl`` seconds. The first check happens ``ttl`` seconds after the cache is
+    created, so filling it costs no extra request; it drops the entries fetched before it, as
+    their protocol version is not known.
+
+    :param ttl: Seconds after which the protocol version is checked again.
+    """
+
+    def __init__(self, ttl: float = 600.0):
+        self.ttl = ttl
+        self._values = {}
+        self._lock = threading.Lock()
+        self._protocol_version = None
+        self._validated_at = time.monotonic()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._values.get(key, default)
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._values[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._protocol_version = None
+            self._validated_at = time.monotonic()
+
+    def needs_validation(self) -> bool:
+        return time.monotonic() - self._validated_at >= self.ttl
+
+    def validate(self, protocol_version: Any):
+        """
+        Records the current protocol version, entries are dropped if it changed since the last check.
+
+        :param protocol_version: Latest protocol version reported by the node.
+        """
+        with self._lock:
+            if self._protocol_version != protocol_version:
+                self._values.clear()
+            self._protocol_version = protocol_version
+            self._validated_at = time.monotonic()
+
+
+class FeeEstimateCache:
+    """
+    Fee estimations reused by transactions of the same shape, those sent by the same kind of
+    account (EOA or custom signature) to the same contract and function, with the same
+    paymaster and factory dependencies. The amount and the call arguments are not part of the
+    shape. Plain value transfers are keyed by recipient, as the code of a contract or custom
+    account receiving them may cost far more than a transfer to an EOA.
+
+    The gas limit of reused estimations is raised by ``gas_limit_multiplier``, covering the
+    differences between transactions of the same shape, such as the first write to the
+    balance of a new recipient. All estimations are dropped once the L1 gas price, checked
+    at most once per ``check_interval`` seconds, moved by more than ``l1_gas_price_threshold``.
+
+    :param ttl: Seconds an estimation is reused.
+    :param gas_limit_multiplier: Factor applied to the estimated gas limit.
+    :param l1_gas_price_threshold: Relative change of the L1 gas price dropping the estimations.
+    :param check_interval: Seconds after which the L1 gas price is checked again.
+    :param maxsize: Maximum number of estimations kept.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        gas_limit_multiplier: float = 1.2,
+        l1_gas_price_threshold: float = 0.1,
+        check_interval: float = 10.0,
+        maxsize: int = 1024,
+    ):
+        if gas_limit_multiplier < 1:
+            raise ValueError("gas_limit_multiplier must be at least 1")
+        self.ttl = ttl
+        self.gas_limit_multiplier = gas_limit_multiplier
+        self.l1_gas_price_threshold = l1_gas_price_threshold
+        self.check_interval = check_interval
+        self._entries = LRUCache(maxsize)
+        self._lock = threading.Lock()
+        self._l1_gas_price: Optional[int] = None
+        self._validated_at: Optional[float] = None
+
+    @staticmethod
+    def key(transaction: dict) -> str:
+        """
+        Returns the shape of a transaction, as passed to ``zks_estimate_fee``.
+
+        :param transaction: The transaction.
+        """
+        meta = transaction.get("eip712Meta")
+        data = transaction.get("data") or b""
+        if isinstance(data, str):
+            data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+        from_type = "eoa"
+        paymaster = ""
+        factory_deps = ""
+        if meta is not None:
+            if meta.custom_signature is not None:
+                from_type = "custom"
+            if meta.paymaster_params is not None:
+                paymaster = meta.paymaster_params.paymaster.lower()
+            if meta.factory_deps:
+                factory_deps = keccak(b"".join(meta.factory_deps)).hex()
+        to = (transaction.get("to") or "").lower()
+        return f"{from_type}:{to}:{data[:4].hex()}:{paymaster}:{factory_deps}"
+
+    def get(self, key: str) -> Optional[Fee]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, fee = entry
+        if time.monotonic() >= expires_at:
+            self._entries.delete(key)
+            return None
+        return fee
+
+    def set(self, key: str, fee: Fee) -> Fee:
+        """
+        Stores an estimation and returns it with the raised gas limit.
+
+        :param key: Shape of the estimated transaction.
+        :param fee: The estimation.
+        """
+        fee = Fee(
+            gas_limit=math.ceil(fee.gas_limit * self.gas_limit_multiplier),
+            max_fee_per_gas=fee.max_fee_per_gas,
+            max_priority_fee_per_gas=fee.max_priority_fee_per_gas,
+            gas_per_pubdata_limit=fee.gas_per_pubdata_limit,
+        )
+        self._entries.set(key, (time.monotonic() + self.ttl, fee))
+        return fee
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._l1_gas_price = None
+            self._validated_at = None
+
+    def needs_validation(self) -> bool:
+        validated_at = self._validated_at
+        return (
+            validated_at is None
+            or time.monotonic() - validated_at >= self.check_interval
+        )
+
+    def validate(self, l1_gas_price: int):
+        """
+        Records the current L1 gas price, estimations are dropped if it moved beyond the
+        threshold since they were made.
+
+        :param l1_gas_price: Latest L1 gas price reported by ``get_fee_params``.
+        """
+        with self._lock:
+            previous = self._l1_gas_price
+            if previous is None or abs(
+                l1_gas_price - previous
+            ) > self.l1_gas_price_threshold * max(previous, 1):
+                self._entries.clear()
+                self._l1_gas_price = l1_gas_price
+            self._validated_at = time.monotonic()
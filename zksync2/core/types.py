@@ -1,10 +1,12 @@
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum, IntEnum
-from typing import Union, NewType, Dict, List, Any, Optional
+from typing import Union, NewType, Dict, List, Any, Optional, Iterable, Iterator
 
-from eth_typing import HexStr, Hash32
+from eth_typing import HexStr, Hash32, ChecksumAddress
+from eth_utils import to_checksum_address
 from hexbytes import HexBytes
 from web3.contract import Contract
 from web3.types import AccessList
@@ -73,6 +75,48 @@ class Token:
         return Token(ADDRESS_DEFAULT, L2_ETH_TOKEN_ADDRESS, "Ether", "ETH", 18)
 
 
+class TokenRegistry:
+    """
+    Tokens indexed by L1 address, L2 address and symbol.
+
+    Symbols are not unique, ``by_symbol`` returns every token having it.
+    """
+
+    def __init__(self, tokens: Iterable[Token] = ()):
+        self._by_l1_address: Dict[str, Token] = {}
+        self._by_l2_address: Dict[str, Token] = {}
+        self._by_symbol: Dict[str, List[Token]] = {}
+        for token in tokens:
+            self.add(token)
+
+    def add(self, token: Token):
+        """
+        Adds a token, replacing the one registered with the same L2 address.
+        """
+        previous = self._by_l2_address.get(token.l2_address.lower())
+        if previous is not None:
+            self._by_l1_address.pop(previous.l1_address.lower(), None)
+            self._by_symbol[previous.symbol].remove(previous)
+        self._by_l1_address[token.l1_address.lower()] = token
+        self._by_l2_address[token.l2_address.lower()] = token
+        self._by_symbol.setdefault(token.symbol, []).append(token)
+
+    def by_l1_address(self, address: HexStr) -> Optional[Token]:
+        return self._by_l1_address.get(address.lower())
+
+    def by_l2_address(self, address: HexStr) -> Optional[Token]:
+        return self._by_l2_address.get(address.lower())
+
+    def by_symbol(self, symbol: str) -> List[Token]:
+        return list(self._by_symbol.get(symbol, []))
+
+    def __len__(self) -> int:
+        return len(self._by_l2_address)
+
+    def __iter__(self) -> Iterator[Token]:
+        return iter(list(self._by_l2_address.values()))
+
+
 @dataclass
 class Fee:
     gas_limit: int = 0
@@ -91,6 +135,12 @@ class BridgeAddresses:
     weth_bridge_l2: HexStr
 
 
+@dataclass
+class L2BridgeInfo:
+    is_legacy: bool
+    l1_bridge: HexStr
+
+
 @dataclass
 class L1BridgeContracts:
     erc20: Contract
@@ -300,6 +350,82 @@ class TransactionReceipt:
     l2_to_l1_logs: List[L1ToL2Log]
 
 
+def _int_field(key: str) -> property:
+    def get(self) -> Optional[int]:
+        value = self._data.get(key)
+        if isinstance(value, str):
+            return int(value, 16)
+        return value
+
+    return property(get)
+
+
+def _bytes_field(key: str) -> property:
+    def get(self) -> Optional[HexBytes]:
+        value = self._data.get(key)
+        return HexBytes(value) if value is not None else None
+
+    return property(get)
+
+
+def _address_field(key: str) -> property:
+    def get(self) -> Optional[ChecksumAddress]:
+        value = self._data.get(key)
+        return to_checksum_address(value) if value is not None else None
+
+    return property(get)
+
+
+class TransactionResponse(Mapping):
+    """
+    Transaction returned by ``eth_getTransactionByHash``.
+
+    Wraps the JSON-RPC result without copying it, fields are parsed from it each time they are
+    accessed. Item access returns the raw values, ``data`` being an alias of ``input``.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Dict[str, Any]):
+        self._data = data
+
+    hash = _bytes_field("hash")
+    nonce = _int_field("nonce")
+    block_hash = _bytes_field("blockHash")
+    block_number = _int_field("blockNumber")
+    transaction_index = _int_field("transactionIndex")
+    l1_batch_number = _int_field("l1BatchNumber")
+    l1_batch_tx_index = _int_field("l1BatchTxIndex")
+    from_ = _address_field("from")
+    to = _address_field("to")
+    value = _int_field("value")
+    gas = _int_field("gas")
+    gas_price = _int_field("gasPrice")
+    max_fee_per_gas = _int_field("maxFeePerGas")
+    max_priority_fee_per_gas = _int_field("maxPriorityFeePerGas")
+    input = _bytes_field("input")
+    data = input
+    type = _int_field("type")
+    chain_id = _int_field("chainId")
+    v = _int_field("v")
+    r = _bytes_field("r")
+    s = _bytes_field("s")
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "data":
+            key = "input"
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"TransactionResponse({self._data!r})"
+
+
 @dataclass
 class FullDepositFee:
     base_cost: int
@@ -405,6 +531,8 @@ class V2:
     config: Config  # Settings related to transaction fee computation.
     l1_gas_price: int  # Current L1 gas price.
     l1_pubdata_price: int  # Price of storing public data on L1.
+    conversion_ratio_numerator: int = 1  # Base token price in ETH, as a fraction.
+    conversion_ratio_denominator: int = 1
 
 
 @dataclass
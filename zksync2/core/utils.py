@@ -20,6 +20,8 @@ ADDRESS_DEFAULT = HexStr("0x" + "0" * 40)
 L2_BASE_TOKEN_ADDRESS = HexStr("0x000000000000000000000000000000000000800a")
 L2_ETH_TOKEN_ADDRESS = HexStr("0x000000000000000000000000000000000000800a")
 BOOTLOADER_FORMAL_ADDRESS = HexStr("0x0000000000000000000000000000000000008001")
+# Multicall3 is deployed at the same address on Ethereum and most EVM chains
+MULTICALL3_ADDRESS = HexStr("0xcA11bde05977b3631167028862bE2a173976CA11")
 
 DEPOSIT_GAS_PER_PUBDATA_LIMIT = 800
 MAX_PRIORITY_FEE_PER_GAS = 100_000_000
@@ -33,8 +35,8 @@ def int_to_bytes(x: int) -> bytes:
     return x.to_bytes((x.bit_length() + 7) // 8, byteorder=sys.byteorder)
 
 
-def to_bytes(data: Union[bytes, HexStr]) -> bytes:
-    if isinstance(data, bytes):
+def to_bytes(data: Union[bytes, bytearray, memoryview, HexStr]) -> bytes:
+    if isinstance(data, (bytes, bytearray, memoryview)):
         return data
     return bytes.fromhex(remove_0x_prefix(data))
 
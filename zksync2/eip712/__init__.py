@@ -1,4 +1,4 @@
-from zksync2.eip712.domain_separator import make_domain
+from zksync2.eip712.domain_separator import make_domain, get_domain_separator
 from zksync2.eip712.struct import EIP712Struct
 from zksync2.eip712.types import Address, Array, Boolean, Bytes, Int, String, Uint
 
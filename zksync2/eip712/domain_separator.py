@@ -1,7 +1,31 @@
+from functools import lru_cache
+
 from zksync2.eip712.struct import EIP712Struct
 from zksync2.eip712.types import String, Uint, Address, Bytes
 
 
+@lru_cache(maxsize=None)
+def _domain_type(
+    name: bool, version: bool, chainId: bool, verifyingContract: bool, salt: bool
+):
+    """Returns the EIP712Domain struct class having the given members."""
+
+    class EIP712Domain(EIP712Struct):
+        pass
+
+    if name:
+        EIP712Domain.name = String()
+    if version:
+        EIP712Domain.version = String()
+    if chainId:
+        EIP712Domain.chainId = Uint(256)
+    if verifyingContract:
+        EIP712Domain.verifyingContract = Address()
+    if salt:
+        EIP712Domain.salt = Bytes(32)
+    return EIP712Domain
+
+
 def make_domain(
     name=None, version=None, chainId=None, verifyingContract=None, salt=None
 ):
@@ -13,24 +37,35 @@ def make_domain(
     if all(i is None for i in [name, version, chainId, verifyingContract, salt]):
         raise ValueError("At least one argument must be given.")
 
-    class EIP712Domain(EIP712Struct):
-        pass
+    EIP712Domain = _domain_type(
+        name is not None,
+        version is not None,
+        chainId is not None,
+        verifyingContract is not None,
+        salt is not None,
+    )
 
     kwargs = dict()
     if name is not None:
-        EIP712Domain.name = String()
         kwargs["name"] = str(name)
     if version is not None:
-        EIP712Domain.version = String()
         kwargs["version"] = str(version)
     if chainId is not None:
-        EIP712Domain.chainId = Uint(256)
         kwargs["chainId"] = int(chainId)
     if verifyingContract is not None:
-        EIP712Domain.verifyingContract = Address()
         kwargs["verifyingContract"] = verifyingContract
     if salt is not None:
-        EIP712Domain.salt = Bytes(32)
         kwargs["salt"] = salt
 
     return EIP712Domain(**kwargs)
+
+
+@lru_cache(maxsize=128)
+def get_domain_separator(
+    name=None, version=None, chainId=None, verifyingContract=None, salt=None
+) -> bytes:
+    """Returns the domain separator, the hash of the EIP712Domain struct, memoized per domain.
+
+    Takes the same arguments as ``make_domain``.
+    """
+    return make_domain(name, version, chainId, verifyingContract, salt).hash_struct()
@@ -0,0 +1,99 @@
+from typing import List, Optional
+
+from eth_abi import encode
+from eth_typing import HexStr
+from web3 import Web3
+
+from zksync2.core.utils import is_address_eq, to_bytes
+from zksync2.manage_contracts.precompute_contract_deployer import (
+    PrecomputeContractDeployer,
+)
+from zksync2.manage_contracts.utils import l2_shared_bridge_abi_default
+
+
+class L2TokenAddressResolver:
+    """
+    Computes the L2 addresses of ERC20 tokens bridged by a shared bridge without any request.
+
+    The bridge deploys every token as a beacon proxy with CREATE2, salted with the L1 token
+    address, so the address only depends on the bridge, its token beacon and the bytecode hash
+    of the proxy. Those are read once by ``from_bridge``, or passed directly to work offline.
+
+    Example:
+        resolver = L2TokenAddressResolver.from_bridge(zksync_web3.zksync)
+        l2_tokens = [resolver.l2_token_address(token) for token in l1_tokens]
+
+    :param bridge_address: Address of the L2 shared bridge.
+    :param beacon_address: Address of the beacon of the bridged tokens.
+    :param proxy_bytecode_hash: Bytecode hash of the beacon proxy.
+    """
+
+    def __init__(
+        self,
+        bridge_address: HexStr,
+        beacon_address: HexStr,
+        proxy_bytecode_hash: bytes,
+    ):
+        proxy_bytecode_hash = to_bytes(proxy_bytecode_hash)
+        if len(proxy_bytecode_hash) != 32:
+            raise ValueError("Proxy bytecode hash must be 32 length")
+        self.bridge_address = Web3.to_checksum_address(bridge_address)
+        self.beacon_address = Web3.to_checksum_address(beacon_address)
+        self.proxy_bytecode_hash = bytes(proxy_bytecode_hash)
+        self._constructor = encode(["address", "bytes"], [self.beacon_address, b""])
+
+    @classmethod
+    def from_bridge(
+        cls, zksync, bridge_address: Optional[HexStr] = None
+    ) -> "L2TokenAddressResolver":
+        """
+        Reads the token beacon and proxy bytecode hash of a shared bridge.
+
+        :param zksync: ``ZkSync`` module used to query the bridge.
+        :param bridge_address: Address of the L2 shared bridge, the default shared bridge if
+            not set.
+        """
+        if bridge_address is None:
+            bridge_address = zksync.zks_get_bridge_contracts().shared_l2_default_bridge
+        bridge = zksync.contract(
+            Web3.to_checksum_address(bridge_address),
+            abi=l2_shared_bridge_abi_default(),
+        )
+        with zksync.batch() as batch:
+            batch.add(bridge.functions.l2TokenBeacon())
+            batch.add(bridge.functions.l2TokenProxyBytecodeHash())
+        beacon_address, proxy_bytecode_hash = batch.results
+        return cls(bridge_address, beacon_address, proxy_bytecode_hash)
+
+    def l2_token_address(self, l1_token: HexStr) -> HexStr:
+        """
+        Returns the L2 address of a token bridged from L1, deployed or not yet.
+
+        :param l1_token: The address of the token on L1.
+        """
+        salt = to_bytes(l1_token).rjust(32, b"\0")
+        return PrecomputeContractDeployer.compute_l2_create2_address_from_hash(
+            self.bridge_address, self.proxy_bytecode_hash, self._constructor, salt
+        )
+
+    def verify(self, zksync, l1_tokens: List[HexStr]) -> List[HexStr]:
+        """
+        Compares computed addresses with the ones reported by the bridge, in one JSON-RPC batch.
+        Returns the L1 tokens whose addresses differ, empty if all of them match.
+
+        :param zksync: ``ZkSync`` module used to query the bridge.
+        :param l1_tokens: The addresses of the tokens on L1.
+        """
+        bridge = zksync.contract(
+            self.bridge_address, abi=l2_shared_bridge_abi_default()
+        )
+        with zksync.batch() as batch:
+            for l1_token in l1_tokens:
+                batch.add(
+                    bridge.functions.l2TokenAddress(Web3.to_checksum_address(l1_token))
+                )
+        return [
+            l1_token
+            for l1_token, l2_token in zip(l1_tokens, batch.results)
+            if not is_address_eq(self.l2_token_address(l1_token), l2_token)
+        ]
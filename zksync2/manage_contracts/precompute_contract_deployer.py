@@ -117,14 +117,25 @@ class PrecomputeContractDeployer:
     def compute_l2_create2_address(
         self, sender: HexStr, bytecode: bytes, constructor: bytes, salt: bytes
     ) -> HexStr:
+        return self.compute_l2_create2_address_from_hash(
+            sender, hash_byte_code(bytecode), constructor, salt
+        )
+
+    @classmethod
+    def compute_l2_create2_address_from_hash(
+        cls, sender: HexStr, bytecode_hash: bytes, constructor: bytes, salt: bytes
+    ) -> HexStr:
+        """
+        Same as ``compute_l2_create2_address`` for a contract known by its bytecode hash only,
+        no node is involved.
+        """
         if len(salt) != 32:
             raise OverflowError("Salt data must be 32 length")
 
         sender_bytes = to_bytes(sender)
         sender_bytes = pad_front_bytes(sender_bytes, 32)
-        bytecode_hash = hash_byte_code(bytecode)
         ctor_hash = keccak(constructor)
-        result = self.CREATE2_PREFIX + sender_bytes + salt + bytecode_hash + ctor_hash
+        result = cls.CREATE2_PREFIX + sender_bytes + salt + bytecode_hash + ctor_hash
         sha_result = keccak(result)
         address = sha_result[12:]
         address = "0x" + address.hex()
@@ -20,6 +20,7 @@ l1_shared_bridge_abi_cache = None
 l2_shared_bridge_abi_cache = None
 bridgehub_abi_cache = None
 zksync_hyperchain_cache = None
+multicall3_abi_cache = None
 
 
 def zksync_abi_default():
@@ -164,6 +165,17 @@ def get_zksync_hyperchain():
     return zksync_hyperchain_cache
 
 
+def multicall3_abi_default():
+    global multicall3_abi_cache
+
+    if multicall3_abi_cache is None:
+        with pkg_resources.path(contract_abi, "IMulticall3.json") as p:
+            with p.open(mode="r") as json_file:
+                data = json.load(json_file)
+                multicall3_abi_cache = data["abi"]
+    return multicall3_abi_cache
+
+
 class ERC20Encoder(BaseContractEncoder):
     def __init__(self, web3: Web3, abi: Optional[dict] = None):
         if abi is None:
@@ -0,0 +1,279 @@
+from typing import Any, Awaitable, Callable, List, Optional, Union
+
+from eth_typing import Address, HexStr
+from eth_utils import to_checksum_address
+from web3 import AsyncWeb3
+from web3.eth import AsyncEth
+from web3.exceptions import BadFunctionCallOutput
+
+from zksync2.core.cache import ChainMetadataCache
+from zksync2.core.types import (
+    ADDRESS_DEFAULT,
+    ETH_ADDRESS_IN_CONTRACTS,
+    BatchDetails,
+    BlockDetails,
+    BlockRange,
+    BridgeAddresses,
+    Fee,
+    FeeParams,
+    ProtocolVersion,
+    TokenAddress,
+    TransactionDetails,
+    TransactionReceipt,
+    TransactionResponse,
+    TransactionWithDetailedOutput,
+    ZkBlockParams,
+    ZksMessageProof,
+)
+from zksync2.core.utils import (
+    LEGACY_ETH_ADDRESS,
+    L2_BASE_TOKEN_ADDRESS,
+    is_address_eq,
+)
+from zksync2.manage_contracts.utils import get_erc20_abi, l2_bridge_abi_default
+from zksync2.module.request_types import Transaction
+from zksync2.module.response_types import ZksAccountBalances
+from zksync2.module.zksync_module import ZkSyncMethods, to_fee_params
+
+
+class AsyncZkSync(ZkSyncMethods, AsyncEth):
+    """
+    asyncio counterpart of the ``ZkSync`` module.
+
+    Shares the JSON-RPC method definitions and ``ZKSYNC_RESULT_FORMATTERS`` with ``ZkSync``,
+    so every ``zks_*`` call returns the same types, only awaitable.
+    """
+
+    def __init__(self, web3: "AsyncWeb3"):
+        super(AsyncZkSync, self).__init__(web3)
+        self.chain_metadata = ChainMetadataCache()
+
+    async def cached_chain_metadata(
+        self, key: str, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Returns the chain constant stored under ``key`` in ``chain_metadata``, awaiting ``fetch``
+        when it is not cached yet. The cache is emptied when the protocol version changes.
+
+        :param key: Name of the constant.
+        :param fetch: Returns the value from the node.
+        """
+        if self._is_batching():
+            return await fetch()
+        if self.chain_metadata.needs_validation():
+            self.chain_metadata.validate(await self._zks_get_protocol_version(None))
+        value = self.chain_metadata.get(key)
+        if value is None:
+            value = await fetch()
+            self.chain_metadata.set(key, value)
+        return value
+
+    @property
+    async def chain_id(self) -> int:
+        return await self.cached_chain_metadata("chain_id", self._chain_id)
+
+    async def zks_l1_batch_number(self) -> int:
+        return await self._zks_l1_batch_number()
+
+    async def zks_get_l1_batch_block_range(self, l1_batch_number: int) -> BlockRange:
+        return await self._zks_get_l1_batch_block_range(l1_batch_number)
+
+    async def zks_get_l1_batch_details(self, l1_batch_number: int) -> BatchDetails:
+        return await self._zks_get_l1_batch_details(l1_batch_number)
+
+    async def zks_get_block_details(self, block: int) -> BlockDetails:
+        return await self._zks_get_block_details(block)
+
+    async def zks_get_transaction_details(self, txHash: str) -> TransactionDetails:
+        return await self._zks_get_transaction_details(txHash)
+
+    async def zks_estimate_gas_l1_to_l2(self, transaction: Transaction) -> int:
+        return await self._zks_estimate_gas_l1_to_l2(transaction)
+
+    async def zks_get_proof(
+        self, address: HexStr, key: List[HexStr], l1_batch_number: int
+    ):
+        return await self._zks_get_proof(address, key, l1_batch_number)
+
+    async def zks_get_protocol_version(self, id: int = None) -> ProtocolVersion:
+        """
+        Returns the protocol version.
+
+        Calls the zks_getProtocolVersion JSON-RPC method.
+        (Refer to: https://docs.zksync.io/build/api.html#zks_getprotocolversion)
+
+        :param id: Specific version ID (optional).
+        """
+        return await self._zks_get_protocol_version(id)
+
+    async def zks_get_confirmed_tokens(self, start: int = 0, limit: int = 255):
+        """
+        Returns confirmed tokens. A confirmed token is any token bridged to ZKsync Era via the official bridge.
+
+        Calls the zks_getConfirmedTokens JSON-RPC method.
+        (Refer to: https://docs.zksync.io/build/api.html#zks_getconfirmedtokens)
+
+        :param start: The token ID from which to start.
+        :param limit: The maximum number of tokens to list.
+        """
+        return await self._zks_get_confirmed_tokens(start, limit)
+
+    async def zks_send_raw_transaction_with_detailed_output(
+        self, tx: Union[HexStr, bytes]
+    ) -> TransactionWithDetailedOutput:
+        """
+        Executes a transaction and returns its hash, storage logs, and events that would have been generated if the
+        transaction had already been included in the block.
+
+        Calls the zks_sendRawTransactionWithDetailedOutput JSON-RPC method.
+        (Refer to: https://docs.zksync.io/build/api.html#zks_sendRawTransactionWithDetailedOutput)
+
+        :param tx: The signed transaction that needs to be broadcasted.
+        """
+        return await self._zks_send_raw_transaction_with_detailed_output(tx)
+
+    async def zks_get_fee_params(self) -> FeeParams:
+        """
+        Returns the current fee parameters.
+        Calls the {@link https://docs.zksync.io/build/api.html#zks_getFeeParams zks_getFeeParams} JSON-RPC method.
+        """
+        return await self._zks_get_fee_params()
+
+    async def get_fee_params(self) -> FeeParams:
+        """
+        Returns the current fee parameters as ``FeeParams``, see ``to_fee_params``.
+        """
+        return to_fee_params(await self.zks_get_fee_params())
+
+    async def zks_estimate_fee(self, transaction: Transaction) -> Fee:
+        return await self._zks_estimate_fee(transaction)
+
+    async def zks_main_contract(self) -> HexStr:
+        return await self.cached_chain_metadata(
+            "main_contract", self._zks_main_contract
+        )
+
+    async def zks_get_base_token_contract_address(self) -> HexStr:
+        """Returns the L1 base token address."""
+        return await self.cached_chain_metadata(
+            "base_token", self._zks_get_base_token_contract_address
+        )
+
+    async def is_eth_based_chain(self) -> bool:
+        return is_address_eq(
+            await self.zks_get_base_token_contract_address(), ETH_ADDRESS_IN_CONTRACTS
+        )
+
+    async def is_base_token(self, token: HexStr) -> bool:
+        return is_address_eq(
+            token, await self.zks_get_base_token_contract_address()
+        ) or is_address_eq(token, L2_BASE_TOKEN_ADDRESS)
+
+    async def zks_get_bridgehub_contract_address(self) -> HexStr:
+        return await self.cached_chain_metadata(
+            "bridgehub_contract", self._zks_get_bridgehub_contract_address
+        )
+
+    async def zks_get_token_price(self, token_address: TokenAddress):
+        return await self._zks_get_token_price(token_address)
+
+    async def zks_l1_chain_id(self) -> int:
+        return await self.cached_chain_metadata("l1_chain_id", self._zks_l1_chain_id)
+
+    async def zks_get_all_account_balances(self, addr: Address) -> ZksAccountBalances:
+        return await self._zks_get_all_account_balances(addr)
+
+    async def zks_get_bridge_contracts(self) -> BridgeAddresses:
+        return await self.cached_chain_metadata(
+            "bridge_contracts", self._zks_get_bridge_contracts
+        )
+
+    async def zks_get_l2_to_l1_msg_proof(
+        self, block: int, sender: HexStr, message: str, l2log_pos: Optional[int]
+    ) -> ZksMessageProof:
+        return await self._zks_get_l2_to_l1_msg_proof(block, sender, message, l2log_pos)
+
+    async def zks_get_log_proof(
+        self, tx_hash: HexStr, index: int = None
+    ) -> ZksMessageProof:
+        return await self._zks_get_l2_to_l1_log_proof(tx_hash, index)
+
+    async def zks_get_testnet_paymaster_address(self) -> HexStr:
+        return to_checksum_address(await self._zks_get_testnet_paymaster_address())
+
+    async def zks_get_balance(
+        self,
+        address: HexStr,
+        block_tag=ZkBlockParams.COMMITTED.value,
+        token_address: HexStr = None,
+    ) -> int:
+        if token_address is None:
+            token_address = L2_BASE_TOKEN_ADDRESS
+        elif (
+            token_address == LEGACY_ETH_ADDRESS
+            or token_address == ETH_ADDRESS_IN_CONTRACTS
+        ):
+            token_address = await self.l2_token_address(ETH_ADDRESS_IN_CONTRACTS)
+        if token_address == L2_BASE_TOKEN_ADDRESS:
+            return await self.get_balance(to_checksum_address(address), block_tag)
+
+        try:
+            token = self.contract(
+                to_checksum_address(token_address), abi=get_erc20_abi()
+            )
+            return await token.functions.balanceOf(address).call()
+        except BadFunctionCallOutput:
+            # no contract at the token address, the token is not bridged yet
+            return 0
+
+    async def l1_token_address(self, token: HexStr) -> HexStr:
+        """
+        Returns the L1 token address equivalent for a L2 token address as they are not equal.
+        ETH address is set to zero address.
+
+        :param token: The address of the token on L2.
+        """
+        if token == LEGACY_ETH_ADDRESS:
+            return LEGACY_ETH_ADDRESS
+
+        bridge_address = await self.zks_get_bridge_contracts()
+        shared_bridge = self.contract(
+            to_checksum_address(bridge_address.shared_l2_default_bridge),
+            abi=l2_bridge_abi_default(),
+        )
+
+        return await shared_bridge.functions.l1TokenAddress(token).call()
+
+    async def l2_token_address(
+        self, token: HexStr, bridge_address: BridgeAddresses = None
+    ) -> HexStr:
+        """
+        Returns the L2 token address equivalent for a L1 token address as they are not equal.
+        ETH address is set to zero address.
+
+        :param token: The address of the token on L1.
+        :param bridge_address: The address of custom bridge, which will be used to get l2 token address.
+        """
+        if token == ADDRESS_DEFAULT:
+            token = ETH_ADDRESS_IN_CONTRACTS
+        base_token = await self.zks_get_base_token_contract_address()
+        if token.lower() == base_token.lower():
+            return L2_BASE_TOKEN_ADDRESS
+
+        if bridge_address is None:
+            bridge_address = await self.zks_get_bridge_contracts()
+        l2_shared_bridge = self.contract(
+            to_checksum_address(bridge_address.shared_l2_default_bridge),
+            abi=l2_bridge_abi_default(),
+        )
+
+        return await l2_shared_bridge.functions.l2TokenAddress(token).call()
+
+    async def eth_estimate_gas(self, tx: Transaction) -> int:
+        return await self._eth_estimate_gas(tx)
+
+    async def eth_get_transaction_receipt(self, tx: HexStr) -> TransactionReceipt:
+        return await self._eth_get_transaction_receipt(tx)
+
+    async def eth_get_transaction_by_hash(self, tx: HexStr) -> TransactionResponse:
+        return await self._eth_get_transaction_by_hash(tx)
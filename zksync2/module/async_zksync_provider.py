@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from eth_typing import URI
+from web3 import AsyncHTTPProvider
+from web3.providers.rpc.utils import check_if_retry_on_failure
+from web3.types import RPCEndpoint, RPCResponse
+
+from zksync2.module.zksync_provider import (
+    DEFAULT_TIMEOUT,
+    ConnectionPoolOptions,
+    _current_methods,
+    get_method_timeout,
+    sort_batch_response,
+)
+
+
+class AsyncZkSyncProvider(AsyncHTTPProvider):
+    """
+    asyncio HTTP provider that keeps a pooled keep-alive session per event loop, and sends
+    every request, batches included, through it.
+
+    :param url: ZKsync node URL.
+    :param timeout: Request timeout in seconds, ``None`` waits forever.
+    :param method_timeouts: Timeouts by JSON-RPC method name, e.g. ``{"zks_getProof": 120}``.
+    :param pool_options: Connection pool settings, ``pool_maxsize`` bounds the connections
+        to the node and ``pool_connections * pool_maxsize`` all connections of the session.
+    """
+
+    logger = logging.getLogger("AsyncZkSyncProvider")
+
+    def __init__(
+        self,
+        url: Optional[Union[URI, str]],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        method_timeouts: Optional[Dict[str, float]] = None,
+        pool_options: Optional[ConnectionPoolOptions] = None,
+    ):
+        self.timeout = timeout
+        self.method_timeouts = dict(method_timeouts or {})
+        self.pool_options = pool_options or ConnectionPoolOptions()
+        self._pooled_sessions: Dict[
+            int, Tuple[asyncio.AbstractEventLoop, ClientSession]
+        ] = {}
+        super(AsyncZkSyncProvider, self).__init__(
+            url, request_kwargs={"timeout": ClientTimeout(total=timeout)}
+        )
+
+    def _build_session(self) -> ClientSession:
+        options = self.pool_options
+        if options.keep_alive:
+            connector = TCPConnector(
+                limit=options.pool_connections * options.pool_maxsize,
+                limit_per_host=options.pool_maxsize,
+                keepalive_timeout=options.keep_alive_timeout,
+            )
+        else:
+            connector = TCPConnector(
+                limit=options.pool_connections * options.pool_maxsize,
+                limit_per_host=options.pool_maxsize,
+                force_close=True,
+                enable_cleanup_closed=True,
+            )
+        return ClientSession(raise_for_status=True, connector=connector)
+
+    def _pooled_session(self) -> ClientSession:
+        # one session per event loop, aiohttp sessions cannot be shared between loops
+        loop = asyncio.get_running_loop()
+        entry = self._pooled_sessions.get(id(loop))
+        if entry is not None and entry[0] is loop and not entry[1].closed:
+            return entry[1]
+        for key, (other_loop, other) in list(self._pooled_sessions.items()):
+            if other_loop.is_closed():
+                del self._pooled_sessions[key]
+                self._close_detached(other)
+        session = self._build_session()
+        self._pooled_sessions[id(loop)] = (loop, session)
+        return session
+
+    def get_request_kwargs(self) -> Dict[str, Any]:
+        kwargs = dict(super(AsyncZkSyncProvider, self).get_request_kwargs())
+        kwargs["timeout"] = ClientTimeout(
+            total=get_method_timeout(
+                _current_methods.get(), self.timeout, self.method_timeouts
+            )
+        )
+        return kwargs
+
+    async def _post(self, methods: Tuple[str, ...], request_data: bytes) -> bytes:
+        session = self._pooled_session()
+        token = _current_methods.set(methods)
+        try:
+            kwargs = self.get_request_kwargs()
+        finally:
+            _current_methods.reset(token)
+        # posts with the session directly, the web3 session cache is per thread
+        async with session.post(
+            self.endpoint_uri, data=request_data, **kwargs
+        ) as response:
+            return await response.read()
+
+    async def _make_request(self, method: RPCEndpoint, request_data: bytes) -> bytes:
+        config = self.exception_retry_configuration
+        if config is None or not check_if_retry_on_failure(
+            method, config.method_allowlist
+        ):
+            return await self._post((method,), request_data)
+        for i in range(config.retries):
+            try:
+                return await self._post((method,), request_data)
+            except tuple(config.errors):
+                if i == config.retries - 1:
+                    raise
+                await asyncio.sleep(config.backoff_factor * 2**i)
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        self.logger.debug(f"make_request: {method}, params : {params}")
+        response = await AsyncHTTPProvider.make_request(self, method, params)
+        return response
+
+    async def make_batch_request(
+        self, batch_requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        request_data = self.encode_batch_rpc_request(batch_requests)
+        raw_response = await self._post(
+            tuple(method for method, _ in batch_requests), request_data
+        )
+        return sort_batch_response(self.decode_rpc_response(raw_response))
+
+    async def disconnect(self) -> None:
+        """
+        Closes the pooled sessions of every event loop, not only the running one.
+        """
+        await super(AsyncZkSyncProvider, self).disconnect()
+        sessions = self._pooled_sessions
+        self._pooled_sessions = {}
+        loop = asyncio.get_running_loop()
+        for session_loop, session in sessions.values():
+            if session.closed:
+                continue
+            if session_loop is loop:
+                await session.close()
+            elif session_loop.is_running():
+                # running in another thread, closed there
+                await asyncio.wrap_future(
+                    asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+                )
+            else:
+                self._close_detached(session)
+
+    def _close_detached(self, session: ClientSession):
+        if session.closed:
+            return
+        # the loop of the session is stopped or closed, its close() cannot be awaited; the
+        # connector closes its transports at once, the returned waiter is not needed
+        connector = session.connector
+        session.detach()
+        if connector is None:
+            return
+        try:
+            connector.close()
+        except RuntimeError as e:
+            self.logger.debug(f"Closing a session of a closed event loop: {e}")
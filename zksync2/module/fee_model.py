@@ -0,0 +1,124 @@
+import threading
+import time
+from typing import Optional, Tuple
+
+from zksync2.core.types import Fee, FeeParams
+
+MAX_GAS_PER_PUBDATA_BYTE = 50000
+
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+
+def derive_fee(
+    fee_params: FeeParams,
+    l1_gas_price_scale_factor: float = 1.0,
+    l1_pubdata_price_scale_factor: float = 1.0,
+) -> Tuple[int, int]:
+    """
+    Returns the base fee and the gas per pubdata byte the node derives from fee parameters.
+
+    :param fee_params: Fee parameters returned by ``get_fee_params``.
+    :param l1_gas_price_scale_factor: Factor applied to the L1 gas price.
+    :param l1_pubdata_price_scale_factor: Factor applied to the L1 pubdata price.
+    """
+    params = fee_params.V2
+    config = params.config
+    numerator = params.conversion_ratio_numerator
+    denominator = params.conversion_ratio_denominator
+    # prices are given in ETH, the base token may differ
+    l1_gas_price = params.l1_gas_price * numerator // denominator
+    l1_pubdata_price = params.l1_pubdata_price * numerator // denominator
+    minimal_l2_gas_price = config.minimal_l2_gas_price * numerator // denominator
+    l1_gas_price = int(l1_gas_price * l1_gas_price_scale_factor)
+    l1_pubdata_price = int(l1_pubdata_price * l1_pubdata_price_scale_factor)
+
+    # the cost of committing a batch on L1 is covered by its gas and pubdata
+    batch_overhead = l1_gas_price * config.batch_overhead_l1_gas
+    overhead_per_gas = _ceil_div(batch_overhead, config.max_gas_per_batch)
+    fair_l2_gas_price = minimal_l2_gas_price + int(
+        overhead_per_gas * config.compute_overhead_part
+    )
+    overhead_per_pubdata = _ceil_div(batch_overhead, config.max_pubdata_per_batch)
+    fair_pubdata_price = l1_pubdata_price + int(
+        overhead_per_pubdata * config.pubdata_overhead_part
+    )
+
+    # high enough for a transaction to publish its pubdata within the gas per pubdata cap
+    base_fee = max(
+        fair_l2_gas_price, _ceil_div(fair_pubdata_price, MAX_GAS_PER_PUBDATA_BYTE)
+    )
+    gas_per_pubdata = _ceil_div(fair_pubdata_price, base_fee)
+    return base_fee, gas_per_pubdata
+
+
+class LocalFeeModel:
+    """
+    Computes ``max_fee_per_gas`` and ``gas_per_pubdata_limit`` locally, from fee parameters
+    requested with ``get_fee_params`` at most once per ``refresh_interval`` seconds.
+    ``zks_estimate_fee`` is then only needed for gas limits.
+
+    L1 prices are raised by ``scale_factor`` before deriving the fee, as the node does for its
+    own estimations, so the fee covers price moves until the transaction is included. Any
+    unspent fee is refunded.
+
+    Example:
+        zksync_web3.zksync.fee_model = LocalFeeModel(zksync_web3.zksync)
+        fee = zksync_web3.zksync.fee_model.fee(gas_limit)
+
+    :param zksync: ``ZkSync`` module used to request the fee parameters.
+    :param refresh_interval: Seconds after which fee parameters are requested again.
+    :param scale_factor: Factor applied to the L1 gas and pubdata prices.
+    """
+
+    def __init__(
+        self, zksync, refresh_interval: float = 10.0, scale_factor: float = 1.5
+    ):
+        self._zksync = zksync
+        self.refresh_interval = refresh_interval
+        self.scale_factor = scale_factor
+        self._lock = threading.Lock()
+        self._fee: Optional[Tuple[int, int]] = None
+        self._refreshed_at: Optional[float] = None
+
+    def refresh(self):
+        """
+        Requests the fee parameters and derives the fee from them.
+        """
+        fee_params = self._zksync.get_fee_params()
+        fee = derive_fee(fee_params, self.scale_factor, self.scale_factor)
+        with self._lock:
+            self._fee = fee
+            self._refreshed_at = time.monotonic()
+
+    def _derived_fee(self) -> Tuple[int, int]:
+        refreshed_at = self._refreshed_at
+        if (
+            refreshed_at is None
+            or time.monotonic() - refreshed_at >= self.refresh_interval
+        ):
+            self.refresh()
+        return self._fee
+
+    @property
+    def max_fee_per_gas(self) -> int:
+        return self._derived_fee()[0]
+
+    @property
+    def gas_per_pubdata_limit(self) -> int:
+        return self._derived_fee()[1]
+
+    def fee(self, gas_limit: int = 0) -> Fee:
+        """
+        Returns the fee of a transaction, no priority fee is paid on ZKsync.
+
+        :param gas_limit: Gas limit of the transaction.
+        """
+        max_fee_per_gas, gas_per_pubdata_limit = self._derived_fee()
+        return Fee(
+            gas_limit=gas_limit,
+            max_fee_per_gas=max_fee_per_gas,
+            max_priority_fee_per_gas=0,
+            gas_per_pubdata_limit=gas_per_pubdata_limit,
+        )
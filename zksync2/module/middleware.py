@@ -1,4 +1,14 @@
+import json
+import time
+from typing import Any, List, Optional, Tuple, Union
+
+from toolz import curry
+from web3._utils.encoding import Web3JsonEncoder
 from web3.middleware import Web3Middleware
+from web3.middleware.base import Web3MiddlewareBuilder
+from web3.types import RPCEndpoint, RPCResponse
+
+from zksync2.core.cache import CacheBackend, LRUCache
 
 
 class ZkSyncMiddlewareBuilder(Web3Middleware):
@@ -7,3 +17,278 @@ class ZkSyncMiddlewareBuilder(Web3Middleware):
             return make_request(method, params)
 
         return middleware
+
+
+CACHEABLE_METHODS = {
+    RPCEndpoint("zks_getL1BatchDetails"),
+    RPCEndpoint("zks_getBlockDetails"),
+    RPCEndpoint("zks_getL1BatchBlockRange"),
+    RPCEndpoint("zks_getL2ToL1LogProof"),
+    RPCEndpoint("zks_getL2ToL1MsgProof"),
+    RPCEndpoint("zks_getProtocolVersion"),
+}
+
+_BLOCK = "block"
+_BATCH = "batch"
+_TX = "tx"
+
+
+def _to_int(value: Union[int, str]) -> int:
+    if isinstance(value, str):
+        return int(value, 16) if value.startswith("0x") else int(value)
+    return value
+
+
+def _finality_check(
+    method: RPCEndpoint, params: Any, result: Any
+) -> Union[bool, Tuple[str, Any]]:
+    """
+    Decides whether a result can never change.
+
+    Returns a bool when the result alone is enough to tell, otherwise ``(kind, value)`` where the
+    result is final once the block, batch or transaction ``value`` is finalized.
+    """
+    if result is None:
+        return False
+    if method == "zks_getProtocolVersion":
+        return len(params) > 0 and params[0] is not None
+    if method == "zks_getBlockDetails":
+        return result.get("status") == "verified" or (_BLOCK, params[0])
+    if method == "zks_getL1BatchDetails":
+        return result.get("status") == "verified" or (_BATCH, params[0])
+    if method == "zks_getL1BatchBlockRange":
+        return _BATCH, params[0]
+    if method == "zks_getL2ToL1MsgProof":
+        return _BLOCK, params[0]
+    if method == "zks_getL2ToL1LogProof":
+        return _TX, params[0]
+    return False
+
+
+class ZkSyncCacheMiddleware(Web3MiddlewareBuilder):
+    """
+    Caches results of ``zks_*`` methods that can no longer change, keyed by (method, params).
+
+    Block and batch details are stored once their status is ``verified`` or they are not newer
+    than the finalized block, block ranges and L2 to L1 proofs once their batch, block or
+    transaction is finalized, and protocol versions when requested by id. The finalized block
+    is looked up only when needed and at most once per ``finalized_refresh_interval`` seconds.
+
+    The middleware stores raw JSON-RPC results, so it has to be the innermost layer:
+
+        zksync_web3.middleware_onion.inject(
+            ZkSyncCacheMiddleware.build(SqliteCache("zksync.db")), "zksync_cache", layer=0
+        )
+    """
+
+    backend: CacheBackend = None
+    finalized_refresh_interval: float = 12.0
+    _chain_id: Optional[int] = None
+    _finalized: Tuple[int, int] = (-1, -1)
+    _finalized_at: float = 0.0
+
+    @staticmethod
+    @curry
+    def build(
+        backend: Optional[CacheBackend],
+        w3,
+        finalized_refresh_interval: float = 12.0,
+    ) -> "ZkSyncCacheMiddleware":
+        """
+        :param backend: Storage for cached results, shared by every web3 instance it is built
+            for. Defaults to an in-memory ``LRUCache``.
+        :param finalized_refresh_interval: Minimal number of seconds between two lookups of
+            the finalized block.
+        """
+        middleware = ZkSyncCacheMiddleware(w3)
+        middleware.backend = backend if backend is not None else LRUCache()
+        middleware.finalized_refresh_interval = finalized_refresh_interval
+        return middleware
+
+    def _key(self, method: RPCEndpoint, params: Any) -> str:
+        params = json.dumps(params, cls=Web3JsonEncoder, separators=(",", ":"))
+        return f"{self._chain_id}:{method}:{params}"
+
+    def _cached_response(self, key: str) -> Optional[RPCResponse]:
+        result = self.backend.get(key)
+        if result is None:
+            return None
+        counter = getattr(self._w3.provider, "request_counter", None)
+        request_id = next(counter) if counter is not None else 0
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    def _is_below_finalized(self, kind: str, number: Any) -> bool:
+        index = 0 if kind == _BLOCK else 1
+        return _to_int(number) <= self._finalized[index]
+
+    def _should_refresh_finalized(self) -> bool:
+        return time.monotonic() - self._finalized_at >= self.finalized_refresh_interval
+
+    def _set_finalized(self, response: RPCResponse):
+        self._finalized_at = time.monotonic()
+        block = response.get("result")
+        if block is not None:
+            self._finalized = (
+                _to_int(block["number"]),
+                _to_int(block.get("l1BatchNumber") or -1),
+            )
+
+    # -- sync -- #
+
+    def _is_final(self, make_request, method, params, result) -> bool:
+        check = _finality_check(method, params, result)
+        if isinstance(check, bool):
+            return check
+        kind, value = check
+        if kind == _TX:
+            receipt = make_request(
+                RPCEndpoint("eth_getTransactionReceipt"), [value]
+            ).get("result")
+            if receipt is None or receipt.get("blockNumber") is None:
+                return False
+            kind, value = _BLOCK, receipt["blockNumber"]
+        if self._is_below_finalized(kind, value):
+            return True
+        if self._should_refresh_finalized():
+            self._set_finalized(
+                make_request(RPCEndpoint("eth_getBlockByNumber"), ["finalized", False])
+            )
+        return self._is_below_finalized(kind, value)
+
+    def _store(self, make_request, method, params, response: RPCResponse):
+        if "result" not in response:
+            return
+        if self._is_final(make_request, method, params, response["result"]):
+            self.backend.set(self._key(method, params), response["result"])
+
+    def _ensure_chain_id(self, make_request):
+        if self._chain_id is None:
+            self._chain_id = _to_int(
+                make_request(RPCEndpoint("eth_chainId"), [])["result"]
+            )
+
+    def wrap_make_request(self, make_request):
+        def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in CACHEABLE_METHODS:
+                return make_request(method, params)
+            self._ensure_chain_id(make_request)
+            cached = self._cached_response(self._key(method, params))
+            if cached is not None:
+                return cached
+            response = make_request(method, params)
+            self._store(make_request, method, params, response)
+            return response
+
+        return middleware
+
+    def wrap_make_batch_request(self, make_batch_request):
+        def make_request(method: RPCEndpoint, params: Any) -> RPCResponse:
+            response = make_batch_request([(method, params)])
+            return response[0] if isinstance(response, list) else response
+
+        def middleware(
+            requests_info: List[Tuple[RPCEndpoint, Any]]
+        ) -> Union[List[RPCResponse], RPCResponse]:
+            if any(method in CACHEABLE_METHODS for method, _ in requests_info):
+                self._ensure_chain_id(make_request)
+            responses = self._cached_batch_responses(requests_info)
+            missing = [i for i, r in enumerate(responses) if r is None]
+            if len(missing) > 0:
+                fetched = make_batch_request([requests_info[i] for i in missing])
+                if not isinstance(fetched, list):
+                    return fetched
+                for i, response in zip(missing, fetched):
+                    responses[i] = response
+                    method, params = requests_info[i]
+                    if method in CACHEABLE_METHODS:
+                        self._store(make_request, method, params, response)
+            return responses
+
+        return middleware
+
+    def _cached_batch_responses(
+        self, requests_info: List[Tuple[RPCEndpoint, Any]]
+    ) -> List[Optional[RPCResponse]]:
+        return [
+            (
+                self._cached_response(self._key(method, params))
+                if method in CACHEABLE_METHODS
+                else None
+            )
+            for method, params in requests_info
+        ]
+
+    # -- async -- #
+
+    async def _async_is_final(self, make_request, method, params, result) -> bool:
+        check = _finality_check(method, params, result)
+        if isinstance(check, bool):
+            return check
+        kind, value = check
+        if kind == _TX:
+            receipt = (
+                await make_request(RPCEndpoint("eth_getTransactionReceipt"), [value])
+            ).get("result")
+            if receipt is None or receipt.get("blockNumber") is None:
+                return False
+            kind, value = _BLOCK, receipt["blockNumber"]
+        if self._is_below_finalized(kind, value):
+            return True
+        if self._should_refresh_finalized():
+            self._set_finalized(
+                await make_request(
+                    RPCEndpoint("eth_getBlockByNumber"), ["finalized", False]
+                )
+            )
+        return self._is_below_finalized(kind, value)
+
+    async def _async_store(self, make_request, method, params, response: RPCResponse):
+        if "result" not in response:
+            return
+        if await self._async_is_final(make_request, method, params, response["result"]):
+            self.backend.set(self._key(method, params), response["result"])
+
+    async def _async_ensure_chain_id(self, make_request):
+        if self._chain_id is None:
+            self._chain_id = _to_int(
+                (await make_request(RPCEndpoint("eth_chainId"), []))["result"]
+            )
+
+    async def async_wrap_make_request(self, make_request):
+        async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if method not in CACHEABLE_METHODS:
+                return await make_request(method, params)
+            await self._async_ensure_chain_id(make_request)
+            cached = self._cached_response(self._key(method, params))
+            if cached is not None:
+                return cached
+            response = await make_request(method, params)
+            await self._async_store(make_request, method, params, response)
+            return response
+
+        return middleware
+
+    async def async_wrap_make_batch_request(self, make_batch_request):
+        async def make_request(method: RPCEndpoint, params: Any) -> RPCResponse:
+            response = await make_batch_request([(method, params)])
+            return response[0] if isinstance(response, list) else response
+
+        async def middleware(
+            requests_info: List[Tuple[RPCEndpoint, Any]]
+        ) -> Union[List[RPCResponse], RPCResponse]:
+            if any(method in CACHEABLE_METHODS for method, _ in requests_info):
+                await self._async_ensure_chain_id(make_request)
+            responses = self._cached_batch_responses(requests_info)
+            missing = [i for i, r in enumerate(responses) if r is None]
+            if len(missing) > 0:
+                fetched = await make_batch_request([requests_info[i] for i in missing])
+                if not isinstance(fetched, list):
+                    return fetched
+                for i, response in zip(missing, fetched):
+                    responses[i] = response
+                    method, params = requests_info[i]
+                    if method in CACHEABLE_METHODS:
+                        await self._async_store(make_request, method, params, response)
+            return responses
+
+        return middleware
@@ -1,9 +1,11 @@
 from typing import Union
 
 from eth_typing import URI
-from web3 import Web3
+from web3 import AsyncWeb3, Web3
 from web3._utils.module import attach_modules
 
+from zksync2.module.async_zksync_module import AsyncZkSync
+from zksync2.module.async_zksync_provider import AsyncZkSyncProvider
 from zksync2.module.zksync_module import ZkSync
 from zksync2.module.zksync_provider import ZkSyncProvider
 
@@ -17,9 +19,34 @@ class ZkWeb3(Web3):
         attach_modules(self, {"zksync": (ZkSync,)})
 
 
+class AsyncZkWeb3(AsyncWeb3):
+    zksync: AsyncZkSync
+
+    def __init__(self, provider):
+        super().__init__(provider)
+        # Attach the asyncio zksync module
+        attach_modules(self, {"zksync": (AsyncZkSync,)})
+
+
 class ZkSyncBuilder:
     @classmethod
-    def build(cls, url: Union[URI, str]) -> ZkWeb3:
-        zksync_provider = ZkSyncProvider(url)
+    def build(cls, url: Union[URI, str], **provider_kwargs) -> ZkWeb3:
+        """
+        :param url: ZKsync node URL.
+        :param provider_kwargs: Passed to ``ZkSyncProvider``, e.g. ``timeout`` or ``pool_options``.
+        """
+        zksync_provider = ZkSyncProvider(url, **provider_kwargs)
         web3_module = ZkWeb3(zksync_provider)
         return web3_module
+
+
+class AsyncZkSyncBuilder:
+    @classmethod
+    def build(cls, url: Union[URI, str], **provider_kwargs) -> AsyncZkWeb3:
+        """
+        :param url: ZKsync node URL.
+        :param provider_kwargs: Passed to ``AsyncZkSyncProvider``, e.g. ``timeout`` or ``pool_options``.
+        """
+        zksync_provider = AsyncZkSyncProvider(url, **provider_kwargs)
+        web3_module = AsyncZkWeb3(zksync_provider)
+        return web3_module
@@ -0,0 +1,251 @@
+import logging
+import threading
+from concurrent.futures import Future
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3.types import TxReceipt, _Hash32
+
+
+class ReceiptStage(Enum):
+    """
+    Point of a transaction's life at which a ``ReceiptTracker`` future is resolved.
+    """
+
+    COMMITTED = "committed"
+    """Included in an L2 block."""
+    FINALIZED = "finalized"
+    """Included in a block not newer than the ``finalized`` block."""
+    EXECUTED = "executed"
+    """Its L1 batch is executed on L1, according to ``zks_getL1BatchDetails``."""
+
+
+class _TrackedTransaction:
+    __slots__ = ("tx_hash", "receipt", "futures")
+
+    def __init__(self, tx_hash: _Hash32):
+        self.tx_hash = tx_hash
+        self.receipt: Optional[TxReceipt] = None
+        self.futures: Dict[ReceiptStage, List[Future]] = {
+            stage: [] for stage in ReceiptStage
+        }
+
+    def prune(self):
+        for stage, futures in self.futures.items():
+            self.futures[stage] = [f for f in futures if not f.done()]
+
+    def is_empty(self) -> bool:
+        return all(len(futures) == 0 for futures in self.futures.values())
+
+    def waits_for(self, stage: ReceiptStage) -> bool:
+        return len(self.futures[stage]) > 0
+
+    def l1_batch_number(self) -> Optional[int]:
+        number = self.receipt.get("l1BatchNumber")
+        if isinstance(number, str):
+            return int(number, 16)
+        return number
+
+    def needs_receipt(self) -> bool:
+        # the L1 batch of a receipt is only known once its block is sealed in a batch
+        return self.receipt is None or (
+            self.waits_for(ReceiptStage.EXECUTED) and self.l1_batch_number() is None
+        )
+
+    def resolve(self, stage: ReceiptStage, resolved: List[Tuple[Future, TxReceipt]]):
+        # results are set by the caller once the tracker lock is released, done callbacks
+        # run synchronously and may call the tracker again
+        futures = self.futures[stage]
+        self.futures[stage] = []
+        resolved.extend((future, self.receipt) for future in futures)
+
+
+def _set_results(resolved: List[Tuple[Future, TxReceipt]]):
+    for future, receipt in resolved:
+        if future.set_running_or_notify_cancel():
+            future.set_result(receipt)
+
+
+class ReceiptTracker:
+    """
+    Resolves futures of many in-flight transactions from a single background poller.
+
+    Each poll sends one JSON-RPC batch with the receipts of the transactions not yet included,
+    the ``finalized`` block if some futures wait for finalization, and the details of every L1
+    batch that transactions waiting for L1 execution belong to, once per batch however many
+    transactions it holds. Batches are executed in order, so transactions of a batch not newer
+    than the last executed one resolve without any request. The delay between polls starts at
+    ``min_interval`` and doubles, up to ``max_interval``, while polls resolve nothing. Tracking
+    a new transaction triggers a poll right away.
+
+    The poller thread is started by the first ``track`` call.
+
+    Example:
+        tracker = zksync_web3.zksync.receipt_tracker
+        futures = [tracker.track(tx_hash) for tx_hash in tx_hashes]
+        receipts = [future.result(timeout=120) for future in futures]
+
+    :param zksync: ``ZkSync`` module used to send the requests.
+    :param min_interval: Shortest delay between two polls, in seconds.
+    :param max_interval: Longest delay between two polls, in seconds.
+    """
+
+    logger = logging.getLogger("ReceiptTracker")
+
+    def __init__(self, zksync, min_interval: float = 0.1, max_interval: float = 2.0):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Invalid poll intervals")
+        self._zksync = zksync
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._tracked: Dict[bytes, _TrackedTransaction] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._executed_batch = -1
+
+    def track(
+        self, tx_hash: _Hash32, stage: ReceiptStage = ReceiptStage.COMMITTED
+    ) -> "Future[TxReceipt]":
+        """
+        Returns a future resolved with the transaction receipt once ``stage`` is reached.
+
+        :param tx_hash: Hash of the transaction.
+        :param stage: Stage at which the future is resolved.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Receipt tracker is closed")
+            key = bytes(HexBytes(tx_hash))
+            tracked = self._tracked.get(key)
+            if tracked is None:
+                tracked = _TrackedTransaction(tx_hash)
+                self._tracked[key] = tracked
+            receipt = tracked.receipt
+            known = stage == ReceiptStage.COMMITTED and receipt is not None
+            if not known:
+                tracked.futures[stage].append(future)
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="ReceiptTracker", daemon=True
+                    )
+                    self._thread.start()
+        if known:
+            # set outside of the lock, done callbacks may call the tracker
+            future.set_result(receipt)
+            return future
+        self._wake.set()
+        return future
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._tracked)
+
+    def close(self):
+        """
+        Stops the poller, futures still pending are cancelled.
+        """
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        with self._lock:
+            pending = [
+                future
+                for tracked in self._tracked.values()
+                for futures in tracked.futures.values()
+                for future in futures
+            ]
+            self._tracked.clear()
+        for future in pending:
+            future.cancel()
+
+    def _run(self):
+        interval = self.min_interval
+        while True:
+            woken = self._wake.wait(interval)
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                resolved = self.poll()
+            except Exception as e:
+                self.logger.warning(f"Receipt poll failed: {e}")
+                resolved = False
+            if woken or resolved:
+                interval = self.min_interval
+            else:
+                interval = min(interval * 2, self.max_interval)
+
+    def poll(self) -> bool:
+        """
+        Sends one batch for every tracked transaction and resolves the futures whose stage is
+        reached. Returns True if any future was resolved.
+        """
+        with self._lock:
+            for key in list(self._tracked):
+                tracked = self._tracked[key]
+                tracked.prune()
+                if tracked.is_empty():
+                    del self._tracked[key]
+            tracked = list(self._tracked.values())
+        if len(tracked) == 0:
+            return False
+
+        resolved: List[Tuple[Future, TxReceipt]] = []
+        with self._lock:
+            without_receipt = [t for t in tracked if t.needs_receipt()]
+            wait_finalized = any(t.waits_for(ReceiptStage.FINALIZED) for t in tracked)
+            by_batch: Dict[int, List[_TrackedTransaction]] = {}
+            for t in tracked:
+                if not t.waits_for(ReceiptStage.EXECUTED) or t.needs_receipt():
+                    continue
+                batch_number = t.l1_batch_number()
+                if batch_number <= self._executed_batch:
+                    t.resolve(ReceiptStage.EXECUTED, resolved)
+                else:
+                    by_batch.setdefault(batch_number, []).append(t)
+        if len(without_receipt) == 0 and len(by_batch) == 0 and not wait_finalized:
+            _set_results(resolved)
+            return len(resolved) > 0
+
+        zksync = self._zksync
+        with zksync.batch() as batch:
+            for t in without_receipt:
+                batch.add(zksync.get_transaction_receipt(t.tx_hash))
+            for batch_number in by_batch:
+                batch.add(zksync.zks_get_l1_batch_details(batch_number))
+            if wait_finalized:
+                batch.add(zksync.get_block("finalized"))
+            results = batch.execute(raise_on_error=False)
+
+        with self._lock:
+            for t, receipt in zip(without_receipt, results):
+                if isinstance(receipt, Exception) or receipt["blockHash"] is None:
+                    continue
+                t.receipt = receipt
+                t.resolve(ReceiptStage.COMMITTED, resolved)
+
+            details = results[
+                len(without_receipt) : len(without_receipt) + len(by_batch)
+            ]
+            for (batch_number, waiting), detail in zip(by_batch.items(), details):
+                if isinstance(detail, Exception) or detail.status != "verified":
+                    continue
+                # batches are executed in order
+                self._executed_batch = max(self._executed_batch, batch_number)
+                for t in waiting:
+                    t.resolve(ReceiptStage.EXECUTED, resolved)
+
+            if wait_finalized and not isinstance(results[-1], Exception):
+                finalized = results[-1]["number"]
+                for t in tracked:
+                    if t.receipt is not None and t.receipt["blockNumber"] <= finalized:
+                        t.resolve(ReceiptStage.FINALIZED, resolved)
+        _set_results(resolved)
+        return len(resolved) > 0
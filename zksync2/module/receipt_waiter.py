@@ -0,0 +1,220 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt, _Hash32
+
+
+class _PendingTransaction:
+    __slots__ = ("tx_hash", "receipt", "receipt_futures", "finalized_futures")
+
+    def __init__(self, tx_hash: _Hash32):
+        self.tx_hash = tx_hash
+        self.receipt: Optional[TxReceipt] = None
+        self.receipt_futures: List[asyncio.Future] = []
+        self.finalized_futures: List[asyncio.Future] = []
+
+    def prune(self):
+        self.receipt_futures = [f for f in self.receipt_futures if not f.done()]
+        self.finalized_futures = [f for f in self.finalized_futures if not f.done()]
+
+    def is_empty(self) -> bool:
+        return len(self.receipt_futures) == 0 and len(self.finalized_futures) == 0
+
+
+def _set_result(futures: List[asyncio.Future], result: Any):
+    for future in futures:
+        if not future.done():
+            future.set_result(result)
+
+
+class NewHeadsReceiptWaiter:
+    """
+    Waits for any number of transactions over a single ``newHeads`` subscription.
+
+    Every new block (and every newly registered transaction) triggers one JSON-RPC batch
+    fetching the receipts of all transactions still pending, plus the finalized block when
+    some of them wait for finalization. Blocks arriving while a batch is in flight are
+    coalesced into the next one.
+
+    Requires an ``AsyncZkWeb3`` using a persistent connection provider such as
+    ``WebSocketProvider``.
+
+    Example:
+        async with AsyncZkWeb3(WebSocketProvider(url)) as zk_web3:
+            async with NewHeadsReceiptWaiter(zk_web3) as waiter:
+                receipts = await asyncio.gather(
+                    *[waiter.wait_for_transaction_receipt(h) for h in tx_hashes]
+                )
+    """
+
+    logger = logging.getLogger("NewHeadsReceiptWaiter")
+
+    def __init__(self, web3):
+        self._web3 = web3
+        self._pending: Dict[bytes, _PendingTransaction] = {}
+        self._subscription_id = None
+        self._wake: Optional[asyncio.Event] = None
+        self._tasks: List[asyncio.Task] = []
+
+    async def start(self):
+        """
+        Subscribes to new heads and starts resolving registered transactions.
+        """
+        if self._subscription_id is not None:
+            return
+        self._wake = asyncio.Event()
+        self._subscription_id = await self._web3.eth.subscribe("newHeads")
+        self._tasks = [
+            asyncio.create_task(self._read_heads()),
+            asyncio.create_task(self._poll_loop()),
+        ]
+
+    async def stop(self):
+        """
+        Unsubscribes and cancels every pending wait.
+        """
+        if self._subscription_id is None:
+            return
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        try:
+            await self._web3.eth.unsubscribe(self._subscription_id)
+        finally:
+            self._subscription_id = None
+            self._fail_all(asyncio.CancelledError())
+
+    async def __aenter__(self) -> "NewHeadsReceiptWaiter":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def wait_for_transaction_receipt(
+        self, transaction_hash: _Hash32, timeout: float = 120
+    ) -> TxReceipt:
+        """
+        Returns the receipt once the transaction is included in a block.
+
+        :param transaction_hash: Hash of the transaction.
+        :param timeout: Seconds after which ``TimeExhausted`` is raised.
+        """
+        pending = self._register(transaction_hash)
+        if pending.receipt is not None:
+            return pending.receipt
+        future = asyncio.get_running_loop().create_future()
+        pending.receipt_futures.append(future)
+        return await self._wait(transaction_hash, future, timeout)
+
+    async def wait_finalized(
+        self, transaction_hash: _Hash32, timeout: float = 120
+    ) -> TxReceipt:
+        """
+        Returns the receipt once the block including the transaction is finalized.
+
+        :param transaction_hash: Hash of the transaction.
+        :param timeout: Seconds after which ``TimeExhausted`` is raised.
+        """
+        pending = self._register(transaction_hash)
+        future = asyncio.get_running_loop().create_future()
+        pending.finalized_futures.append(future)
+        return await self._wait(transaction_hash, future, timeout)
+
+    def _register(self, transaction_hash: _Hash32) -> _PendingTransaction:
+        if self._subscription_id is None:
+            raise RuntimeError("Receipt waiter is not started")
+        key = bytes(HexBytes(transaction_hash))
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingTransaction(transaction_hash)
+            self._pending[key] = pending
+        self._wake.set()
+        return pending
+
+    async def _wait(
+        self, transaction_hash: _Hash32, future: asyncio.Future, timeout: float
+    ) -> TxReceipt:
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {HexBytes(transaction_hash) !r} is not in the chain after {timeout} seconds"
+            )
+
+    async def _read_heads(self):
+        try:
+            async for message in self._web3.socket.process_subscriptions():
+                if message.get("subscription") == self._subscription_id:
+                    self._wake.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.logger.error(f"newHeads subscription failed: {e}")
+            self._fail_all(e)
+
+    async def _poll_loop(self):
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self._poll()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # retried on the next block
+                self.logger.warning(f"Receipt poll failed: {e}")
+
+    async def _poll(self):
+        for key in list(self._pending):
+            pending = self._pending[key]
+            pending.prune()
+            if pending.is_empty():
+                del self._pending[key]
+        without_receipt = [p for p in self._pending.values() if p.receipt is None]
+        wait_finalized = any(
+            len(p.finalized_futures) > 0 for p in self._pending.values()
+        )
+        if len(without_receipt) == 0 and not wait_finalized:
+            return
+        zksync = self._web3.zksync
+        async with zksync.batch() as batch:
+            for pending in without_receipt:
+                batch.add(zksync.get_transaction_receipt(pending.tx_hash))
+            if wait_finalized:
+                batch.add(zksync.get_block("finalized"))
+            results = await batch.async_execute(raise_on_error=False)
+
+        for pending, receipt in zip(without_receipt, results):
+            if isinstance(receipt, Exception) or receipt["blockHash"] is None:
+                continue
+            pending.receipt = receipt
+            _set_result(pending.receipt_futures, receipt)
+            pending.receipt_futures = []
+
+        if wait_finalized:
+            finalized = results[-1]
+            if isinstance(finalized, Exception):
+                raise finalized
+            for pending in self._pending.values():
+                receipt = pending.receipt
+                if (
+                    receipt is not None
+                    and finalized["number"] >= receipt["blockNumber"]
+                ):
+                    _set_result(pending.finalized_futures, receipt)
+                    pending.finalized_futures = []
+
+    def _fail_all(self, error: BaseException):
+        for pending in self._pending.values():
+            for future in pending.receipt_futures + pending.finalized_futures:
+                if not future.done():
+                    if isinstance(error, asyncio.CancelledError):
+                        future.cancel()
+                    else:
+                        future.set_exception(error)
+        self._pending.clear()
@@ -0,0 +1,115 @@
+from types import TracebackType
+from typing import Any, List, Type, Union
+
+from web3._utils.batching import RequestBatcher
+from web3._utils.validation import raise_error_for_batch_response
+
+
+class ZkSyncRequestBatch(RequestBatcher):
+    """
+    Queues ZkSync module calls and sends them to the node as a single JSON-RPC array.
+
+    While the batch is open, calling any ``zks_*`` / ``eth_*`` method of the module
+    returns the request information instead of performing the call. Queued requests are
+    sent in one round trip when the batch is executed, and each response is run through the
+    result formatters of the method that produced it (``ZKSYNC_RESULT_FORMATTERS`` for
+    ZKsync specific methods).
+
+    Example:
+        with zksync_web3.zksync.batch() as batch:
+            for number in range(100, 200):
+                batch.add(zksync_web3.zksync.zks_get_block_details(number))
+        details = batch.results
+
+    A batch that is left without an exception is executed automatically.
+    """
+
+    def __init__(self, web3):
+        super(ZkSyncRequestBatch, self).__init__(web3)
+        self.results: List[Any] = []
+
+    def __len__(self) -> int:
+        if self._provider.is_async:
+            return len(self._async_requests_info)
+        return len(self._requests_info)
+
+    def execute(self, raise_on_error: bool = True) -> List[Any]:
+        """
+        Sends all queued requests as one JSON-RPC array.
+
+        :param raise_on_error: If False, a failed request does not abort the batch,
+            the raised exception is returned in place of its result instead.
+        """
+        self._validate_is_batching()
+        requests_info = self._requests_info
+        try:
+            request_func = self._provider.batch_request_func(
+                self.web3, self.web3.middleware_onion
+            )
+            response = request_func([request for request, _ in requests_info])
+            self.results = self._format_responses(
+                requests_info, response, raise_on_error
+            )
+        finally:
+            self._end_batching()
+        return self.results
+
+    async def async_execute(self, raise_on_error: bool = True) -> List[Any]:
+        """
+        asyncio counterpart of ``execute``.
+
+        :param raise_on_error: If False, a failed request does not abort the batch,
+            the raised exception is returned in place of its result instead.
+        """
+        self._validate_is_batching()
+        try:
+            requests_info = [await info for info in self._async_requests_info]
+            request_func = await self._provider.batch_request_func(
+                self.web3, self.web3.middleware_onion
+            )
+            response = await request_func([request for request, _ in requests_info])
+            self.results = self._format_responses(
+                requests_info, response, raise_on_error
+            )
+        finally:
+            self._end_batching()
+        return self.results
+
+    def _format_responses(
+        self, requests_info, response, raise_on_error: bool
+    ) -> List[Union[Any, Exception]]:
+        manager = self.web3.manager
+        if not isinstance(response, list):
+            raise_error_for_batch_response(response, manager.logger)
+
+        results = []
+        for info, resp in zip(requests_info, response):
+            try:
+                results.append(manager._format_batched_response(info, resp))
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                results.append(e)
+        return results
+
+    def __exit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_val: BaseException,
+        exc_tb: TracebackType,
+    ) -> None:
+        if exc_type is None and self._provider._is_batching and len(self) > 0:
+            self.execute()
+        else:
+            self._end_batching()
+
+    async def __aexit__(
+        self,
+        exc_type: Type[BaseException],
+        exc_val: BaseException,
+        exc_tb: TracebackType,
+    ) -> None:
+        if exc_type is None and self._provider._is_batching and len(self) > 0:
+            await self.async_execute()
+        else:
+            self._end_batching()
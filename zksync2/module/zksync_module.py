@@ -1,5 +1,8 @@
 from abc import ABC
-from typing import Any, Callable, List, Union
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Iterator, List, Optional, Union
 
 from eth_typing import Address
 from eth_utils import remove_0x_prefix
@@ -23,15 +26,27 @@ from web3._utils.method_formatters import (
     apply_module_to_formatters,
     is_not_null,
     to_ascii_if_bytes,
+    to_integer_if_hex,
 )
 from web3._utils.threads import Timeout
 from web3.contract import Contract
 from web3.eth import Eth
-from web3.exceptions import TransactionNotFound, TimeExhausted
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+    TransactionNotFound,
+    TimeExhausted,
+)
 from web3.method import Method, default_root_munger
 from web3.module import Module
 from web3.types import RPCEndpoint, _Hash32, TxReceipt
 
+from zksync2.core.cache import (
+    CacheBackend,
+    ChainMetadataCache,
+    FeeEstimateCache,
+    LRUCache,
+)
 from zksync2.core.types import (
     ContractSourceDebugInfo,
     BridgeAddresses,
@@ -54,14 +69,20 @@ from zksync2.core.types import (
     ProtocolVersion,
     TransactionWithDetailedOutput,
     FeeParams,
+    Config,
+    V2,
+    L2BridgeInfo,
+    Token,
+    TokenRegistry,
 )
-from zksync2.core.types import TransactionReceipt
+from zksync2.core.types import TransactionReceipt, TransactionResponse
 from zksync2.core.utils import (
     is_eth,
     LEGACY_ETH_ADDRESS,
     L2_BASE_TOKEN_ADDRESS,
     is_address_eq,
     BOOTLOADER_FORMAL_ADDRESS,
+    to_bytes,
 )
 from zksync2.manage_contracts.deploy_addresses import ZkSyncAddresses
 from zksync2.manage_contracts.utils import (
@@ -69,10 +90,13 @@ from zksync2.manage_contracts.utils import (
     icontract_deployer_abi_default,
     l2_bridge_abi_default,
     l2_shared_bridge_abi_default,
+    multicall3_abi_default,
 )
+from zksync2.module.fee_model import LocalFeeModel
+from zksync2.module.receipt_tracker import ReceiptStage, ReceiptTracker
+from zksync2.module.request_batch import ZkSyncRequestBatch
 from zksync2.module.request_types import *
 from zksync2.module.response_types import *
-from zksync2.transaction.transaction712 import Transaction712
 from zksync2.transaction.transaction_builders import (
     TxWithdraw,
     TxTransfer,
@@ -111,6 +135,9 @@ zks_get_contract_debug_info_rpc = RPCEndpoint("zks_getContractDebugInfo")
 zks_get_transaction_trace_rpc = RPCEndpoint("zks_getTransactionTrace")
 zks_get_testnet_paymaster_address = RPCEndpoint("zks_getTestnetPaymaster")
 
+# balanceOf(address)
+_BALANCE_OF_SELECTOR = bytes.fromhex("70a08231")
+
 
 def bytes_to_list(v: bytes) -> List[int]:
     return [int(e) for e in v]
@@ -170,6 +197,7 @@ def to_token(t: dict) -> Token:
     return Token(
         l1_address=to_checksum_address(t["l1Address"]),
         l2_address=to_checksum_address(t["l2Address"]),
+        name=t["name"],
         symbol=t["symbol"],
         decimals=t["decimals"],
     )
@@ -190,8 +218,14 @@ def to_bridge_address(t: dict) -> BridgeAddresses:
     )
 
 
+def to_datetime(value: Optional[str]) -> Optional[datetime]:
+    # not yet committed, proven or executed batches have no timestamps
+    if value is None:
+        return None
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%fZ")
+
+
 def to_batch_details(t: dict) -> BatchDetails:
-    datetime_format = "%Y-%m-%dT%H:%M:%S.%fZ"
     base_sys_contract_hashes = BaseSystemContractsHashes(
         bootloader=t["baseSystemContractsHashes"]["bootloader"],
         default_aa=t["baseSystemContractsHashes"]["default_aa"],
@@ -199,16 +233,16 @@ def to_batch_details(t: dict) -> BatchDetails:
     return BatchDetails(
         base_system_contracts_hashes=base_sys_contract_hashes,
         commit_tx_hash=t["commitTxHash"],
-        committed_at=datetime.strptime(t["committedAt"], datetime_format),
+        committed_at=to_datetime(t["committedAt"]),
         execute_tx_hash=t["executeTxHash"],
-        executed_at=datetime.strptime(t["executedAt"], datetime_format),
+        executed_at=to_datetime(t["executedAt"]),
         l1_gas_price=t["l1GasPrice"],
         l1_tx_count=t["l1TxCount"],
         l2_fair_gas_price=t["l2FairGasPrice"],
         l2_tx_count=t["l2TxCount"],
         number=t["number"],
         prove_tx_hash=t["proveTxHash"],
-        proven_at=datetime.strptime(t["provenAt"], datetime_format),
+        proven_at=to_datetime(t["provenAt"]),
         root_hash=t["rootHash"],
         status=t["status"],
         timestamp=t["timestamp"],
@@ -216,17 +250,16 @@ def to_batch_details(t: dict) -> BatchDetails:
 
 
 def to_block_details(t: dict) -> BlockDetails:
-    datetime_format = "%Y-%m-%dT%H:%M:%S.%fZ"
     return BlockDetails(
         commit_tx_hash=t["commitTxHash"],
-        committed_at=datetime.strptime(t["committedAt"], datetime_format),
+        committed_at=to_datetime(t["committedAt"]),
         execute_tx_hash=t["executeTxHash"],
-        executed_at=datetime.strptime(t["executedAt"], datetime_format),
+        executed_at=to_datetime(t["executedAt"]),
         l1_tx_count=t["l1TxCount"],
         l2_tx_count=t["l2TxCount"],
         number=t["number"],
         prove_tx_hash=t["proveTxHash"],
-        proven_at=datetime.strptime(t["provenAt"], datetime_format),
+        proven_at=to_datetime(t["provenAt"]),
         root_hash=t["rootHash"],
         status=t["status"],
         timestamp=t["timestamp"],
@@ -277,8 +310,8 @@ def to_l2_to_l1_logs(t: dict) -> L1ToL2Log:
     )
 
 
-def to_transaction_by_hash(t: dict) -> Transaction712:
-    return Transaction712()
+def to_transaction_by_hash(t: dict) -> TransactionResponse:
+    return TransactionResponse(t)
 
 
 def to_block_range(t: dict) -> BlockRange:
@@ -305,11 +338,65 @@ def to_fee(v: dict) -> Fee:
     )
 
 
+# L1 gas paid per byte of pubdata, fee parameters V1 derive the pubdata price from it
+L1_GAS_PER_PUBDATA_BYTE = 17
+
+
+def to_fee_params(v: dict) -> FeeParams:
+    """
+    Converts the result of ``zks_getFeeParams``. Parameters of the V1 fee model are expressed
+    as the equivalent V2 parameters: no batch overhead and a pubdata price of
+    ``L1_GAS_PER_PUBDATA_BYTE`` times the L1 gas price.
+    """
+    if "V2" in v:
+        params = v["V2"]
+        config = params["config"]
+        conversion_ratio = params.get(
+            "conversion_ratio", {"numerator": 1, "denominator": 1}
+        )
+        return FeeParams(
+            V2=V2(
+                config=Config(
+                    minimal_l2_gas_price=config["minimal_l2_gas_price"],
+                    compute_overhead_part=config["compute_overhead_part"],
+                    pubdata_overhead_part=config["pubdata_overhead_part"],
+                    batch_overhead_l1_gas=config["batch_overhead_l1_gas"],
+                    max_gas_per_batch=config["max_gas_per_batch"],
+                    max_pubdata_per_batch=config["max_pubdata_per_batch"],
+                ),
+                l1_gas_price=params["l1_gas_price"],
+                l1_pubdata_price=params["l1_pubdata_price"],
+                conversion_ratio_numerator=conversion_ratio["numerator"],
+                conversion_ratio_denominator=conversion_ratio["denominator"],
+            )
+        )
+    if "V1" in v:
+        params = v["V1"]
+        return FeeParams(
+            V2=V2(
+                config=Config(
+                    minimal_l2_gas_price=params["config"]["minimal_l2_gas_price"],
+                    compute_overhead_part=0,
+                    pubdata_overhead_part=0,
+                    batch_overhead_l1_gas=0,
+                    max_gas_per_batch=1,
+                    max_pubdata_per_batch=1,
+                ),
+                l1_gas_price=params["l1_gas_price"],
+                l1_pubdata_price=params["l1_gas_price"] * L1_GAS_PER_PUBDATA_BYTE,
+            )
+        )
+    raise ValueError(f"Unsupported fee parameters version: {list(v)}")
+
+
 def to_msg_proof(v: dict) -> ZksMessageProof:
     return ZksMessageProof(id=v["id"], proof=v["proof"], root=v["root"])
 
 
 ZKSYNC_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
+    zks_l1_batch_number_rpc: to_integer_if_hex,
+    zks_l1_chain_id_rpc: to_integer_if_hex,
+    zks_estimate_gas_l1_to_l2_rpc: to_integer_if_hex,
     zks_get_bridge_contracts_rpc: to_bridge_address,
     zks_get_all_account_balances_rpc: to_zks_account_balances,
     zks_estimate_fee_rpc: to_fee,
@@ -363,9 +450,42 @@ def zksync_get_result_formatters(
     return compose(*partial_formatters, *formatters)
 
 
-class ZkSync(Eth, ABC):
+def zksync_get_lazy_result_formatters(
+    method_name: Union[RPCEndpoint, Callable[..., RPCEndpoint]],
+    module: "Module",
+) -> Callable[..., Any]:
+    """
+    Applies only ``ZKSYNC_RESULT_FORMATTERS``, for results wrapped in objects parsing their
+    fields on access.
+    """
+    return compose(*combine_formatters((ZKSYNC_RESULT_FORMATTERS,), method_name))
+
+
+def _chain_metadata_property(key: str, accessor: str) -> property:
+    """
+    Property reading the chain constant ``key`` through the ``accessor`` method of the module,
+    which fetches and caches it if needed. Assigning the property overrides the cached value.
+    """
+
+    def getter(self):
+        return self._chain_metadata_value(key, accessor)
+
+    def setter(self, value):
+        self.chain_metadata.set(key, value)
+
+    return property(getter, setter)
+
+
+class ZkSyncMethods:
+    """
+    JSON-RPC method definitions shared by the blocking ``ZkSync`` and the
+    asyncio ``AsyncZkSync`` modules.
+    """
+
     _zks_l1_batch_number: Method[Callable[[], ZksL1BatchNumber]] = Method(
-        zks_l1_batch_number_rpc, mungers=None
+        zks_l1_batch_number_rpc,
+        mungers=None,
+        result_formatters=zksync_get_result_formatters,
     )
     _zks_get_l1_batch_block_range: Method[Callable[[int], ZksBlockRange]] = Method(
         zks_get_l1_batch_block_range_rpc, mungers=[default_root_munger]
@@ -398,6 +518,7 @@ class ZkSync(Eth, ABC):
         zks_estimate_gas_l1_to_l2_rpc,
         mungers=[default_root_munger],
         request_formatters=zksync_get_request_formatters,
+        result_formatters=zksync_get_result_formatters,
     )
     _zks_estimate_fee: Method[Callable[[Transaction], ZksEstimateFee]] = Method(
         zks_estimate_fee_rpc,
@@ -419,7 +540,9 @@ class ZkSync(Eth, ABC):
     )
 
     _zks_l1_chain_id: Method[Callable[[], ZksL1ChainId]] = Method(
-        zks_l1_chain_id_rpc, mungers=None
+        zks_l1_chain_id_rpc,
+        mungers=None,
+        result_formatters=zksync_get_result_formatters,
     )
 
     _zks_get_all_account_balances: Method[Callable[[Address], ZksAccountBalances]] = (
@@ -497,10 +620,12 @@ class ZkSync(Eth, ABC):
             result_formatters=zksync_get_result_formatters,
         )
     )
-    _eth_get_transaction_by_hash: Method[Callable[[HexStr], ZksTransactions]] = Method(
-        eth_get_transaction_by_hash_rpc,
-        mungers=[default_root_munger],
-        result_formatters=zksync_get_result_formatters,
+    _eth_get_transaction_by_hash: Method[Callable[[HexStr], TransactionResponse]] = (
+        Method(
+            eth_get_transaction_by_hash_rpc,
+            mungers=[default_root_munger],
+            result_formatters=zksync_get_lazy_result_formatters,
+        )
     )
     # TODO: implement it
     _zks_set_contract_debug_info: Method[
@@ -518,15 +643,92 @@ class ZkSync(Eth, ABC):
         zks_get_testnet_paymaster_address, mungers=[default_root_munger]
     )
 
+    chain_metadata: ChainMetadataCache
+
+    def _is_batching(self) -> bool:
+        return self.w3.provider._is_batching
+
+    def _chain_metadata_value(self, key: str, accessor: str) -> Any:
+        # accessors of the asyncio module are coroutines, only cached values are returned
+        return self.chain_metadata.get(key)
+
+    main_contract_address = _chain_metadata_property(
+        "main_contract", "zks_main_contract"
+    )
+    bridgehub_contract_address = _chain_metadata_property(
+        "bridgehub_contract", "zks_get_bridgehub_contract_address"
+    )
+    bridge_addresses = _chain_metadata_property(
+        "bridge_contracts", "zks_get_bridge_contracts"
+    )
+    base_token = _chain_metadata_property(
+        "base_token", "zks_get_base_token_contract_address"
+    )
+
+    def batch(self) -> ZkSyncRequestBatch:
+        """
+        Returns a request batch: calls made on this module while the batch is open are
+        queued and sent to the node as a single JSON-RPC array.
+
+        Example:
+            with zksync_web3.zksync.batch() as batch:
+                batch.add(zksync_web3.zksync.zks_get_l1_batch_details(1))
+                batch.add(zksync_web3.zksync.eth_get_transaction_receipt(tx_hash))
+            batch_details, receipt = batch.results
+        """
+        return ZkSyncRequestBatch(self.w3)
+
+
+class ZkSync(ZkSyncMethods, Eth, ABC):
     def __init__(self, web3: "Web3"):
         super(ZkSync, self).__init__(web3)
-        self.main_contract_address = None
-        self.bridgehub_contract_address = None
-        self.bridge_addresses = None
-        self.base_token = None
+        self.chain_metadata = ChainMetadataCache()
+        self.bridge_topology: CacheBackend = LRUCache()
+        self._bridge_topology_seeded = False
+        self.token_addresses: CacheBackend = LRUCache(maxsize=65536)
+        # reuses the fee estimations of same shape transactions, if set
+        self.fee_estimates: Optional[FeeEstimateCache] = None
+        # derives fees locally from zks_getFeeParams, if set
+        self.fee_model: Optional[LocalFeeModel] = None
+        self._receipt_tracker: Optional[ReceiptTracker] = None
+
+    @property
+    def receipt_tracker(self) -> ReceiptTracker:
+        """
+        ``ReceiptTracker`` shared by every caller of this module, its poller thread is
+        started by the first tracked transaction.
+        """
+        if self._receipt_tracker is None:
+            self._receipt_tracker = ReceiptTracker(self)
+        return self._receipt_tracker
+
+    def _chain_metadata_value(self, key: str, accessor: str) -> Any:
+        return getattr(self, accessor)()
+
+    def cached_chain_metadata(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Returns the chain constant stored under ``key`` in ``chain_metadata``, calling ``fetch``
+        when it is not cached yet. The cache is emptied when the protocol version changes.
+
+        :param key: Name of the constant.
+        :param fetch: Returns the value from the node.
+        """
+        if self._is_batching():
+            return fetch()
+        if self.chain_metadata.needs_validation():
+            self.chain_metadata.validate(self._zks_get_protocol_version(None))
+        value = self.chain_metadata.get(key)
+        if value is None:
+            value = fetch()
+            self.chain_metadata.set(key, value)
+        return value
+
+    @property
+    def chain_id(self) -> int:
+        return self.cached_chain_metadata("chain_id", self._chain_id)
 
     def zks_l1_batch_number(self) -> int:
-        return int(self._zks_l1_batch_number(), 16)
+        return self._zks_l1_batch_number()
 
     def zks_get_l1_batch_block_range(self, l1_batch_number: int) -> BlockRange:
         return self._zks_get_l1_batch_block_range(l1_batch_number)
@@ -541,7 +743,7 @@ class ZkSync(Eth, ABC):
         return self._zks_get_transaction_details(txHash)
 
     def zks_estimate_gas_l1_to_l2(self, transaction: Transaction) -> int:
-        return int(self._zks_estimate_gas_l1_to_l2(transaction), 16)
+        return self._zks_estimate_gas_l1_to_l2(transaction)
 
     def zks_get_proof(self, address: HexStr, key: List[HexStr], l1_batch_number: int):
         return self._zks_get_proof(address, key, l1_batch_number)
@@ -558,9 +760,7 @@ class ZkSync(Eth, ABC):
 
         return self._zks_get_protocol_version(id)
 
-    def zks_get_confirmed_tokens(
-        self, start: int = 0, limit: int = 255
-    ) -> ProtocolVersion:
+    def zks_get_confirmed_tokens(self, start: int = 0, limit: int = 255) -> List[dict]:
         """
         Returns confirmed tokens. A confirmed token is any token bridged to ZKsync Era via the official bridge.
 
@@ -573,6 +773,42 @@ class ZkSync(Eth, ABC):
 
         return self._zks_get_confirmed_tokens(start, limit)
 
+    def iter_confirmed_tokens(
+        self, limit: int = 255, registry: Optional[TokenRegistry] = None
+    ) -> Iterator[Token]:
+        """
+        Yields every confirmed token as a ``Token``, walking the pages of
+        ``zks_get_confirmed_tokens``.
+
+        The next page is requested in a background thread while the caller processes the
+        current one.
+
+        Example:
+            registry = TokenRegistry()
+            for token in zksync_web3.zksync.iter_confirmed_tokens(registry=registry):
+                ...
+            usdc = registry.by_symbol("USDC")
+
+        :param limit: The maximum number of tokens per request.
+        :param registry: Registry every yielded token is added to.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            start = 0
+            page = executor.submit(self.zks_get_confirmed_tokens, start, limit)
+            while page is not None:
+                tokens = page.result()
+                start += len(tokens)
+                page = None
+                if len(tokens) == limit:
+                    page = executor.submit(self.zks_get_confirmed_tokens, start, limit)
+                for t in tokens:
+                    token = to_token(t)
+                    if registry is not None:
+                        registry.add(token)
+                    yield token
+
     def zks_send_raw_transaction_with_detailed_output(
         self, tx: Union[HexStr, bytes]
     ) -> ProtocolVersion:
@@ -601,6 +837,12 @@ class ZkSync(Eth, ABC):
         """
         return self._zks_get_fee_params()
 
+    def get_fee_params(self) -> FeeParams:
+        """
+        Returns the current fee parameters as ``FeeParams``, see ``to_fee_params``.
+        """
+        return to_fee_params(self.zks_get_fee_params())
+
     def zks_estimate_gas_transfer(
         self, transaction: Transaction, token_address: HexStr = ADDRESS_DEFAULT
     ) -> int:
@@ -624,18 +866,56 @@ class ZkSync(Eth, ABC):
         return self.zks_estimate_gas_l1_to_l2(transaction)
 
     def zks_estimate_fee(self, transaction: Transaction) -> Fee:
-        return self._zks_estimate_fee(transaction)
+        """
+        Returns the fee estimation of the transaction. If ``fee_estimates`` is set, the
+        estimation of a transaction of the same shape is reused when available.
+
+        :param transaction: The transaction.
+        """
+        if self.fee_estimates is None or self._is_batching():
+            return self._zks_estimate_fee(transaction)
+        fee = self.cached_fee_estimate(transaction)
+        if fee is None:
+            fee = self.store_fee_estimate(
+                transaction, self._zks_estimate_fee(transaction)
+            )
+        return fee
+
+    def cached_fee_estimate(self, transaction: Transaction) -> Optional[Fee]:
+        """
+        Returns the estimation of a transaction of the same shape kept in ``fee_estimates``,
+        None if there is none.
+
+        :param transaction: The transaction.
+        """
+        cache = self.fee_estimates
+        if cache is None:
+            return None
+        if cache.needs_validation():
+            cache.validate(self.get_fee_params().V2.l1_gas_price)
+        return cache.get(cache.key(transaction))
+
+    def store_fee_estimate(self, transaction: Transaction, fee: Fee) -> Fee:
+        """
+        Keeps the estimation of the transaction in ``fee_estimates`` and returns it as it
+        is reused, with the raised gas limit.
+
+        :param transaction: The estimated transaction.
+        :param fee: The estimation.
+        """
+        cache = self.fee_estimates
+        if cache is None:
+            return fee
+        return cache.set(cache.key(transaction), fee)
 
     def zks_main_contract(self) -> HexStr:
-        if self.main_contract_address is None:
-            self.main_contract_address = self._zks_main_contract()
-        return self.main_contract_address
+        return self.cached_chain_metadata("main_contract", self._zks_main_contract)
 
     def zks_get_base_token_contract_address(self):
         """Returns the L1 base token address."""
-        if self.base_token is None:
-            self.base_token = self._zks_get_base_token_contract_address()
-        return self.base_token
+        return self.cached_chain_metadata(
+            "base_token", self._zks_get_base_token_contract_address
+        )
 
     def is_eth_based_chain(self) -> bool:
         return is_address_eq(
@@ -643,15 +923,15 @@ class ZkSync(Eth, ABC):
         )
 
     def zks_get_bridgehub_contract_address(self) -> HexStr:
-        if self.bridgehub_contract_address is None:
-            self.bridgehub_contract_address = self._zks_get_bridgehub_contract_address()
-        return self.bridgehub_contract_address
+        return self.cached_chain_metadata(
+            "bridgehub_contract", self._zks_get_bridgehub_contract_address
+        )
 
     def zks_get_token_price(self, token_address: TokenAddress) -> Decimal:
         return self._zks_get_token_price(token_address)
 
     def zks_l1_chain_id(self) -> int:
-        return int(self._zks_l1_chain_id(), 16)
+        return self.cached_chain_metadata("l1_chain_id", self._zks_l1_chain_id)
 
     def zks_get_balance(
         self,
@@ -674,8 +954,150 @@ class ZkSync(Eth, ABC):
                 Web3.to_checksum_address(token_address), abi=get_erc20_abi()
             )
             return token.functions.balanceOf(address).call()
-        except:
+        except BadFunctionCallOutput:
+            # no contract at the token address, the token is not bridged yet
+            return 0
+
+    def get_balances(
+        self,
+        accounts: List[HexStr],
+        tokens: List[Optional[HexStr]],
+        block_tag=ZkBlockParams.COMMITTED.value,
+        multicall_address: Optional[HexStr] = None,
+        chunk_size: int = 500,
+        batch_size: int = 100,
+    ) -> List[List[Union[int, Exception]]]:
+        """
+        Returns the balance of every account in every token, ``balances[i][j]`` being the
+        balance of ``accounts[i]`` in ``tokens[j]``. A balance that could not be fetched is
+        replaced by the raised exception.
+
+        All balances are read at the same block. Base token balances are fetched with
+        ``eth_getBalance`` and ERC20 balances with ``balanceOf`` calls. By default, all these
+        reads are aggregated in JSON-RPC batches of ``batch_size`` requests, so no node needs
+        any contract. If ``multicall_address`` is set, ``balanceOf`` calls are further
+        aggregated in chunks of ``chunk_size`` through the Multicall3 contract.
+
+        :param accounts: Addresses of the accounts.
+        :param tokens: Addresses of the tokens on L2, None stands for the base token.
+        :param block_tag: Block at which balances are read.
+        :param multicall_address: Address of Multicall3 on L2, None to aggregate the
+            ``balanceOf`` calls in JSON-RPC batches only.
+        :param chunk_size: Maximal number of calls aggregated in one Multicall3 call.
+        :param batch_size: Maximal number of requests sent in one JSON-RPC batch.
+        """
+        if chunk_size <= 0 or batch_size <= 0:
+            raise ValueError("chunk_size and batch_size must be positive")
+        if block_tag == ZkBlockParams.COMMITTED.value:
+            # same block as latest, web3 does not know the zkSync tag
+            block_tag = ZkBlockParams.LATEST.value
+        if not isinstance(block_tag, int):
+            block_tag = self.get_block(block_tag)["number"]
+        tokens = [self._balance_token(token) for token in tokens]
+        balances: List[List[Union[int, Exception]]] = [
+            [0] * len(tokens) for _ in accounts
+        ]
+
+        def set_balance(i: int, j: int, result: Union[HexBytes, Exception]):
+            balances[i][j] = result
+
+        def set_token_balance(i: int, j: int, result: Union[HexBytes, Exception]):
+            balances[i][j] = self._decode_balance(result)
+
+        requests = []
+        token_calls = []
+        for i, account in enumerate(accounts):
+            account = Web3.to_checksum_address(account)
+            for j, token in enumerate(tokens):
+                if token == L2_BASE_TOKEN_ADDRESS:
+                    requests.append(
+                        (
+                            partial(self.get_balance, account, block_tag),
+                            partial(set_balance, i, j),
+                        )
+                    )
+                    continue
+                data = _BALANCE_OF_SELECTOR + bytes(12) + to_bytes(account)
+                if multicall_address is not None:
+                    token_calls.append((i, j, (token, True, data)))
+                    continue
+                requests.append(
+                    (
+                        partial(self.call, {"to": token, "data": data}, block_tag),
+                        partial(set_token_balance, i, j),
+                    )
+                )
+
+        if multicall_address is not None and len(token_calls) > 0:
+            multicall = self.contract(
+                Web3.to_checksum_address(multicall_address),
+                abi=multicall3_abi_default(),
+            )
+
+            def set_chunk_balances(chunk: list, result: Union[HexBytes, Exception]):
+                if not isinstance(result, Exception):
+                    try:
+                        result = self.w3.codec.decode(["(bool,bytes)[]"], result)[0]
+                    except Exception as e:
+                        result = BadFunctionCallOutput(str(e))
+                for index, (i, j, call) in enumerate(chunk):
+                    if isinstance(result, Exception):
+                        balances[i][j] = result
+                    elif not result[index][0]:
+                        balances[i][j] = ContractLogicError(
+                            f"balanceOf reverted for token {call[0]}"
+                        )
+                    else:
+                        balances[i][j] = self._decode_balance(result[index][1])
+
+            for start in range(0, len(token_calls), chunk_size):
+                chunk = token_calls[start : start + chunk_size]
+                data = multicall.encode_abi(
+                    "aggregate3", args=[[call for _, _, call in chunk]]
+                )
+                requests.append(
+                    (
+                        partial(
+                            self.call,
+                            {"to": multicall.address, "data": data},
+                            block_tag,
+                        ),
+                        partial(set_chunk_balances, chunk),
+                    )
+                )
+
+        for start in range(0, len(requests), batch_size):
+            chunk = requests[start : start + batch_size]
+            with self.batch() as batch:
+                for request, _ in chunk:
+                    batch.add(request())
+                results = batch.execute(raise_on_error=False)
+            for (_, handle), result in zip(chunk, results):
+                handle(result)
+        return balances
+
+    def _balance_token(self, token: Optional[HexStr]) -> HexStr:
+        if token is None or is_address_eq(token, L2_BASE_TOKEN_ADDRESS):
+            return L2_BASE_TOKEN_ADDRESS
+        if is_address_eq(token, LEGACY_ETH_ADDRESS) or is_address_eq(
+            token, ETH_ADDRESS_IN_CONTRACTS
+        ):
+            token = self.l2_token_address(ETH_ADDRESS_IN_CONTRACTS)
+            if token == L2_BASE_TOKEN_ADDRESS:
+                return token
+        return Web3.to_checksum_address(token)
+
+    def _decode_balance(self, result: Union[bytes, Exception]) -> Union[int, Exception]:
+        if isinstance(result, Exception):
+            return result
+        # no contract at the token address, the token is not bridged yet
+        if len(result) == 0:
             return 0
+        if len(result) != 32:
+            return BadFunctionCallOutput(
+                f"Invalid balanceOf output: {HexBytes(result).hex()}"
+            )
+        return int.from_bytes(result, byteorder="big")
 
     def is_base_token(self, token: HexStr):
         return is_address_eq(
@@ -687,24 +1109,37 @@ class ZkSync(Eth, ABC):
         Returns the L1 token address equivalent for a L2 token address as they are not equal.
         ETH address is set to zero address.
 
+        Pairs resolved by the default shared bridge are kept in ``token_addresses``, see
+        ``prefill_token_addresses``.
+
         :param token: The address of the token on L2.
         """
         if token == LEGACY_ETH_ADDRESS:
             return LEGACY_ETH_ADDRESS
 
         bridge_address = self.zks_get_bridge_contracts()
+        key = self._token_address_key(bridge_address, "l1", token)
+        cached = self.token_addresses.get(key)
+        if cached is not None:
+            return cached
         shared_bridge = self.contract(
             Web3.to_checksum_address(bridge_address.shared_l2_default_bridge),
             abi=l2_bridge_abi_default(),
         )
 
-        return shared_bridge.functions.l1TokenAddress(token).call()
+        l1_token = shared_bridge.functions.l1TokenAddress(token).call()
+        # tokens not bridged yet resolve to the zero address until their first deposit
+        if not is_address_eq(l1_token, ADDRESS_DEFAULT):
+            self._store_token_addresses(bridge_address, l1_token, token)
+        return l1_token
 
     def l2_token_address(self, token: HexStr, bridge_address: HexStr = None) -> HexStr:
         """
         Returns the L2 token address equivalent for a L1 token address as they are not equal.
         ETH address is set to zero address.
 
+        Resolved pairs are kept in ``token_addresses`` per bridge, see ``prefill_token_addresses``.
+
         :param token: The address of the token on L1.
         :param bridge_address: The address of custom bridge, which will be used to get l2 token address.
         """
@@ -716,20 +1151,65 @@ class ZkSync(Eth, ABC):
 
         if bridge_address is None:
             bridge_address = self.zks_get_bridge_contracts()
+        key = self._token_address_key(bridge_address, "l2", token)
+        cached = self.token_addresses.get(key)
+        if cached is not None:
+            return cached
         l2_shared_bridge = self.contract(
             Web3.to_checksum_address(bridge_address.shared_l2_default_bridge),
             abi=l2_bridge_abi_default(),
         )
 
-        return l2_shared_bridge.functions.l2TokenAddress(token).call()
+        l2_token = l2_shared_bridge.functions.l2TokenAddress(token).call()
+        self._store_token_addresses(bridge_address, token, l2_token)
+        return l2_token
+
+    def prefill_token_addresses(self, limit: int = 255) -> int:
+        """
+        Stores the L1/L2 address pairs of every confirmed token in ``token_addresses``, so
+        ``l1_token_address`` and ``l2_token_address`` answer them without a contract call.
+
+        Tokens are read page by page from ``zks_get_confirmed_tokens``. Returns the number of
+        tokens stored.
+
+        :param limit: The maximum number of tokens per request.
+        """
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        bridge_address = self.zks_get_bridge_contracts()
+        count = 0
+        for token in self.iter_confirmed_tokens(limit):
+            self._store_token_addresses(
+                bridge_address, token.l1_address, token.l2_address
+            )
+            count += 1
+        return count
+
+    def _token_address_key(
+        self, bridge_address: BridgeAddresses, side: str, token: HexStr
+    ) -> str:
+        bridge = bridge_address.shared_l2_default_bridge.lower()
+        return f"{self.chain_id}:{bridge}:{side}:{token.lower()}"
+
+    def _store_token_addresses(
+        self, bridge_address: BridgeAddresses, l1_token: HexStr, l2_token: HexStr
+    ):
+        l1_token = Web3.to_checksum_address(l1_token)
+        l2_token = Web3.to_checksum_address(l2_token)
+        self.token_addresses.set(
+            self._token_address_key(bridge_address, "l2", l1_token), l2_token
+        )
+        self.token_addresses.set(
+            self._token_address_key(bridge_address, "l1", l2_token), l1_token
+        )
 
     def zks_get_all_account_balances(self, addr: Address) -> ZksAccountBalances:
         return self._zks_get_all_account_balances(addr)
 
     def zks_get_bridge_contracts(self) -> BridgeAddresses:
-        if self.bridge_addresses is None:
-            self.bridge_addresses = self._zks_get_bridge_contracts()
-        return self.bridge_addresses
+        return self.cached_chain_metadata(
+            "bridge_contracts", self._zks_get_bridge_contracts
+        )
 
     def zks_get_l2_to_l1_msg_proof(
         self, block: int, sender: HexStr, message: str, l2log_pos: Optional[int]
@@ -748,7 +1228,7 @@ class ZkSync(Eth, ABC):
     def eth_get_transaction_receipt(self, tx: HexStr) -> TransactionReceipt:
         return self._eth_get_transaction_receipt(tx)
 
-    def eth_get_transaction_by_hash(self, tx: HexStr) -> Transaction712:
+    def eth_get_transaction_by_hash(self, tx: HexStr) -> TransactionResponse:
         return self._eth_get_transaction_by_hash(tx)
 
     @staticmethod
@@ -808,20 +1288,22 @@ class ZkSync(Eth, ABC):
     def wait_finalized(
         self, transaction_hash: _Hash32, timeout: float = 120, poll_latency: float = 0.1
     ) -> TxReceipt:
+        tx_receipt = None
         try:
             with Timeout(timeout) as _timeout:
                 while True:
-                    try:
+                    if tx_receipt is None:
+                        try:
+                            tx_receipt = self.get_transaction_receipt(transaction_hash)
+                        except TransactionNotFound:
+                            pass
+                        if tx_receipt is not None and tx_receipt["blockHash"] is None:
+                            tx_receipt = None
+                    # the receipt does not change once included, only the finalized block is polled
+                    if tx_receipt is not None:
                         block = self.get_block("finalized")
-                        tx_receipt = self.get_transaction_receipt(transaction_hash)
-                    except TransactionNotFound:
-                        tx_receipt = None
-                    if (
-                        tx_receipt is not None
-                        and tx_receipt["blockHash"] is not None
-                        and block["number"] >= tx_receipt["blockNumber"]
-                    ):
-                        break
+                        if block["number"] >= tx_receipt["blockNumber"]:
+                            break
                     _timeout.sleep(poll_latency)
             return tx_receipt
 
@@ -830,6 +1312,28 @@ class ZkSync(Eth, ABC):
                 f"Transaction {HexBytes(transaction_hash) !r} is not in the chain after {timeout} seconds"
             )
 
+    def wait_for_l1_execution(
+        self, transaction_hash: _Hash32, timeout: float = 3600
+    ) -> TxReceipt:
+        """
+        Waits until the L1 batch including the transaction is executed on L1, which is
+        required before finalizing a withdrawal.
+
+        Uses ``receipt_tracker``, so the batch details are polled once per batch for all
+        transactions waiting in it.
+
+        :param transaction_hash: Hash of the L2 transaction.
+        :param timeout: Seconds after which ``TimeExhausted`` is raised.
+        """
+        future = self.receipt_tracker.track(transaction_hash, ReceiptStage.EXECUTED)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise TimeExhausted(
+                f"Transaction {HexBytes(transaction_hash) !r} is not executed on L1 after {timeout} seconds"
+            )
+
     def get_withdraw_transaction(
         self,
         tx: WithdrawTransaction,
@@ -930,14 +1434,55 @@ class ZkSync(Eth, ABC):
 
         :param address: The bridge address.
         """
-        bridge = self.contract(
+        return self.l2_bridge_info(address).is_legacy
+
+    def l2_bridge_info(self, address: HexStr) -> L2BridgeInfo:
+        """
+        Returns whether the L2 bridge is legacy and the address of its L1 counterpart.
+
+        Answers never change for a bridge, they are kept in ``bridge_topology``, which can be
+        replaced by a persistent backend such as ``SqliteCache``. The default shared bridge from
+        ``zks_get_bridge_contracts`` is stored without probing the contract.
+
+        :param address: The L2 bridge address.
+        """
+        key = f"{self.chain_id}:{address.lower()}"
+        cached = self.bridge_topology.get(key)
+        if cached is None and not self._bridge_topology_seeded:
+            self._seed_bridge_topology()
+            cached = self.bridge_topology.get(key)
+        if cached is None:
+            info = self._fetch_l2_bridge_info(address)
+            self.bridge_topology.set(key, [info.is_legacy, info.l1_bridge])
+            return info
+        return L2BridgeInfo(is_legacy=cached[0], l1_bridge=cached[1])
+
+    def _seed_bridge_topology(self):
+        bridges = self.zks_get_bridge_contracts()
+        key = f"{self.chain_id}:{bridges.shared_l2_default_bridge.lower()}"
+        if key not in self.bridge_topology:
+            self.bridge_topology.set(
+                key, [False, Web3.to_checksum_address(bridges.shared_l1_default_bridge)]
+            )
+        self._bridge_topology_seeded = True
+
+    def _fetch_l2_bridge_info(self, address: HexStr) -> L2BridgeInfo:
+        shared_bridge = self.contract(
             address=Web3.to_checksum_address(address),
             abi=l2_shared_bridge_abi_default(),
         )
         try:
-            bridge.functions.l1SharedBridge().call()
-            return False
-        except:
+            return L2BridgeInfo(
+                is_legacy=False,
+                l1_bridge=shared_bridge.functions.l1SharedBridge().call(),
+            )
+        except (ContractLogicError, BadFunctionCallOutput):
             pass
 
-        return True
+        legacy_bridge = self.contract(
+            address=Web3.to_checksum_address(address),
+            abi=l2_bridge_abi_default(),
+        )
+        return L2BridgeInfo(
+            is_legacy=True, l1_bridge=legacy_bridge.functions.l1Bridge().call()
+        )
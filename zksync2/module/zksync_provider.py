@@ -1,17 +1,163 @@
 import logging
-from typing import Union, Optional, Any
-from web3 import HTTPProvider
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
 from eth_typing import URI
+from requests import Session
+from requests.adapters import HTTPAdapter
+from web3 import HTTPProvider
+from web3.providers.rpc.utils import check_if_retry_on_failure
 from web3.types import RPCEndpoint, RPCResponse
 
+DEFAULT_TIMEOUT = 30.0
+
+# Methods of the request currently being sent by the provider, used to pick its timeout.
+_current_methods: ContextVar[Tuple[str, ...]] = ContextVar(
+    "zksync_current_methods", default=()
+)
+
+
+@dataclass
+class ConnectionPoolOptions:
+    """
+    HTTP connection pool settings of ``ZkSyncProvider`` and ``AsyncZkSyncProvider``.
+
+    :param pool_connections: Number of per-host connection pools kept by the session.
+    :param pool_maxsize: Maximum number of connections kept open to a single host.
+    :param pool_block: Wait for a free connection instead of opening a throwaway one
+        when all ``pool_maxsize`` connections are busy.
+    :param keep_alive: Reuse connections between requests.
+    :param keep_alive_timeout: Seconds an idle connection stays open (asyncio provider only).
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 64
+    pool_block: bool = False
+    keep_alive: bool = True
+    keep_alive_timeout: float = 30.0
+
+
+def get_method_timeout(
+    methods: Tuple[str, ...],
+    timeout: Optional[float],
+    method_timeouts: Dict[str, float],
+) -> Optional[float]:
+    """
+    Returns the timeout of a request sending ``methods``, a batch waits for its slowest method.
+
+    :param methods: JSON-RPC methods of the request.
+    :param timeout: Timeout used for methods without an explicit one.
+    :param method_timeouts: Timeouts by JSON-RPC method name.
+    """
+    timeouts = [method_timeouts.get(m, timeout) for m in methods]
+    if len(timeouts) == 0:
+        return timeout
+    if None in timeouts:
+        return None
+    return max(timeouts)
+
 
 class ZkSyncProvider(HTTPProvider):
+    """
+    HTTP provider that sends all requests, from any thread, over one pooled keep-alive session.
+
+    :param url: ZKsync node URL.
+    :param timeout: Request timeout in seconds, ``None`` waits forever.
+    :param method_timeouts: Timeouts by JSON-RPC method name, e.g. ``{"zks_getProof": 120}``.
+    :param pool_options: Connection pool settings.
+    :param session: Preconfigured session, ``pool_options`` are ignored when it is given.
+    """
+
     logger = logging.getLogger("ZkSyncProvider")
 
-    def __init__(self, url: Optional[Union[URI, str]]):
-        super(ZkSyncProvider, self).__init__(url, request_kwargs={"timeout": 1000})
+    def __init__(
+        self,
+        url: Optional[Union[URI, str]],
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        method_timeouts: Optional[Dict[str, float]] = None,
+        pool_options: Optional[ConnectionPoolOptions] = None,
+        session: Optional[Session] = None,
+    ):
+        self.timeout = timeout
+        self.method_timeouts = dict(method_timeouts or {})
+        self.pool_options = pool_options or ConnectionPoolOptions()
+        if session is None:
+            session = self._build_session(self.pool_options)
+        self.session = session
+        super(ZkSyncProvider, self).__init__(url, request_kwargs={"timeout": timeout})
+
+    @staticmethod
+    def _build_session(pool_options: ConnectionPoolOptions) -> Session:
+        session = Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_options.pool_connections,
+            pool_maxsize=pool_options.pool_maxsize,
+            pool_block=pool_options.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not pool_options.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def get_request_kwargs(self) -> Dict[str, Any]:
+        kwargs = dict(super(ZkSyncProvider, self).get_request_kwargs())
+        kwargs["timeout"] = get_method_timeout(
+            _current_methods.get(), self.timeout, self.method_timeouts
+        )
+        return kwargs
+
+    def _post(self, methods: Tuple[str, ...], request_data: bytes) -> bytes:
+        # posts with the session directly, the web3 session cache is per thread
+        token = _current_methods.set(methods)
+        try:
+            kwargs = self.get_request_kwargs()
+        finally:
+            _current_methods.reset(token)
+        response = self.session.post(self.endpoint_uri, data=request_data, **kwargs)
+        response.raise_for_status()
+        return response.content
+
+    def _make_request(self, method: RPCEndpoint, request_data: bytes) -> bytes:
+        config = self.exception_retry_configuration
+        if config is None or not check_if_retry_on_failure(
+            method, config.method_allowlist
+        ):
+            return self._post((method,), request_data)
+        for i in range(config.retries):
+            try:
+                return self._post((method,), request_data)
+            except tuple(config.errors):
+                if i == config.retries - 1:
+                    raise
+                time.sleep(config.backoff_factor * 2**i)
 
     def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
         self.logger.debug(f"make_request: {method}, params : {params}")
         response = HTTPProvider.make_request(self, method, params)
         return response
+
+    def make_batch_request(
+        self, batch_requests: List[Tuple[RPCEndpoint, Any]]
+    ) -> Union[List[RPCResponse], RPCResponse]:
+        request_data = self.encode_batch_rpc_request(batch_requests)
+        raw_response = self._post(
+            tuple(method for method, _ in batch_requests), request_data
+        )
+        return sort_batch_response(self.decode_rpc_response(raw_response))
+
+
+def sort_batch_response(
+    response: Union[List[RPCResponse], RPCResponse]
+) -> Union[List[RPCResponse], RPCResponse]:
+    """
+    Returns the responses of a batch in the order of its requests, the node may answer them in
+    any order. A rejected batch is answered with a single error, returned as is.
+
+    :param response: Decoded batch response.
+    """
+    if not isinstance(response, list):
+        return response
+    return sorted(response, key=lambda r: r.get("id") or 0)
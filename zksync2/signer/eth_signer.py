@@ -1,13 +1,31 @@
+import threading
 from abc import abstractmethod, ABC
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional
 
 import web3
+from eth_account import Account
 from eth_account.datastructures import SignedMessage
 from eth_account.messages import encode_defunct, SignableMessage
 from eth_account.signers.base import BaseAccount
 from eth_typing import ChecksumAddress, HexStr
 from eth_utils import keccak
 
-from zksync2.eip712 import make_domain, EIP712Struct
+from zksync2.eip712 import make_domain, get_domain_separator, EIP712Struct
+from zksync2.transaction.transaction712 import Transaction712
+
+
+# account of a signing worker process, set once by its pool initializer
+_worker_account: Optional[BaseAccount] = None
+
+
+def _init_signing_worker(private_key: bytes):
+    global _worker_account
+    _worker_account = Account.from_key(private_key)
+
+
+def _sign_hashes(hashes: List[bytes]) -> List[SignedMessage]:
+    return [_worker_account.unsafe_sign_hash(msg_hash) for msg_hash in hashes]
 
 
 class EthSignerBase:
@@ -30,6 +48,11 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
         self.default_domain = make_domain(
             name=self._NAME, version=self._VERSION, chainId=self.chain_id
         )
+        self.domain_separator = self.get_default_domain_separator(chain_id)
+        # process pool of sign_many, started on first use and guarded by _pool_lock
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_workers = 0
+        self._pool_lock = threading.Lock()
 
     @staticmethod
     def get_default_domain(chain_id: int):
@@ -39,6 +62,29 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
             chainId=chain_id,
         )
 
+    @staticmethod
+    def get_default_domain_separator(chain_id: int) -> bytes:
+        """Returns the memoized hash of the default ZKsync domain of ``chain_id``."""
+        return get_domain_separator(
+            name=PrivateKeyEthSigner._NAME,
+            version=PrivateKeyEthSigner._VERSION,
+            chainId=chain_id,
+        )
+
+    @staticmethod
+    def get_signable_bytes(typed_data: EIP712Struct, chain_id: int) -> bytes:
+        """
+        Returns the EIP-712 signable bytes of ``typed_data`` in the default ZKsync domain.
+
+        :param typed_data: Struct to sign.
+        :param chain_id: Chain ID of the domain.
+        """
+        return (
+            b"\x19\x01"
+            + PrivateKeyEthSigner.get_default_domain_separator(chain_id)
+            + typed_data.hash_struct()
+        )
+
     @property
     def address(self) -> ChecksumAddress:
         return self.credentials.address
@@ -47,28 +93,100 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
     def domain(self):
         return self.default_domain
 
+    def _signable_bytes(self, typed_data: EIP712Struct, domain=None) -> bytes:
+        if domain is None:
+            # Default domain: only the struct is hashed, the domain separator is memoized.
+            return b"\x19\x01" + self.domain_separator + typed_data.hash_struct()
+        return typed_data.signable_bytes(domain)
+
     def typed_data_to_signed_bytes(
         self, typed_data: EIP712Struct, domain=None
     ) -> SignableMessage:
-        d = domain
-        if d is None:
-            d = self.domain
-        msg = typed_data.signable_bytes(d)
-        return encode_defunct(msg)
+        return encode_defunct(self._signable_bytes(typed_data, domain))
 
     def sign_typed_data(self, typed_data: EIP712Struct, domain=None) -> SignedMessage:
-        singable_message = self.typed_data_to_signed_bytes(typed_data, domain)
-        msg_hash = keccak(singable_message.body)
+        msg_hash = keccak(self._signable_bytes(typed_data, domain))
         return self.credentials.unsafe_sign_hash(msg_hash)
 
     def verify_typed_data(
         self, sig: HexStr, typed_data: EIP712Struct, domain=None
     ) -> bool:
-        singable_message = self.typed_data_to_signed_bytes(typed_data, domain)
-        msg_hash = keccak(singable_message.body)
+        msg_hash = keccak(self._signable_bytes(typed_data, domain))
         address = web3.Account._recover_hash(message_hash=msg_hash, signature=sig)
         return address.lower() == self.address.lower()
 
+    def sign_many(
+        self,
+        transactions: Iterable[Transaction712],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 256,
+    ) -> List[bytes]:
+        """
+        Signs transactions in the default ZKsync domain of their chain and returns them encoded,
+        ready for ``send_raw_transaction``.
+
+        :param transactions: Populated transactions, in the order the results are returned.
+        :param max_workers: Number of processes the ECDSA signing is spread over. By default,
+            transactions are signed in the current process. Requires credentials holding the
+            private key, such as ``LocalAccount``. The processes are kept by the signer for the
+            next calls until ``close``.
+        :param chunk_size: Number of transactions signed by a process at once, unused when
+            signing in the current process.
+        """
+        transactions = list(transactions)
+        hashes = [
+            keccak(self.get_signable_bytes(tx.to_eip712_struct(), tx.chain_id))
+            for tx in transactions
+        ]
+
+        if max_workers is None:
+            signatures = [self.credentials.unsafe_sign_hash(h) for h in hashes]
+        else:
+            private_key = getattr(self.credentials, "key", None)
+            if private_key is None:
+                raise ValueError(
+                    "Signing in a process pool requires credentials holding the private key"
+                )
+            chunks = [
+                hashes[i : i + chunk_size] for i in range(0, len(hashes), chunk_size)
+            ]
+            # held while the pool is used, so it is never replaced under another call
+            with self._pool_lock:
+                executor = self._signing_pool(private_key, max_workers)
+                signatures = [
+                    signature
+                    for chunk in executor.map(_sign_hashes, chunks)
+                    for signature in chunk
+                ]
+
+        return [tx.encode(sig) for tx, sig in zip(transactions, signatures)]
+
+    def _signing_pool(
+        self, private_key: bytes, max_workers: int
+    ) -> ProcessPoolExecutor:
+        # reused by every sign_many call, replaced if the size changes; the private key is
+        # sent once to each worker
+        if self._pool is None or self._pool_workers != max_workers:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+            self._pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_signing_worker,
+                initargs=(private_key,),
+            )
+            self._pool_workers = max_workers
+        return self._pool
+
+    def close(self):
+        """
+        Stops the worker processes started by ``sign_many``.
+        """
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+                self._pool_workers = 0
+
     def sign_message(self, message: bytes) -> SignedMessage:
         msg_hash = keccak(message)
         return self.credentials.unsafe_sign_hash(msg_hash)
@@ -0,0 +1,141 @@
+from typing import List, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def _length_prefix(length: int, offset: int) -> bytes:
+    if length < 56:
+        return bytes((offset + length,))
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, byteorder="big")
+    return bytes((offset + 55 + len(length_bytes),)) + length_bytes
+
+
+def encode_int(value: int) -> bytes:
+    """Returns the RLP payload of an unsigned integer, its minimal big-endian form."""
+    if value < 0:
+        raise ValueError(f"Cannot RLP encode negative integer: {value}")
+    return value.to_bytes((value.bit_length() + 7) // 8, byteorder="big")
+
+
+class RLPWriter:
+    """
+    Collects the RLP encoding of a list as flat chunks, so ``getvalue`` copies every item,
+    including large byte strings, exactly once.
+
+    Example:
+        writer = RLPWriter()
+        writer.write_int(1)
+        writer.start_list()
+        writer.write_bytes(b"dog")
+        writer.end_list()
+        encoded = writer.getvalue()  # rlp.encode([1, [b"dog"]])
+    """
+
+    def __init__(self):
+        self._chunks: List[BytesLike] = []
+        self._open_lists: List[int] = []
+        self._lengths: List[int] = [0]
+
+    def _append(self, chunk: BytesLike):
+        self._chunks.append(chunk)
+        self._lengths[-1] += len(chunk)
+
+    def write_bytes(self, value: BytesLike):
+        if len(value) == 1 and value[0] < 0x80:
+            self._append(value)
+            return
+        self._append(_length_prefix(len(value), 0x80))
+        self._append(value)
+
+    def write_int(self, value: int):
+        self.write_bytes(encode_int(value))
+
+    def start_list(self):
+        self._open_lists.append(len(self._chunks))
+        self._chunks.append(b"")
+        self._lengths.append(0)
+
+    def end_list(self):
+        index = self._open_lists.pop()
+        length = self._lengths.pop()
+        prefix = _length_prefix(length, 0xC0)
+        self._chunks[index] = prefix
+        self._lengths[-1] += length + len(prefix)
+
+    def getvalue(self, prefix: bytes = b"") -> bytes:
+        """
+        Returns the encoded data.
+
+        :param prefix: Bytes put in front of the encoding, such as a transaction type.
+        """
+        if len(self._open_lists) > 0:
+            raise ValueError("RLP list is not closed")
+        return b"".join([prefix, *self._chunks])
+
+
+RLPItem = Union[memoryview, List["RLPItem"]]
+
+
+def _read_length(data: memoryview, offset: int, size: int) -> int:
+    end = offset + size
+    if end > len(data):
+        raise ValueError("RLP data is truncated")
+    if data[offset] == 0:
+        raise ValueError("RLP length has leading zero bytes")
+    length = int.from_bytes(data[offset:end], byteorder="big")
+    if length < 56:
+        raise ValueError("RLP length below 56 must use the short form")
+    return length
+
+
+def read_item(data: memoryview, offset: int = 0) -> Tuple[RLPItem, int]:
+    """
+    Reads the RLP item starting at ``offset`` and returns it with the offset following it.
+
+    Byte strings are returned as ``memoryview`` slices of ``data``, nothing is copied, lists as
+    python lists of items. Non-canonical encodings are rejected with a ``ValueError``.
+
+    :param data: Encoded data.
+    :param offset: Position of the item prefix.
+    """
+    if offset >= len(data):
+        raise ValueError("RLP data is truncated")
+    prefix = data[offset]
+    if prefix < 0x80:
+        return data[offset : offset + 1], offset + 1
+    if prefix < 0xB8:
+        start, length = offset + 1, prefix - 0x80
+    elif prefix < 0xC0:
+        start = offset + 1 + prefix - 0xB7
+        length = _read_length(data, offset + 1, prefix - 0xB7)
+    elif prefix < 0xF8:
+        start, length = offset + 1, prefix - 0xC0
+    else:
+        start = offset + 1 + prefix - 0xF7
+        length = _read_length(data, offset + 1, prefix - 0xF7)
+
+    end = start + length
+    if end > len(data):
+        raise ValueError("RLP data is truncated")
+    if prefix < 0xC0:
+        if length == 1 and data[start] < 0x80:
+            raise ValueError("Single RLP byte below 0x80 must not have a prefix")
+        return data[start:end], end
+
+    items = []
+    position = start
+    while position < end:
+        item, position = read_item(data, position)
+        items.append(item)
+    if position != end:
+        raise ValueError("RLP list length does not match its items")
+    return items, end
+
+
+def decode_int(value: memoryview) -> int:
+    """Returns the unsigned integer of an RLP payload, rejecting leading zero bytes."""
+    if isinstance(value, list):
+        raise ValueError("Expected RLP byte string, got list")
+    if len(value) > 0 and value[0] == 0:
+        raise ValueError("RLP integer has leading zero bytes")
+    return int.from_bytes(value, byteorder="big")
@@ -1,18 +1,80 @@
 from dataclasses import dataclass
-from typing import Union, Optional
-import rlp
+from typing import Iterator, Tuple, Union, Optional
 from eth_account.datastructures import SignedMessage
 from eth_typing import ChecksumAddress, HexStr
-from eth_utils import remove_0x_prefix
-from rlp.sedes import big_endian_int, binary
-from rlp.sedes import List as rlpList
+from eth_utils import remove_0x_prefix, to_checksum_address
+from eth_utils.crypto import keccak
 from web3.types import Nonce
 from zksync2.module.request_types import EIP712Meta, Transaction as ZkTx
 
 from zksync2.eip712 import EIP712Struct, Address, Uint, Bytes, Array
+from zksync2.eip712.types import EIP712Type
+from zksync2.core.types import PaymasterParams
 from zksync2.core.utils import to_bytes, hash_byte_code, encode_address, int_to_bytes
+from zksync2.transaction.rlp_codec import RLPWriter, read_item, decode_int
 
 DynamicBytes = Bytes(0)
+FactoryDepsHashes = Array(Bytes(32))
+
+
+class _TransactionStructBase(EIP712Struct):
+    """
+    Encoding of the EIP-712 ``Transaction`` struct signed for ZKsync transactions.
+
+    The layout is fixed, so the type hash is computed once and ``encode_value`` encodes the
+    members directly instead of walking the class attributes on every call.
+    """
+
+    def __init__(self, **kwargs):
+        # EIP712Struct.__init__ walks the members of the class for every instance and
+        # converts nested struct values, the members are known here and none is a struct
+        EIP712Type.__init__(self, self.type_name, None)
+        self.values = {name: kwargs.get(name) for name in _TRANSACTION_FIELDS}
+
+    @classmethod
+    def type_hash(cls) -> bytes:
+        return _TRANSACTION_TYPE_HASH
+
+    def encode_value(self, value=None) -> bytes:
+        values = self.values
+        encoded = [
+            (values[name] or 0).to_bytes(32, byteorder="big", signed=False)
+            for name in _UINT_FIELDS
+        ]
+        encoded.append(DynamicBytes.encode_value(values["data"]))
+        encoded.append(FactoryDepsHashes.encode_value(values["factoryDeps"]))
+        encoded.append(DynamicBytes.encode_value(values["paymasterInput"]))
+        return b"".join(encoded)
+
+
+# "from" is a keyword, the members are passed as a dict in their EIP-712 order; the struct
+# type name is taken from the class name and must stay "Transaction"
+TransactionStruct = type(
+    "Transaction",
+    (_TransactionStructBase,),
+    {
+        "txType": Uint(256),
+        "from": Uint(256),
+        "to": Uint(256),
+        "gasLimit": Uint(256),
+        "gasPerPubdataByteLimit": Uint(256),
+        "maxFeePerGas": Uint(256),
+        "maxPriorityFeePerGas": Uint(256),
+        "paymaster": Uint(256),
+        "nonce": Uint(256),
+        "value": Uint(256),
+        "data": DynamicBytes,
+        "factoryDeps": FactoryDepsHashes,
+        "paymasterInput": DynamicBytes,
+    },
+)
+
+
+_TRANSACTION_FIELDS = tuple(name for name, _ in TransactionStruct.get_members())
+_UINT_FIELDS = tuple(
+    name for name, typ in TransactionStruct.get_members() if isinstance(typ, Uint)
+)
+_TRANSACTION_TYPE_HASH = keccak(text=TransactionStruct.encode_type())
 
 
 @dataclass
@@ -22,93 +84,168 @@ class Transaction712:
     chain_id: int
     nonce: Nonce
     gas_limit: int
-    to: Union[Address, ChecksumAddress, str]
+    to: Optional[Union[Address, ChecksumAddress, str]]
     value: int
     data: Union[bytes, HexStr]
     maxPriorityFeePerGas: int
     maxFeePerGas: int
     from_: Union[bytes, HexStr]
     meta: EIP712Meta
+    # signature read by decode, used by encode when no other signature is given
+    signature: Optional[bytes] = None
 
     def encode(self, signature: Optional[SignedMessage] = None) -> bytes:
-        factory_deps_data = []
-        factory_deps_elements = None
-        factory_deps = self.meta.factory_deps
-        if factory_deps is not None and len(factory_deps) > 0:
-            factory_deps_data = factory_deps
-            factory_deps_elements = [binary for _ in range(len(factory_deps_data))]
+        custom_signature = self.meta.custom_signature
+        if custom_signature is not None:
+            rlp_signature = custom_signature
+        elif signature is not None:
+            rlp_signature = signature.signature
+        elif self.signature is not None:
+            rlp_signature = self.signature
+        else:
+            raise RuntimeError("Custom signature and signature can't be None both")
 
-        paymaster_params_data = []
-        paymaster_params_elements = None
+        writer = RLPWriter()
+        writer.start_list()
+        writer.write_int(self.nonce)
+        writer.write_int(self.maxPriorityFeePerGas)
+        writer.write_int(self.maxFeePerGas)
+        writer.write_int(self.gas_limit)
+        writer.write_bytes(encode_address(self.to) if self.to else b"")
+        writer.write_int(self.value)
+        writer.write_bytes(to_bytes(self.data))
+        writer.write_int(self.chain_id)
+        writer.write_bytes(b"")
+        writer.write_bytes(b"")
+        writer.write_int(self.chain_id)
+        writer.write_bytes(encode_address(self.from_))
+        writer.write_int(self.meta.gas_per_pub_data)
+
+        writer.start_list()
+        for bytecode in self.meta.factory_deps or []:
+            writer.write_bytes(bytecode)
+        writer.end_list()
+
+        writer.write_bytes(rlp_signature)
+
+        writer.start_list()
         paymaster_params = self.meta.paymaster_params
         if (
             paymaster_params is not None
             and paymaster_params.paymaster is not None
             and paymaster_params.paymaster_input is not None
         ):
-            paymaster_params_data = [
-                bytes.fromhex(remove_0x_prefix(paymaster_params.paymaster)),
-                paymaster_params.paymaster_input,
-            ]
-            paymaster_params_elements = [binary, binary]
-
-        class InternalRepresentation(rlp.Serializable):
-            fields = [
-                ("nonce", big_endian_int),
-                ("maxPriorityFeePerGas", big_endian_int),
-                ("maxFeePerGas", big_endian_int),
-                ("gasLimit", big_endian_int),
-                ("to", binary),
-                ("value", big_endian_int),
-                ("data", binary),
-                ("chain_id", big_endian_int),
-                ("unknown1", binary),
-                ("unknown2", binary),
-                ("chain_id2", big_endian_int),
-                ("from", binary),
-                ("gasPerPubdata", big_endian_int),
-                ("factoryDeps", rlpList(elements=factory_deps_elements, strict=False)),
-                ("signature", binary),
-                (
-                    "paymaster_params",
-                    rlpList(elements=paymaster_params_elements, strict=False),
-                ),
-            ]
+            writer.write_bytes(
+                bytes.fromhex(remove_0x_prefix(paymaster_params.paymaster))
+            )
+            writer.write_bytes(paymaster_params.paymaster_input)
+        writer.end_list()
 
-        custom_signature = self.meta.custom_signature
-        if custom_signature is not None:
-            rlp_signature = custom_signature
-        elif signature is not None:
-            rlp_signature = signature.signature
-        else:
-            raise RuntimeError("Custom signature and signature can't be None both")
+        writer.end_list()
+        return writer.getvalue(int_to_bytes(self.EIP_712_TX_TYPE))
 
-        representation_params = {
-            "nonce": self.nonce,
-            "maxPriorityFeePerGas": self.maxPriorityFeePerGas,
-            "maxFeePerGas": self.maxFeePerGas,
-            "gasLimit": self.gas_limit,
-            "to": encode_address(self.to),
-            "value": self.value,
-            "data": to_bytes(self.data),
-            "chain_id": self.chain_id,
-            "unknown1": b"",
-            "unknown2": b"",
-            "chain_id2": self.chain_id,
-            "from": encode_address(self.from_),
-            "gasPerPubdata": self.meta.gas_per_pub_data,
-            "factoryDeps": factory_deps_data,
-            "signature": rlp_signature,
-            "paymaster_params": paymaster_params_data,
-        }
-        representation = InternalRepresentation(**representation_params)
-        encoded_rlp = rlp.encode(representation, infer_serializer=True, cache=False)
-        return int_to_bytes(self.EIP_712_TX_TYPE) + encoded_rlp
+    @classmethod
+    def decode(
+        cls, raw: Union[bytes, bytearray, memoryview, HexStr], zero_copy: bool = False
+    ) -> "Transaction712":
+        """
+        Parses a raw EIP-712 transaction, the inverse of ``encode``.
 
-    def to_eip712_struct(self) -> EIP712Struct:
-        class Transaction(EIP712Struct):
-            pass
+        The signature is kept in ``signature``, not in ``meta.custom_signature``, so
+        ``encode()`` of the result returns ``raw`` again while ``encode(signed_message)`` uses
+        the new signature. An empty ``to`` is decoded to None.
+
+        :param raw: Encoded transaction, starting with the ``0x71`` type byte.
+        :param zero_copy: Keep ``data``, factory deps and paymaster input as ``memoryview``
+            slices of ``raw`` instead of copying them into ``bytes``.
+        """
+        view = memoryview(to_bytes(raw))
+        tx, end = cls._decode_at(view, 0, zero_copy)
+        if end != len(view):
+            raise ValueError("Unexpected data after EIP-712 transaction")
+        return tx
+
+    @classmethod
+    def iter_decode(
+        cls, raw: Union[bytes, bytearray, memoryview], zero_copy: bool = False
+    ) -> Iterator["Transaction712"]:
+        """
+        Parses raw EIP-712 transactions written one after another, one at a time.
+
+        :param raw: Concatenated encoded transactions.
+        :param zero_copy: Same as in ``decode``.
+        """
+        view = memoryview(raw)
+        offset = 0
+        while offset < len(view):
+            tx, offset = cls._decode_at(view, offset, zero_copy)
+            yield tx
+
+    @classmethod
+    def _decode_at(
+        cls, view: memoryview, offset: int, zero_copy: bool
+    ) -> Tuple["Transaction712", int]:
+        if offset >= len(view):
+            raise ValueError("EIP-712 transaction is empty")
+        if view[offset] != cls.EIP_712_TX_TYPE:
+            raise ValueError(
+                f"Not an EIP-712 transaction, type byte: {hex(view[offset])}"
+            )
+        fields, end = read_item(view, offset + 1)
+        if not isinstance(fields, list) or len(fields) != 16:
+            raise ValueError("EIP-712 transaction must be an RLP list of 16 items")
 
+        copy = (lambda value: value) if zero_copy else bytes
+        (
+            nonce,
+            max_priority_fee_per_gas,
+            max_fee_per_gas,
+            gas_limit,
+            to,
+            value,
+            data,
+            _,
+            _,
+            _,
+            chain_id,
+            from_,
+            gas_per_pub_data,
+            factory_deps,
+            signature,
+            paymaster_params,
+        ) = fields
+        if not isinstance(factory_deps, list) or not isinstance(paymaster_params, list):
+            raise ValueError("Invalid EIP-712 transaction factory deps or paymaster")
+
+        paymaster = None
+        if len(paymaster_params) == 2:
+            paymaster = PaymasterParams(
+                paymaster=to_checksum_address(bytes(paymaster_params[0])),
+                paymaster_input=copy(paymaster_params[1]),
+            )
+        elif len(paymaster_params) != 0:
+            raise ValueError("EIP-712 paymaster params must have 2 items")
+
+        tx = cls(
+            chain_id=decode_int(chain_id),
+            nonce=Nonce(decode_int(nonce)),
+            gas_limit=decode_int(gas_limit),
+            to=to_checksum_address(bytes(to)) if len(to) > 0 else None,
+            value=decode_int(value),
+            data=copy(data),
+            maxPriorityFeePerGas=decode_int(max_priority_fee_per_gas),
+            maxFeePerGas=decode_int(max_fee_per_gas),
+            from_=to_checksum_address(bytes(from_)),
+            meta=EIP712Meta(
+                gas_per_pub_data=decode_int(gas_per_pub_data),
+                factory_deps=[copy(bytecode) for bytecode in factory_deps],
+                paymaster_params=paymaster,
+            ),
+            signature=bytes(signature),
+        )
+        return tx, end
+
+    def to_eip712_struct(self) -> EIP712Struct:
         paymaster: int = 0
         paymaster_params = self.meta.paymaster_params
         if paymaster_params is not None and paymaster_params.paymaster is not None:
@@ -123,20 +260,6 @@ class Transaction712:
                 [hash_byte_code(bytecode) for bytecode in factory_deps]
             )
 
-        setattr(Transaction, "txType", Uint(256))
-        setattr(Transaction, "from", Uint(256))
-        setattr(Transaction, "to", Uint(256))
-        setattr(Transaction, "gasLimit", Uint(256))
-        setattr(Transaction, "gasPerPubdataByteLimit", Uint(256))
-        setattr(Transaction, "maxFeePerGas", Uint(256))
-        setattr(Transaction, "maxPriorityFeePerGas", Uint(256))
-        setattr(Transaction, "paymaster", Uint(256))
-        setattr(Transaction, "nonce", Uint(256))
-        setattr(Transaction, "value", Uint(256))
-        setattr(Transaction, "data", DynamicBytes)
-        setattr(Transaction, "factoryDeps", Array(Bytes(32)))
-        setattr(Transaction, "paymasterInput", DynamicBytes)
-
         paymaster_input = b""
         if (
             paymaster_params is not None
@@ -147,7 +270,7 @@ class Transaction712:
         kwargs = {
             "txType": self.EIP_712_TX_TYPE,
             "from": int(self.from_, 16),
-            "to": int(self.to, 16),
+            "to": int(self.to, 16) if self.to else 0,
             "gasLimit": self.gas_limit,
             "gasPerPubdataByteLimit": self.meta.gas_per_pub_data,
             "maxFeePerGas": self.maxFeePerGas,
@@ -159,7 +282,7 @@ class Transaction712:
             "factoryDeps": factory_deps_hashes,
             "paymasterInput": paymaster_input,
         }
-        return Transaction(**kwargs)
+        return TransactionStruct(**kwargs)
 
     def to_zk_transaction(self):
         kwargs = {